@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+벤치마크 모듈
+SDL_VIDEODRIVER=dummy 환경에서 헤드리스로 실행되는 마이크로/매크로 벤치마크
+
+사용법:
+    python benchmark.py                     # 결과를 benchmark_results.json에 저장
+    python benchmark.py --output out.json   # 저장 경로 지정
+    python benchmark.py --quick             # 반복 횟수를 줄여 빠르게 실행
+    python benchmark.py --scenario s.json   # 매크로 벤치마크에 시나리오 파일 추가
+"""
+
+import os
+
+# pygame 임포트 전에 헤드리스 드라이버 설정
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import sys
+import json
+import shutil
+import random
+import tempfile
+import platform
+import datetime
+import subprocess
+from time import perf_counter
+
+BENCH_SEED = 20240101  # 벤치마크 재현성을 위한 난수 시드
+BENCH_ROUNDS = [1, 50, 200, 500]  # 매크로 시나리오 라운드
+BENCH_OUTPUT = "benchmark_results.json"
+
+# 모듈 임포트 경로는 스크립트 위치 기준 (게임 모듈은 임포트 시 현재 폴더에 DB를 만들므로
+# run_benchmarks에서 임시 작업 디렉터리로 이동한 뒤에 임포트)
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+LAUNCH_DIR = os.getcwd()
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+
+import pygame
+from constants import *
+from profiler import summarize
+
+
+def get_commit() -> str:
+    """현재 git 커밋 해시 (저장소가 아니면 빈 문자열)"""
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=REPO_DIR, capture_output=True, text=True, timeout=5
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def time_batch(op, number, repeat):
+    """op를 number번 호출하는 배치를 repeat번 측정 (호출당 초 단위)"""
+    results = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            op()
+        results.append((perf_counter() - start) / number)
+    return results
+
+
+def time_with_setup(setup, op, number, repeat):
+    """매 호출 전에 setup을 실행하고 op 호출만 측정 (호출당 초 단위)"""
+    results = []
+    for _ in range(repeat):
+        total = 0.0
+        for _ in range(number):
+            state = setup()
+            start = perf_counter()
+            op(state)
+            total += perf_counter() - start
+        results.append(total / number)
+    return results
+
+
+def run_micro_benchmarks(game, number, repeat):
+    """핵심 함수 단위 마이크로 벤치마크"""
+    from game_objects import Ball, Block, Particle
+    from scenario import Scenario
+    random.seed(BENCH_SEED)
+    Scenario.for_round(1, seed=BENCH_SEED).build(game)
+    game.blocks = []
+    game.balls = []
+    results = {}
+
+    # Ball.move: 경기장 중앙에서 이동 (바닥에 닿으면 위치 재설정)
+    ball = Ball(SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, 3.0, -BALL_SPEED, game)
+    def move_ball():
+        ball.move()
+        if not ball.active or ball.y < TOP_UI_HEIGHT + 20:
+            ball.x, ball.y, ball.active = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2, True
+    results['Ball.move'] = time_batch(move_ball, number, repeat)
+
+    # Ball.bounce_block: 충돌하지 않는 경우 (충돌 루프에서 대부분의 호출)
+    far_block = Block(1, BLOCK_START_Y, 10)
+    probe = Ball(SCREEN_WIDTH / 2, SCREEN_HEIGHT - BOTTOM_UI_HEIGHT - 50, 0, -BALL_SPEED, game)
+    results['Ball.bounce_block.miss'] = time_batch(lambda: probe.bounce_block(far_block), number, repeat)
+
+    # Ball.bounce_block: 충돌하여 반사되는 경우
+    hit_block = Block(1, BLOCK_START_Y, 10)
+    def bounce_hit():
+        probe.x = hit_block.x + BLOCK_SIZE / 2
+        probe.y = hit_block.y + BLOCK_SIZE + BALL_RADIUS - 2
+        probe.dy = -BALL_SPEED
+        probe.bounce_block(hit_block)
+    results['Ball.bounce_block.hit'] = time_batch(bounce_hit, number, repeat)
+
+    # Block.hit: 파괴되지 않는 일반 타격
+    tough_block = Block(1, BLOCK_START_Y, 10 ** 9)
+    results['Block.hit'] = time_batch(lambda: tough_block.hit(game), number, repeat)
+
+    # Block.hit: 파괴되어 폭발 파티클을 생성하는 타격
+    def fresh_block():
+        game.particles = []
+        return Block(1, BLOCK_START_Y, 1)
+    results['Block.hit.destroy'] = time_with_setup(fresh_block, lambda block: block.hit(game), number, repeat)
+
+    # Block.draw: 일반 블록과 투명 블록
+    screen = game.screen
+    normal_block = Block(1, BLOCK_START_Y, 123)
+    ghost_block = Block(1, BLOCK_START_Y, 123, BLOCK_TYPE_GHOST)
+    results['Block.draw'] = time_batch(lambda: normal_block.draw(screen), number, repeat)
+    results['Block.draw.ghost'] = time_batch(lambda: ghost_block.draw(screen), number, repeat)
+
+    # add_score: 콤보가 이어지는 같은 색 블록 점수
+    results['Game.add_score'] = time_batch(lambda: game.add_score(10, RED), number, repeat)
+
+    # update_particles: 폭발 파티클 200개 갱신
+    def particle_load():
+        prng = random.Random(BENCH_SEED)
+        game.particles = [
+            Particle(200, 300, prng.uniform(-5, 5), prng.uniform(-5, 5), RED, EXPLOSION_PARTICLE_LIFE, 3)
+            for _ in range(200)
+        ]
+    results['Game.update_particles'] = time_with_setup(
+        particle_load, lambda _: game.update_particles(), max(1, number // 20), repeat
+    )
+
+    return {
+        name: {
+            **summarize(values), 'unit': 'per_call', 'repeat': len(values),
+            'runs_ms': [round(value * 1000, 6) for value in values]
+        }
+        for name, values in results.items()
+    }
+
+
+def get_macro_scenarios(rounds, scenario_paths=()):
+    """매크로 벤치마크 시나리오 목록 (이름, Scenario)"""
+    from scenario import Scenario
+    scenarios = [(f"round_{round_num}", Scenario.for_round(round_num, seed=BENCH_SEED)) for round_num in rounds]
+    for path in scenario_paths:
+        scenario = Scenario.load(path)
+        if scenario is not None:
+            name = os.path.splitext(os.path.basename(path))[0]
+            scenarios.append((f"scenario_{name}", scenario))
+    return scenarios
+
+
+def run_macro_benchmarks(game, scenarios, frames, repeat):
+    """전체 Game.update / Game.draw 프레임 벤치마크"""
+    results = {}
+    for name, scenario in scenarios:
+        update_times = []
+        draw_times = []
+        update_runs = []  # 반복 실행별 평균 (신뢰구간 계산용)
+        draw_runs = []
+        ball_counts = []
+        block_counts = []
+        for rep in range(repeat):
+            random.seed(BENCH_SEED + rep)
+            scenario.seed = BENCH_SEED + rep
+            scenario.build(game)
+            ball_counts.append(len(game.balls))
+            block_counts.append(len(game.blocks))
+            run_update = 0.0
+            run_draw = 0.0
+            for _ in range(frames):
+                start = perf_counter()
+                game.update()
+                mid = perf_counter()
+                game.draw()
+                end = perf_counter()
+                update_times.append(mid - start)
+                draw_times.append(end - mid)
+                run_update += mid - start
+                run_draw += end - mid
+            update_runs.append(round(run_update / frames * 1000, 6))
+            draw_runs.append(round(run_draw / frames * 1000, 6))
+
+        results[name] = {
+            'round': scenario.round_num,
+            'balls': max(ball_counts),
+            'blocks': max(block_counts),
+            'frames': len(update_times),
+            'update': summarize(update_times),
+            'draw': summarize(draw_times),
+            'update_ticks_per_second': round(len(update_times) / sum(update_times), 1) if sum(update_times) else 0.0,
+            'update_runs_ms': update_runs,
+            'draw_runs_ms': draw_runs
+        }
+        print(f"  {name}: update p50 {results[name]['update']['p50_ms']}ms, "
+              f"draw p50 {results[name]['draw']['p50_ms']}ms")
+    return results
+
+
+def run_benchmarks(quick=False, scenario_paths=(), repeat=None):
+    """전체 벤치마크 실행 후 결과 딕셔너리 반환"""
+    number = 200 if quick else 2000
+    if repeat is None:
+        repeat = 3 if quick else 7
+    frames = 20 if quick else 60
+
+    # 게임 상태 파일(stats.json, achievements.json, DB, 리플레이)이 저장소를 오염시키지 않도록
+    # 임시 작업 디렉터리에서 실행하고 끝나면 삭제
+    launch_dir = os.getcwd()
+    work_dir = tempfile.mkdtemp(prefix="spinball_bench_")
+    os.chdir(work_dir)
+    try:
+        from game_objects import Game
+        from database import db_manager
+        game = Game()
+        print("마이크로 벤치마크 실행 중...")
+        micro = run_micro_benchmarks(game, number, repeat)
+        print("매크로 벤치마크 실행 중...")
+        macro = run_macro_benchmarks(game, get_macro_scenarios(BENCH_ROUNDS, scenario_paths), frames, repeat)
+        pygame.quit()
+        game.replay_manager.close()
+        db_manager.shutdown()
+    finally:
+        os.chdir(launch_dir)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'meta': {
+            'timestamp': datetime.datetime.now().isoformat(),
+            'commit': get_commit(),
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'seed': BENCH_SEED,
+            'quick': quick,
+            'repeat': repeat
+        },
+        'micro': micro,
+        'macro': macro
+    }
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="SpinBall 헤드리스 벤치마크")
+    parser.add_argument('--output', default=BENCH_OUTPUT, help="결과 JSON 저장 경로")
+    parser.add_argument('--quick', action='store_true', help="반복 횟수를 줄여 빠르게 실행")
+    parser.add_argument('--scenario', action='append', default=[], help="추가 매크로 시나리오 파일")
+    args = parser.parse_args()
+
+    scenario_paths = [os.path.join(LAUNCH_DIR, path) for path in args.scenario]
+    results = run_benchmarks(quick=args.quick, scenario_paths=scenario_paths)
+    output = os.path.join(LAUNCH_DIR, args.output)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"벤치마크 결과 저장 완료: {output}")
+
+
+if __name__ == "__main__":
+    main()
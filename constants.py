@@ -3,6 +3,14 @@ SCREEN_WIDTH = 400
 SCREEN_HEIGHT = 700
 FPS = 60
 
+# 시뮬레이션 시간/난수 설정
+SIM_STEP_MS = 1000 / FPS  # Game.update 1회당 진행하는 게임 시간 (밀리세컨드)
+VISUAL_RNG_SALT = 0x5EED5EED  # 시각 효과 난수 스트림 시드 분리용 값
+
+# 대기 화면 프레임 제한 (타이틀/설정/랭킹/통계/모드 선택/업적/일시정지)
+IDLE_FPS = 12  # 애니메이션이 있는 대기 화면의 다시 그리기 빈도
+IDLE_STATIC_REDRAW_INTERVAL = 1000  # 정적 대기 화면의 최대 다시 그리기 간격 (밀리세컨드)
+
 # 모던 다크 테마 색상 팔레트
 WHITE = (255, 255, 255)
 BLACK = (15, 15, 23)  # 진한 다크 배경
@@ -219,6 +227,73 @@ THEME_BACKGROUNDS = {
     THEME_SUMMER: [(135, 206, 235), (255, 215, 0), (0, 191, 255)]
 }
 
+# 테마별 색상 팔레트 (ThemeManager가 시작 시 한 번만 컴파일)
+THEME_PALETTES = {
+    THEME_DARK: {
+        'background': BLACK,
+        'surface': DARK_SURFACE,
+        'darker_surface': DARKER_SURFACE,
+        'text': WHITE,
+        'text_secondary': TEXT_SECONDARY,
+        'accent': NEON_CYAN,
+        'ball_color': NEON_CYAN,
+        'ball_trail': NEON_CYAN
+    },
+    THEME_LIGHT: {
+        'background': LIGHT_BLACK,
+        'surface': LIGHT_SURFACE,
+        'darker_surface': LIGHT_DARKER_SURFACE,
+        'text': LIGHT_TEXT,
+        'text_secondary': LIGHT_TEXT_SECONDARY,
+        'accent': (0, 123, 255),
+        'ball_color': (0, 123, 255),
+        'ball_trail': (0, 123, 255)
+    },
+    THEME_CHRISTMAS: {
+        'background': CHRISTMAS_DARK,
+        'surface': (40, 40, 50),
+        'darker_surface': (30, 30, 40),
+        'text': CHRISTMAS_WHITE,
+        'text_secondary': (200, 200, 200),
+        'accent': CHRISTMAS_RED,
+        'ball_color': CHRISTMAS_GOLD,
+        'ball_trail': CHRISTMAS_GOLD
+    },
+    THEME_HALLOWEEN: {
+        'background': HALLOWEEN_BLACK,
+        'surface': (40, 20, 40),
+        'darker_surface': (30, 15, 30),
+        'text': HALLOWEEN_ORANGE,
+        'text_secondary': HALLOWEEN_GRAY,
+        'accent': HALLOWEEN_PURPLE,
+        'ball_color': HALLOWEEN_ORANGE,
+        'ball_trail': HALLOWEEN_ORANGE
+    },
+    THEME_SPRING: {
+        'background': SPRING_WHITE,
+        'surface': (240, 248, 240),
+        'darker_surface': (230, 240, 230),
+        'text': (60, 120, 60),
+        'text_secondary': (100, 150, 100),
+        'accent': SPRING_PINK,
+        'ball_color': SPRING_GREEN,
+        'ball_trail': SPRING_GREEN
+    },
+    THEME_SUMMER: {
+        'background': (240, 248, 255),
+        'surface': (230, 240, 250),
+        'darker_surface': (220, 230, 240),
+        'text': (30, 60, 120),
+        'text_secondary': (70, 100, 150),
+        'accent': SUMMER_BLUE,
+        'ball_color': SUMMER_CYAN,
+        'ball_trail': SUMMER_CYAN
+    }
+}
+
+# 배경 장식 애니메이션이 있는 테마
+ANIMATED_THEMES = (THEME_CHRISTMAS, THEME_HALLOWEEN, THEME_SPRING, THEME_SUMMER)
+
 # 라운드별 테마 변화 설정
 ROUND_THEME_CHANGES = {
     1: THEME_DARK,
@@ -229,8 +304,33 @@ ROUND_THEME_CHANGES = {
     25: THEME_LIGHT
 }
 
+# 데이터베이스 설정
+DB_CACHE_SIZE_KB = 8192  # SQLite 페이지 캐시 크기 (KB)
+DB_BUSY_TIMEOUT_MS = 5000  # 다른 연결이 쓰는 중일 때 대기 시간
+DB_STATEMENT_CACHE = 128  # 연결별 준비된 문장 캐시 크기
+DB_WRITE_BATCH = 64  # 점수 쓰기 큐에서 한 트랜잭션으로 기록하는 최대 행 수
+DB_BULK_BATCH = 10000  # 대량 내보내기/가져오기에서 한 번에 읽고 쓰는 행 수
+LEADERBOARD_CACHE_SIZE = 50  # 메모리에 캐시하는 상위 점수 수
+LEADERBOARD_PAGE_SIZE = 24  # 랭킹 화면이 한 번에 읽는 행 수 (키셋 페이지)
+LEADERBOARD_VISIBLE_ROWS = 8  # 랭킹 화면에 한 번에 보이는 행 수
+SCORE_HISTOGRAM_BUCKET = 50  # 백분위 근사용 점수 분포의 구간 너비
+LEADERBOARD_PERIOD_SIZE = 50  # 오늘/이번 주/이번 달 랭킹에 유지하는 상위 점수 수
+LEADERBOARD_PERIOD_ALL = 'all'
+LEADERBOARD_PERIODS = (LEADERBOARD_PERIOD_ALL, 'day', 'week', 'month')  # 랭킹 화면 탭 순서
+LEADERBOARD_PERIOD_LABELS = {'all': "All Time", 'day': "Today", 'week': "Week", 'month': "Month"}
+
 # 리플레이 시스템 설정
-MAX_REPLAY_ACTIONS = 10000  # 최대 리플레이 액션 수
+REPLAY_FORMAT_VERSION = 2  # 입력 기록 리플레이 형식 (시드 + 발사 목록)
+REPLAY_DIR = "replays"  # 리플레이 저장 폴더
+REPLAY_MAX_TICKS = 10000000  # 헤드리스 재시뮬레이션 최대 틱 수 (무한 루프 방지)
+REPLAY_EXTENSION = ".sbr"  # 바이너리 리플레이 확장자
+REPLAY_BLOCK_RECORDS = 64  # 바이너리 리플레이 블록당 발사 기록 수
+REPLAY_STREAM_BLOCK_RECORDS = 16  # 게임 중 기록 시 블록당 발사 기록 수 (채워질 때마다 디스크로 내보냄)
+REPLAY_COMPRESS = True  # 바이너리 리플레이 블록 zlib 압축
+REPLAY_KEYFRAME_INTERVAL = 10  # 키프레임(발사 직전 게임 상태) 기록 간격 (라운드)
+REPLAY_SPEEDS = (1, 4, 16, 0)  # 재생 배속 (0: 프레임 예산 안에서 최대 배속)
+REPLAY_MAX_SPEED_BUDGET = 0.8  # 최대 배속 재생 시 update에 쓰는 프레임 시간 비율
+REPLAY_CATALOG_LIMIT = 20  # 리플레이 카탈로그 조회 기본 개수
 REPLAY_SAVE_THRESHOLD = 1000  # 리플레이 저장 최소 점수
 
 # 통계 시스템 설정
@@ -241,6 +341,29 @@ ACHIEVEMENT_NOTIFICATION_DURATION = 3000  # 업적 알림 표시 시간 (밀리
 PERFECT_ANGLE_TOLERANCE = 2  # 완벽한 각도 허용 오차 (도)
 PERFECT_ANGLES = [45, 90, 135]  # 완벽한 각도들
 
+# 프레임 프로파일러 설정
+PROFILER_WINDOW = 600  # 백분위수 계산에 사용하는 최근 프레임 수 (60FPS 기준 10초)
+PROFILER_OUTPUT = "profile_report.json"  # 프로파일 보고서 저장 경로
+
+# 메모리 추적 설정 (tracemalloc 진단 모드)
+MEMTRACK_WINDOW = 600  # 통계 계산에 사용하는 최근 프레임 수
+MEMTRACK_SNAPSHOT_INTERVAL = 60  # 줄 단위 할당 위치 스냅샷 간격 (프레임)
+MEMTRACK_TOP_SITES = 20  # 보고서에 포함할 상위 할당 위치 수
+MEMTRACK_OUTPUT = "memory_report.json"  # 메모리 보고서 저장 경로
+
+# 성능 HUD 설정 (F3)
+HUD_SAMPLES = 120  # 프레임 시간 그래프에 표시할 프레임 수
+HUD_REFRESH_INTERVAL = 250  # 텍스트 갱신 간격 (밀리세컨드)
+HUD_MARGIN = 8
+HUD_WIDTH = SCREEN_WIDTH - HUD_MARGIN * 2
+HUD_HEIGHT = 140
+IO_STATS_WINDOW = 1.0  # DB/파일 쓰기 횟수 집계 구간 (초)
+TEXT_CACHE_SIZE = 512  # 텍스트 서피스 캐시 최대 항목 수
+
+# 트레이스 내보내기 설정 (Chrome/Perfetto trace-event JSON)
+TRACE_OUTPUT = "trace.json"  # 트레이스 파일 저장 경로
+TRACE_BUFFER_EVENTS = 4096  # 파일에 쓰기 전 메모리에 모아 두는 최대 이벤트 수
+
 # 상점 아이템 목록
 SHOP_ITEMS = [
     {"name": "파워볼", "price": 100, "desc": "벽돌을 2배로 깸", "key": 1},
@@ -2,24 +2,106 @@
 """
 데이터베이스 모듈
 SQLite를 사용한 점수 랭킹 시스템
+
+연결은 스레드마다 하나씩 만들어 계속 재사용함 (WAL 저널, synchronous=NORMAL, 캐시 크기 설정).
+같은 연결에서 같은 SQL 문을 다시 실행하면 sqlite3 모듈의 문장 캐시에서 준비된 문장을 재사용하므로
+호출마다 파일을 열고 SQL을 다시 파싱하지 않음.
+상위 점수는 LEADERBOARD_CACHE_SIZE개까지 메모리에 캐시하고 점수 저장 시 갱신하므로
+랭킹 화면이 매 프레임 조회해도 DB에 접근하지 않음.
+플레이어 이름은 players 테이블에서 정수 id로 관리하며(scores.player_id), 플레이어별 최고 점수/라운드,
+게임 수, 마지막 플레이 시각도 트리거로 함께 갱신하므로 플레이어 조회는 인덱스 읽기임.
+통계(게임 수, 점수 합계, 최고 점수/라운드, 플레이어 수)는 score_summary 한 행에 모아 두고
+scores에 행이 추가될 때마다 트리거로 갱신하므로 통계 조회는 테이블 크기와 관계없이 한 행 읽기임.
+전체 랭킹은 (score, round_reached, play_date, id) 커버링 인덱스를 키셋 방식으로 이어 읽으므로
+OFFSET 없이 깊은 페이지도 첫 페이지와 같은 비용으로 조회함 (LeaderboardPager가 다음 페이지를 미리 읽음).
+점수 분포는 score_histogram(SCORE_HISTOGRAM_BUCKET 단위 구간별 게임 수)에 트리거로 누적하며,
+rank.py의 RankService가 이를 메모리에 올려 백분위를 근사함.
+오늘/이번 주/이번 달 랭킹은 period_scores에 기간별 상위 LEADERBOARD_PERIOD_SIZE개만 트리거로 유지하고
+기간이 바뀌면 지난 기간 행을 정리하므로, 기간 랭킹 조회는 scores를 정렬하지 않고 인덱스만 읽음.
+여러 기기의 점수를 합칠 때는 export_scores/import_scores로 CSV/JSONL을 스트리밍하며, 가져오기는
+한 트랜잭션 안에서 scores의 트리거와 인덱스를 잠시 내리고 DB_BULK_BATCH 행씩 넣은 뒤 인덱스를 한 번에
+다시 만들고, (플레이어, 점수, 날짜)가 이미 있던 행을 지운 다음 집계를 한 번에 반영함.
+검증 결과(verified/rejected)는 그대로 옮기지만 리플레이 파일은 옮기지 않으므로, 원래 기기에서 검증 대기였던
+점수는 이 기기에서 검증할 수 없어 검증 상태 없이 가져옴.
+게임의 점수 저장은 submit_score로 쓰기 큐에 넣고 즉시 반환하며, 백그라운드 스레드가 쌓인 점수를
+한 트랜잭션에서 executemany로 기록한 뒤 Future로 결과를 알림.
 """
 
 import sqlite3
 import os
+import csv
+import json
+import itertools
 import datetime
+import queue
+import atexit
+import time
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Tuple, Optional
 
+from constants import (DB_CACHE_SIZE_KB, DB_BUSY_TIMEOUT_MS, DB_STATEMENT_CACHE, DB_WRITE_BATCH,
+                       LEADERBOARD_CACHE_SIZE, LEADERBOARD_PAGE_SIZE, SCORE_HISTOGRAM_BUCKET,
+                       LEADERBOARD_PERIOD_SIZE, LEADERBOARD_PERIOD_ALL, DB_BULK_BATCH)
+from profiler import io_stats
+from tracer import traced
+
+# 내보내기/가져오기 파일의 점수 컬럼 (play_date는 DB에 저장된 UTC 시각 그대로)
+EXPORT_COLUMNS = ('player_name', 'score', 'round_reached', 'balls_count', 'play_date', 'verification')
+
+# 가져올 때 그대로 옮기는 검증 결과 (그 밖의 값은 검증 상태 없음)
+IMPORT_VERIFICATIONS = ('verified', 'rejected')
+
+# 기간 랭킹 종류별 기간 키 SQL 식 ({}에 시각, 현지 시간 기준)
+# 주는 그 주 월요일 날짜로 구분 (연도가 바뀌는 주도 키가 하나)
+PERIOD_KEY_SQL = {
+    'day': "strftime('%Y-%m-%d', {}, 'localtime')",
+    'week': "date({}, 'localtime', 'weekday 0', '-6 days')",
+    'month': "strftime('%Y-%m', {}, 'localtime')"
+}
+
 
 class DatabaseManager:
     def __init__(self, db_path: str = "spinball_scores.db"):
         """데이터베이스 매니저 초기화"""
         self.db_path = db_path
+        self.local = threading.local()  # 스레드별 연결
+        self.write_queue = queue.Queue()  # (점수 행, Future) 쓰기 대기열
+        self.write_thread = None
+        self.leaderboard = None  # 상위 점수 캐시 (처음 조회할 때 채움)
+        self.leaderboard_lock = threading.Lock()
+        self.score_listeners = []  # 점수 저장 후 호출할 함수 (저장한 행 + 점수 id 목록, 전체 삭제/대량 가져오기 시 None)
         self.init_database()
     
+    def get_connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 반환 (없거나 fork된 자식 프로세스면 새로 연결)"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or self.local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=DB_BUSY_TIMEOUT_MS / 1000,
+                                   cached_statements=DB_STATEMENT_CACHE)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(f'PRAGMA cache_size=-{DB_CACHE_SIZE_KB}')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            self.local.conn = conn
+            self.local.pid = os.getpid()
+        return conn
+    
+    def close(self):
+        """현재 스레드의 연결 닫기"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None and self.local.pid == os.getpid():
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"데이터베이스 연결 종료 오류: {e}")
+        self.local.conn = None
+    
+    @traced('db')
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
                 # 점수 테이블 생성
@@ -45,41 +127,441 @@ class DatabaseManager:
                     ON scores(play_date DESC)
                 ''')
                 
+                # 랭킹 페이지 조회용 커버링 인덱스 (정렬 키 + 표시 컬럼)
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_leaderboard 
+                    ON scores(score DESC, round_reached DESC, play_date DESC, id DESC, player_name, balls_count)
+                ''')
+                
+                # 점수 검증 컬럼 추가 (이전 버전 DB 호환)
+                # verification: NULL(리플레이 없음), pending, verified, rejected
+                cursor.execute('PRAGMA table_info(scores)')
+                columns = {row[1] for row in cursor.fetchall()}
+                if 'replay_path' not in columns:
+                    cursor.execute('ALTER TABLE scores ADD COLUMN replay_path TEXT')
+                if 'verification' not in columns:
+                    cursor.execute('ALTER TABLE scores ADD COLUMN verification TEXT')
+                
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_verification 
+                    ON scores(verification)
+                ''')
+                
+                self.init_players(cursor)
+                self.init_summary(cursor)
+                self.init_histogram(cursor)
+                self.init_period_scores(cursor)
+                
+                # 리플레이 카탈로그 테이블 (파일을 열지 않고 리플레이 목록 조회)
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS replays (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        path TEXT NOT NULL UNIQUE,
+                        player_name TEXT,
+                        mode INTEGER NOT NULL,
+                        score INTEGER NOT NULL,
+                        round_reached INTEGER NOT NULL,
+                        shot_count INTEGER NOT NULL,
+                        duration_ms INTEGER NOT NULL,
+                        seed INTEGER NOT NULL,
+                        file_size INTEGER NOT NULL,
+                        index_offset INTEGER NOT NULL,
+                        created TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                ''')
+                
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_replay_mode_score 
+                    ON replays(mode, score DESC)
+                ''')
+                
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_replay_score 
+                    ON replays(score DESC)
+                ''')
+                
                 conn.commit()
                 print("데이터베이스가 성공적으로 초기화되었습니다.")
                 
         except sqlite3.Error as e:
             print(f"데이터베이스 초기화 오류: {e}")
     
-    def save_score(self, player_name: str, score: int, round_reached: int, balls_count: int) -> bool:
-        """점수 저장"""
+    def init_players(self, cursor: sqlite3.Cursor):
+        """플레이어 테이블, scores.player_id, 갱신 트리거 생성 (처음 만들 때 기존 점수로 채움)"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'players'")
+        created = cursor.fetchone() is None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS players (
+                id INTEGER PRIMARY KEY,
+                name TEXT NOT NULL UNIQUE,
+                best_score INTEGER NOT NULL DEFAULT 0,
+                best_round INTEGER NOT NULL DEFAULT 0,
+                best_score_id INTEGER,
+                games_played INTEGER NOT NULL DEFAULT 0,
+                last_seen TIMESTAMP
+            )
+        ''')
+        
+        cursor.execute('PRAGMA table_info(scores)')
+        if 'player_id' not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute('ALTER TABLE scores ADD COLUMN player_id INTEGER REFERENCES players(id)')
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_player_score 
+            ON scores(player_id, score DESC, round_reached DESC, play_date DESC)
+        ''')
+        
+        # 이전 버전의 플레이어 이름 집계 테이블 정리 (players로 대체)
+        cursor.execute('DROP TRIGGER IF EXISTS trg_score_players_summary')
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'score_players'")
+        if cursor.fetchone() is not None:
+            cursor.execute('DROP TRIGGER IF EXISTS trg_scores_summary')
+            cursor.execute('DROP TABLE score_players')
+        
+        if created:
+            cursor.execute('''
+                INSERT INTO players (name, games_played, last_seen)
+                SELECT player_name, COUNT(*), MAX(play_date) FROM scores GROUP BY player_name
+            ''')
+            cursor.execute('''
+                UPDATE scores SET player_id = (SELECT id FROM players WHERE name = scores.player_name)
+            ''')
+            self.update_player_bests(cursor)
+        
+        # 같은 점수/라운드면 최근 기록이 최고 기록
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_scores_players AFTER INSERT ON scores
+            BEGIN
+                INSERT OR IGNORE INTO players (name) VALUES (NEW.player_name);
+                UPDATE players
+                SET games_played = games_played + 1,
+                    last_seen = MAX(IFNULL(last_seen, NEW.play_date), NEW.play_date),
+                    best_score_id = CASE WHEN best_score_id IS NULL OR NEW.score > best_score
+                                              OR (NEW.score = best_score AND NEW.round_reached >= best_round)
+                                         THEN NEW.id ELSE best_score_id END,
+                    best_round = CASE WHEN best_score_id IS NULL OR NEW.score > best_score
+                                           OR (NEW.score = best_score AND NEW.round_reached >= best_round)
+                                      THEN NEW.round_reached ELSE best_round END,
+                    best_score = CASE WHEN best_score_id IS NULL OR NEW.score > best_score
+                                           OR (NEW.score = best_score AND NEW.round_reached >= best_round)
+                                      THEN NEW.score ELSE best_score END
+                WHERE name = NEW.player_name;
+            END
+        ''')
+    
+    def update_player_bests(self, cursor: sqlite3.Cursor, condition: str = '1'):
+        """플레이어 최고 기록 다시 계산 (condition: 대상 players 행 조건)"""
+        # 플레이어별 최고 기록은 (player_id, score) 인덱스의 첫 행
+        cursor.execute(f'''
+            UPDATE players SET best_score_id = (
+                SELECT id FROM scores WHERE player_id = players.id
+                ORDER BY score DESC, round_reached DESC, play_date DESC
+                LIMIT 1
+            )
+            WHERE {condition}
+        ''')
+        cursor.execute(f'''
+            UPDATE players
+            SET best_score = (SELECT score FROM scores WHERE id = players.best_score_id),
+                best_round = (SELECT round_reached FROM scores WHERE id = players.best_score_id)
+            WHERE {condition}
+        ''')
+    
+    def init_summary(self, cursor: sqlite3.Cursor):
+        """통계 요약 테이블과 갱신 트리거 생성 (처음 만들 때 기존 점수로 채움)"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS score_summary (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                total_games INTEGER NOT NULL,
+                score_sum INTEGER NOT NULL,
+                highest_score INTEGER NOT NULL,
+                highest_round INTEGER NOT NULL,
+                unique_players INTEGER NOT NULL
+            )
+        ''')
+        
+        cursor.execute('SELECT 1 FROM score_summary WHERE id = 1')
+        if cursor.fetchone() is None:
+            cursor.execute('''
+                INSERT INTO score_summary (id, total_games, score_sum, highest_score, highest_round, unique_players)
+                SELECT 1, COUNT(*), IFNULL(SUM(score), 0), IFNULL(MAX(score), 0), IFNULL(MAX(round_reached), 0),
+                       (SELECT COUNT(*) FROM players)
+                FROM scores
+            ''')
+        
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_scores_summary AFTER INSERT ON scores
+            BEGIN
+                UPDATE score_summary
+                SET total_games = total_games + 1,
+                    score_sum = score_sum + NEW.score,
+                    highest_score = MAX(highest_score, NEW.score),
+                    highest_round = MAX(highest_round, NEW.round_reached)
+                WHERE id = 1;
+            END
+        ''')
+        
+        # 새 플레이어가 생기면 플레이어 수 증가
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS trg_players_summary AFTER INSERT ON players
+            BEGIN
+                UPDATE score_summary SET unique_players = unique_players + 1 WHERE id = 1;
+            END
+        ''')
+    
+    def init_histogram(self, cursor: sqlite3.Cursor):
+        """점수 구간별 게임 수 테이블과 갱신 트리거 생성 (처음 만들 때 기존 점수로 채움)"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'score_histogram'")
+        created = cursor.fetchone() is None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS score_histogram (
+                bucket INTEGER PRIMARY KEY,
+                games INTEGER NOT NULL
+            )
+        ''')
+        
+        if created:
+            cursor.execute('''
+                INSERT INTO score_histogram (bucket, games)
+                SELECT score / ?, COUNT(*) FROM scores GROUP BY score / ?
+            ''', (SCORE_HISTOGRAM_BUCKET, SCORE_HISTOGRAM_BUCKET))
+        
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_scores_histogram AFTER INSERT ON scores
+            BEGIN
+                INSERT INTO score_histogram (bucket, games) VALUES (NEW.score / {SCORE_HISTOGRAM_BUCKET}, 1)
+                ON CONFLICT (bucket) DO UPDATE SET games = games + 1;
+            END
+        ''')
+    
+    def init_period_scores(self, cursor: sqlite3.Cursor):
+        """기간별 상위 점수 테이블과 갱신 트리거 생성 (처음 만들 때 현재 기간 점수로 채움)"""
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'period_scores'")
+        created = cursor.fetchone() is None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS period_scores (
+                period TEXT NOT NULL,
+                period_key TEXT NOT NULL,
+                score_id INTEGER NOT NULL,
+                player_name TEXT NOT NULL,
+                score INTEGER NOT NULL,
+                round_reached INTEGER NOT NULL,
+                balls_count INTEGER NOT NULL,
+                play_date TIMESTAMP NOT NULL,
+                PRIMARY KEY (period, period_key, score_id)
+            ) WITHOUT ROWID
+        ''')
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_period_rank 
+            ON period_scores(period, period_key, score DESC, round_reached DESC, play_date DESC, score_id DESC)
+        ''')
+        
+        for period, key_sql in PERIOD_KEY_SQL.items():
+            current_key = key_sql.format("'now'")
+            
+            # 기간 키 식이 바뀌었으면 (이전 버전의 '%Y-%W' 주 키 등) 트리거와 행을 다시 만듦
+            cursor.execute("SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = ?",
+                           (f'trg_scores_period_{period}',))
+            row = cursor.fetchone()
+            stale = row is not None and current_key not in row[0]
+            if stale:
+                cursor.execute(f'DROP TRIGGER trg_scores_period_{period}')
+                cursor.execute('DELETE FROM period_scores WHERE period = ?', (period,))
+            
+            if created or stale:
+                # 한 달보다 오래된 점수는 현재 기간일 수 없으므로 날짜 인덱스로 먼저 거름
+                cursor.execute(f'''
+                    INSERT INTO period_scores
+                    SELECT ?, {current_key}, id, player_name, score, round_reached, balls_count, play_date
+                    FROM scores
+                    WHERE play_date >= datetime('now', '-32 days')
+                      AND {key_sql.format('play_date')} = {current_key}
+                    ORDER BY score DESC, round_reached DESC, play_date DESC, id DESC
+                    LIMIT ?
+                ''', (period, LEADERBOARD_PERIOD_SIZE))
+            
+            # 현재 기간 점수만 넣고, 지난 기간 행과 상위권 밖으로 밀려난 행 삭제
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_scores_period_{period} AFTER INSERT ON scores
+                WHEN {key_sql.format('NEW.play_date')} = {current_key}
+                BEGIN
+                    INSERT INTO period_scores
+                    VALUES ('{period}', {current_key}, NEW.id, NEW.player_name, NEW.score,
+                            NEW.round_reached, NEW.balls_count, NEW.play_date);
+                    DELETE FROM period_scores WHERE period = '{period}' AND period_key < {current_key};
+                    DELETE FROM period_scores
+                    WHERE period = '{period}' AND period_key = {current_key} AND score_id IN (
+                        SELECT score_id FROM period_scores
+                        WHERE period = '{period}' AND period_key = {current_key}
+                        ORDER BY score DESC, round_reached DESC, play_date DESC, score_id DESC
+                        LIMIT -1 OFFSET {LEADERBOARD_PERIOD_SIZE}
+                    );
+                END
+            ''')
+            
+            # 마지막 점수 이후 기간이 바뀌었으면 지난 기간 행 정리
+            cursor.execute(f'''
+                DELETE FROM period_scores WHERE period = ? AND period_key < {current_key}
+            ''', (period,))
+    
+    def save_score(self, player_name: str, score: int, round_reached: int, balls_count: int,
+                   replay_path: Optional[str] = None) -> bool:
+        """점수 저장 (리플레이가 있으면 검증 대기 상태로 저장)"""
+        return self.write_scores([(player_name, score, round_reached, balls_count, replay_path,
+                                   'pending' if replay_path else None)])
+    
+    @traced('db')
+    def write_scores(self, rows: List[Tuple]) -> bool:
+        """점수 행 목록을 한 트랜잭션으로 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    INSERT INTO scores (player_name, score, round_reached, balls_count)
-                    VALUES (?, ?, ?, ?)
-                ''', (player_name, score, round_reached, balls_count))
+                # 새 이름이면 플레이어 id를 먼저 만들고 점수 행에 player_id로 기록
+                cursor.executemany('INSERT OR IGNORE INTO players (name) VALUES (?)',
+                                   [(row[0],) for row in rows])
+                last_id = cursor.execute('SELECT IFNULL(MAX(id), 0) FROM scores').fetchone()[0]
+                cursor.executemany('''
+                    INSERT INTO scores (player_name, score, round_reached, balls_count, replay_path, verification, player_id)
+                    VALUES (?1, ?2, ?3, ?4, ?5, ?6, (SELECT id FROM players WHERE name = ?1))
+                ''', rows)
+                # 캐시에는 조회 결과와 같도록 저장된 play_date(UTC)를 현지 시간으로 바꿔 넣음
+                cursor.execute("SELECT id, datetime(play_date, 'localtime') FROM scores WHERE id > ? ORDER BY id",
+                               (last_id,))
+                saved = cursor.fetchall()
+                dates = [formatted_date for _, formatted_date in saved]
                 
                 conn.commit()
-                print(f"점수 저장 완료: {player_name} - {score}점")
+                io_stats.record('db')
+                for row in rows:
+                    print(f"점수 저장 완료: {row[0]} - {row[1]}점")
+                self.update_leaderboard(rows, dates)
+                self.notify_score_listeners([row + (score_id,) for row, (score_id, _) in zip(rows, saved)])
                 return True
                 
         except sqlite3.Error as e:
             print(f"점수 저장 오류: {e}")
             return False
     
-    def get_top_scores(self, limit: int = 10) -> List[Tuple[str, int, int, int, str]]:
-        """상위 점수 조회"""
+    def notify_score_listeners(self, rows: Optional[List[Tuple]]):
+        """점수 저장 알림 (한 리스너의 오류가 저장 결과나 다른 리스너에 영향을 주지 않도록 각각 처리)"""
+        for listener in self.score_listeners:
+            try:
+                listener(rows)
+            except Exception as e:
+                print(f"점수 저장 알림 오류: {e}")
+    
+    def submit_score(self, player_name: str, score: int, round_reached: int, balls_count: int,
+                     replay_path: Optional[str] = None) -> Future:
+        """점수를 쓰기 큐에 넣고 즉시 반환 (Future 결과: 저장 성공 여부)"""
+        if self.write_thread is None or not self.write_thread.is_alive():
+            if self.write_thread is None:
+                atexit.register(self.stop_write_queue)
+            self.write_thread = threading.Thread(target=self.run_write_queue, name="score-writer", daemon=True)
+            self.write_thread.start()
+        future = Future()
+        row = (player_name, score, round_reached, balls_count, replay_path, 'pending' if replay_path else None)
+        self.write_queue.put((row, future))
+        return future
+    
+    def run_write_queue(self):
+        """쓰기 큐 처리 루프 (대기 중인 점수를 모아 한 번에 기록)"""
+        while True:
+            item = self.write_queue.get()
+            batch = []
+            stop = False
+            while item is not None:
+                batch.append(item)
+                if len(batch) >= DB_WRITE_BATCH:
+                    break
+                try:
+                    item = self.write_queue.get_nowait()
+                except queue.Empty:
+                    break
+            if item is None:
+                stop = True
+            
+            # 예상하지 못한 오류에도 모든 Future를 완료하고 task_done을 호출해야
+            # 쓰기 스레드가 계속 돌고 flush_writes/stop_write_queue가 멈추지 않음
+            try:
+                if batch:
+                    success = self.write_scores([row for row, _ in batch])
+                    for _, future in batch:
+                        future.set_result(success)
+            except Exception as e:
+                print(f"점수 쓰기 큐 오류: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                for _ in range(len(batch) + (1 if stop else 0)):
+                    self.write_queue.task_done()
+            if stop:
+                self.close()
+                return
+    
+    def flush_writes(self):
+        """쓰기 큐의 점수가 모두 기록될 때까지 대기"""
+        if self.write_thread is not None:
+            self.write_queue.join()
+    
+    def stop_write_queue(self):
+        """쓰기 큐를 비우고 쓰기 스레드 종료"""
+        if self.write_thread is None or not self.write_thread.is_alive():
+            return
+        self.write_queue.put(None)
+        self.write_thread.join()
+    
+    def shutdown(self):
+        """종료 시 쓰기 큐를 비우고 연결 닫기"""
+        self.stop_write_queue()
+        self.close()
+    
+    def update_leaderboard(self, rows: List[Tuple], dates: List[str]):
+        """저장한 점수 중 상위권에 드는 것만 캐시에 끼워 넣기 (dates: 행별 저장된 날짜)"""
+        with self.leaderboard_lock:
+            if self.leaderboard is None:
+                return
+            for (player_name, score, round_reached, balls_count, *_), formatted_date in zip(rows, dates):
+                # 정렬 기준: 점수, 라운드 내림차순 (같으면 최신 기록이 먼저)
+                index = 0
+                while index < len(self.leaderboard) and \
+                        (self.leaderboard[index][1], self.leaderboard[index][2]) > (score, round_reached):
+                    index += 1
+                if index < LEADERBOARD_CACHE_SIZE:
+                    self.leaderboard.insert(index, (player_name, score, round_reached, balls_count, formatted_date))
+                    del self.leaderboard[LEADERBOARD_CACHE_SIZE:]
+    
+    def invalidate_leaderboard(self):
+        """상위 점수 캐시 비우기 (다음 조회 때 DB에서 다시 읽음)"""
+        with self.leaderboard_lock:
+            self.leaderboard = None
+    
+    def get_top_scores(self, limit: int = 10, verified_only: bool = False) -> List[Tuple[str, int, int, int, str]]:
+        """상위 점수 조회 (캐시 범위 안이면 DB에 접근하지 않음)"""
+        if verified_only or limit > LEADERBOARD_CACHE_SIZE:
+            return self.query_top_scores(limit, verified_only)
+        with self.leaderboard_lock:
+            if self.leaderboard is None:
+                self.leaderboard = self.query_top_scores(LEADERBOARD_CACHE_SIZE)
+            return self.leaderboard[:limit]
+    
+    @traced('db')
+    def query_top_scores(self, limit: int = 10, verified_only: bool = False) -> List[Tuple[str, int, int, int, str]]:
+        """DB에서 상위 점수 조회 (verified_only면 리플레이 검증을 통과한 점수만)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
+                cursor.execute(f'''
                     SELECT player_name, score, round_reached, balls_count, 
                            datetime(play_date, 'localtime') as formatted_date
                     FROM scores 
+                    {"WHERE verification = 'verified'" if verified_only else ""}
                     ORDER BY score DESC, round_reached DESC, play_date DESC
                     LIMIT ?
                 ''', (limit,))
@@ -90,19 +572,74 @@ class DatabaseManager:
             print(f"점수 조회 오류: {e}")
             return []
     
+    @traced('db')
+    def get_period_top_scores(self, period: str, limit: int = LEADERBOARD_PERIOD_SIZE) -> List[Tuple[str, int, int, int, str]]:
+        """기간 랭킹 조회 (period: all, day, week, month)"""
+        if period == LEADERBOARD_PERIOD_ALL:
+            return self.get_top_scores(limit)
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute(f'''
+                    SELECT player_name, score, round_reached, balls_count,
+                           datetime(play_date, 'localtime') as formatted_date
+                    FROM period_scores
+                    WHERE period = ? AND period_key = {PERIOD_KEY_SQL[period].format("'now'")}
+                    ORDER BY score DESC, round_reached DESC, play_date DESC, score_id DESC
+                    LIMIT ?
+                ''', (period, limit))
+                
+                return cursor.fetchall()
+                
+        except sqlite3.Error as e:
+            print(f"기간 랭킹 조회 오류: {e}")
+            return []
+    
+    @traced('db')
+    def get_leaderboard_page(self, limit: int = LEADERBOARD_PAGE_SIZE,
+                             after: Optional[Tuple[int, int, str, int]] = None) -> Tuple[List[Tuple], Optional[Tuple]]:
+        """랭킹 한 페이지 조회 (after: 이전 페이지가 돌려준 커서, 반환: (행 목록, 다음 커서))"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # 마지막으로 읽은 행의 정렬 키보다 뒤에 있는 행부터 읽기 (키셋 페이지네이션)
+                cursor.execute(f'''
+                    SELECT player_name, score, round_reached, balls_count,
+                           datetime(play_date, 'localtime') as formatted_date, play_date, id
+                    FROM scores
+                    {"WHERE (score, round_reached, play_date, id) < (?, ?, ?, ?)" if after else ""}
+                    ORDER BY score DESC, round_reached DESC, play_date DESC, id DESC
+                    LIMIT ?
+                ''', (*after, limit) if after else (limit,))
+                
+                rows = cursor.fetchall()
+                if len(rows) < limit:
+                    next_cursor = None
+                else:
+                    last = rows[-1]
+                    next_cursor = (last[1], last[2], last[5], last[6])
+                return [row[:5] for row in rows], next_cursor
+                
+        except sqlite3.Error as e:
+            print(f"랭킹 페이지 조회 오류: {e}")
+            return [], None
+    
+    @traced('db')
     def get_player_best_score(self, player_name: str) -> Optional[Tuple[int, int, int, str]]:
         """특정 플레이어의 최고 점수 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
+                # 플레이어 행의 최고 기록 id로 점수 행 하나만 읽기
                 cursor.execute('''
-                    SELECT score, round_reached, balls_count, 
-                           datetime(play_date, 'localtime') as formatted_date
-                    FROM scores 
-                    WHERE player_name = ?
-                    ORDER BY score DESC, round_reached DESC, play_date DESC
-                    LIMIT 1
+                    SELECT s.score, s.round_reached, s.balls_count, 
+                           datetime(s.play_date, 'localtime') as formatted_date
+                    FROM players p JOIN scores s ON s.id = p.best_score_id
+                    WHERE p.name = ?
                 ''', (player_name,))
                 
                 result = cursor.fetchone()
@@ -112,13 +649,64 @@ class DatabaseManager:
             print(f"플레이어 점수 조회 오류: {e}")
             return None
     
+    @traced('db')
+    def get_player_stats(self, player_name: str) -> Optional[dict]:
+        """플레이어 요약 조회 (id, 최고 점수/라운드, 게임 수, 마지막 플레이 시각)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT id, best_score, best_round, games_played, datetime(last_seen, 'localtime')
+                    FROM players WHERE name = ?
+                ''', (player_name,))
+                
+                result = cursor.fetchone()
+                if result is None:
+                    return None
+                player_id, best_score, best_round, games_played, last_seen = result
+                return {
+                    'player_id': player_id,
+                    'best_score': best_score,
+                    'best_round': best_round,
+                    'games_played': games_played,
+                    'last_seen': last_seen
+                }
+                
+        except sqlite3.Error as e:
+            print(f"플레이어 조회 오류: {e}")
+            return None
+    
+    @traced('db')
+    def get_player_scores(self, player_name: str, limit: int = 10) -> List[Tuple[int, int, int, str]]:
+        """플레이어의 상위 점수 목록 ((player_id, score) 인덱스 순서로 읽기)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT score, round_reached, balls_count, 
+                           datetime(play_date, 'localtime') as formatted_date
+                    FROM scores 
+                    WHERE player_id = (SELECT id FROM players WHERE name = ?)
+                    ORDER BY score DESC, round_reached DESC, play_date DESC
+                    LIMIT ?
+                ''', (player_name, limit))
+                
+                return cursor.fetchall()
+                
+        except sqlite3.Error as e:
+            print(f"플레이어 점수 조회 오류: {e}")
+            return []
+    
+    @traced('db')
     def get_total_games_played(self) -> int:
         """총 게임 플레이 횟수 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('SELECT COUNT(*) FROM scores')
+                cursor.execute('SELECT total_games FROM score_summary WHERE id = 1')
                 result = cursor.fetchone()
                 return result[0] if result else 0
                 
@@ -126,13 +714,26 @@ class DatabaseManager:
             print(f"게임 횟수 조회 오류: {e}")
             return 0
     
+    @traced('db')
     def clear_all_scores(self) -> bool:
         """모든 점수 데이터 삭제 (관리자 기능)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('DELETE FROM scores')
+                # 요약 통계도 함께 초기화 (삭제는 트리거로 추적하지 않음)
+                cursor.execute('DELETE FROM players')
+                cursor.execute('DELETE FROM score_histogram')
+                cursor.execute('DELETE FROM period_scores')
+                cursor.execute('''
+                    UPDATE score_summary
+                    SET total_games = 0, score_sum = 0, highest_score = 0, highest_round = 0, unique_players = 0
+                    WHERE id = 1
+                ''')
                 conn.commit()
+                io_stats.record('db')
+                self.invalidate_leaderboard()
+                self.notify_score_listeners(None)
                 print("모든 점수 데이터가 삭제되었습니다.")
                 return True
                 
@@ -140,36 +741,370 @@ class DatabaseManager:
             print(f"데이터 삭제 오류: {e}")
             return False
     
-    def get_database_stats(self) -> dict:
-        """데이터베이스 통계 정보"""
+    @traced('db')
+    def get_score_histogram(self) -> Tuple[List[Tuple[int, int]], int]:
+        """점수 구간별 게임 수 조회 ((구간 번호, 게임 수) 목록, 분포에 반영된 마지막 점수 id)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                # 한 문장으로 읽어 분포와 마지막 id가 같은 시점의 값이 되게 함
+                cursor.execute('''
+                    SELECT bucket, games, (SELECT IFNULL(MAX(id), 0) FROM scores)
+                    FROM score_histogram ORDER BY bucket
+                ''')
+                rows = cursor.fetchall()
+                return [(bucket, games) for bucket, games, _ in rows], (rows[0][2] if rows else 0)
+                
+        except sqlite3.Error as e:
+            print(f"점수 분포 조회 오류: {e}")
+            return [], 0
+    
+    @traced('db')
+    def get_score_rank(self, score: int) -> Tuple[int, int, int]:
+        """점수의 정확한 순위 조회 (순위, 더 낮은 점수의 게임 수, 전체 게임 수)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # 점수 인덱스 범위만 세기
+                cursor.execute('''
+                    SELECT (SELECT COUNT(*) FROM scores WHERE score > ?),
+                           (SELECT COUNT(*) FROM scores WHERE score < ?),
+                           (SELECT total_games FROM score_summary WHERE id = 1)
+                ''', (score, score))
+                above, below, total = cursor.fetchone()
+                return above + 1, below, total or 0
+                
+        except sqlite3.Error as e:
+            print(f"순위 조회 오류: {e}")
+            return 0, 0, 0
+    
+    @traced('db')
+    def export_scores(self, path: str) -> int:
+        """점수를 CSV 또는 JSONL(.jsonl)로 내보내기 (DB_BULK_BATCH 행씩 읽어 메모리 사용량 일정, 내보낸 행 수 반환)"""
+        jsonl = path.endswith('.jsonl')
+        exported = 0
+        try:
+            with self.get_connection() as conn, open(path, 'w', encoding='utf-8', newline='') as f:
+                cursor = conn.cursor()
+                cursor.execute(f'SELECT {", ".join(EXPORT_COLUMNS)} FROM scores ORDER BY id')
+                
+                writer = None if jsonl else csv.writer(f)
+                if writer:
+                    writer.writerow(EXPORT_COLUMNS)
+                while True:
+                    rows = cursor.fetchmany(DB_BULK_BATCH)
+                    if not rows:
+                        break
+                    if writer:
+                        writer.writerows(rows)
+                    else:
+                        f.writelines(json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False) + '\n'
+                                     for row in rows)
+                    exported += len(rows)
+                
+                io_stats.record('db')
+                print(f"점수 {exported}개 내보내기 완료: {path}")
+                return exported
+                
+        except (sqlite3.Error, OSError) as e:
+            print(f"점수 내보내기 오류: {e}")
+            return exported
+    
+    def read_score_file(self, path: str, stats: dict):
+        """CSV/JSONL 점수 파일을 한 행씩 읽어 (이름, 점수, 라운드, 공 개수, 날짜, 검증 결과)로 반환
+        (잘못된 행은 건너뜀, 날짜가 없으면 중복 여부를 판단할 수 없으므로 잘못된 행)"""
+        jsonl = path.endswith('.jsonl')
+        with open(path, encoding='utf-8', newline='') as f:
+            if jsonl:
+                records = (line for line in f if line.strip())
+            else:
+                # CSV는 헤더로 컬럼 위치를 한 번만 찾음 (없는 선택 컬럼은 빈 값)
+                records = csv.reader(f)
+                header = next(records, [])
+                positions = [header.index(column) if column in header else None for column in EXPORT_COLUMNS]
+            for record in records:
+                stats['read'] += 1
+                try:
+                    if jsonl:
+                        record = json.loads(record)
+                        name, score, round_reached, balls_count, play_date, verification = (
+                            record.get(column) for column in EXPORT_COLUMNS)
+                    else:
+                        name, score, round_reached, balls_count, play_date, verification = (
+                            record[position] if position is not None else None for position in positions)
+                    name = str(name).strip() if name is not None else ''
+                    if not name or not play_date:
+                        raise ValueError(name)
+                    if verification not in IMPORT_VERIFICATIONS:
+                        verification = None
+                    yield (name, int(score), int(round_reached), int(balls_count or 1), str(play_date), verification)
+                except (IndexError, TypeError, ValueError, AttributeError):
+                    stats['invalid'] += 1
+    
+    @traced('db')
+    def import_scores(self, paths: List[str]) -> dict:
+        """CSV/JSONL 점수 파일들을 한 트랜잭션으로 가져오기 ((플레이어, 점수, 날짜)가 이미 있으면 건너뜀, 처리 결과 반환)
+        (실패하면 모두 되돌리고 error에 오류 메시지를 담음)"""
+        stats = {'read': 0, 'imported': 0, 'duplicates': 0, 'invalid': 0, 'seconds': 0.0, 'error': None}
+        start = time.perf_counter()
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        try:
+            # 가져오기 전체를 한 쓰기 트랜잭션으로 처리 (실패하면 인덱스/트리거 변경까지 모두 되돌림)
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute('SELECT IFNULL(MAX(id), 0) FROM scores')
+            first_id = cursor.fetchone()[0] + 1
+            
+            # 행마다 실행되는 트리거와 인덱스 갱신을 피하기 위해 scores의 트리거/인덱스를 내려 두고
+            # 넣기가 끝난 뒤 같은 정의로 다시 만듦 (인덱스는 정렬 한 번으로 만들어짐)
+            cursor.execute('''
+                SELECT type, name, sql FROM sqlite_master
+                WHERE type IN ('index', 'trigger') AND tbl_name = 'scores' AND sql IS NOT NULL
+            ''')
+            schema = cursor.fetchall()
+            for kind, name, _ in schema:
+                cursor.execute(f'DROP {kind.upper()} {name}')
+            
+            for path in paths:
+                rows = self.read_score_file(path, stats)
+                while True:
+                    batch = list(itertools.islice(rows, DB_BULK_BATCH))
+                    if not batch:
+                        break
+                    cursor.executemany('INSERT OR IGNORE INTO players (name) VALUES (?)',
+                                       [(name,) for name in {row[0] for row in batch}])
+                    cursor.executemany('''
+                        INSERT INTO scores (player_name, score, round_reached, balls_count, play_date, verification, player_id)
+                        VALUES (?1, ?2, ?3, ?4, ?5, ?6, (SELECT id FROM players WHERE name = ?1))
+                    ''', batch)
+                print(f"가져오기 진행: {path} (누적 {stats['read'] - stats['invalid']}개 읽음)")
+            
+            # 이미 있던 (플레이어, 점수, 날짜)와 같은 행은 먼저 들어간 행만 남김
+            # ((player_id, score) 인덱스만 먼저 만들어 중복을 찾고, 나머지 인덱스는 지운 뒤에 만듦)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_player_score 
+                ON scores(player_id, score DESC, round_reached DESC, play_date DESC)
+            ''')
+            cursor.execute('''
+                DELETE FROM scores
+                WHERE id >= ? AND EXISTS (
+                    SELECT 1 FROM scores s
+                    WHERE s.player_id = scores.player_id AND s.score = scores.score
+                      AND s.play_date = scores.play_date AND s.id < scores.id
+                )
+            ''', (first_id,))
+            cursor.execute('SELECT COUNT(*) FROM scores WHERE id >= ?', (first_id,))
+            stats['imported'] = cursor.fetchone()[0]
+            for kind, name, sql in schema:
+                if kind == 'index' and name != 'idx_player_score':
+                    cursor.execute(sql)
+            
+            if stats['imported']:
+                self.apply_imported_scores(cursor, first_id)
+            for kind, name, sql in schema:
+                if kind == 'trigger':
+                    cursor.execute(sql)
+            conn.commit()
+            stats['duplicates'] = stats['read'] - stats['invalid'] - stats['imported']
+            
+        except Exception as e:
+            stats['imported'] = 0
+            stats['error'] = str(e)
+            print(f"점수 가져오기 오류: {e}")
+        finally:
+            # 어떤 오류로 끝나도(중단 포함) 트랜잭션을 열어 둔 채 인덱스/트리거 없는 스키마를 남기지 않음
+            if conn.in_transaction:
+                conn.rollback()
+            io_stats.record('db')
+            self.invalidate_leaderboard()
+            self.notify_score_listeners(None)
+        
+        stats['seconds'] = time.perf_counter() - start
+        return stats
+    
+    def apply_imported_scores(self, cursor: sqlite3.Cursor, first_id: int):
+        """트리거 없이 넣은 점수(id >= first_id)를 플레이어/요약/분포/기간 랭킹에 한 번에 반영"""
+        cursor.execute('''
+            CREATE TEMP TABLE import_players AS
+            SELECT player_id, COUNT(*) AS games, MAX(play_date) AS last_seen
+            FROM scores WHERE id >= ? GROUP BY player_id
+        ''', (first_id,))
+        cursor.execute('''
+            UPDATE players
+            SET games_played = games_played + i.games,
+                last_seen = MAX(IFNULL(players.last_seen, i.last_seen), i.last_seen)
+            FROM import_players i WHERE players.id = i.player_id
+        ''')
+        self.update_player_bests(cursor, 'id IN (SELECT player_id FROM import_players)')
+        cursor.execute('DROP TABLE import_players')
+        
+        cursor.execute('''
+            UPDATE score_summary
+            SET total_games = total_games + i.games,
+                score_sum = score_sum + i.new_sum,
+                highest_score = MAX(highest_score, i.new_score),
+                highest_round = MAX(highest_round, i.new_round)
+            FROM (SELECT COUNT(*) AS games, SUM(score) AS new_sum, MAX(score) AS new_score,
+                         MAX(round_reached) AS new_round
+                  FROM scores WHERE id >= ?) AS i
+            WHERE score_summary.id = 1
+        ''', (first_id,))
+        
+        cursor.execute('''
+            INSERT INTO score_histogram (bucket, games)
+            SELECT score / ?, COUNT(*) FROM scores WHERE id >= ? GROUP BY score / ?
+            ON CONFLICT (bucket) DO UPDATE SET games = games + excluded.games
+        ''', (SCORE_HISTOGRAM_BUCKET, first_id, SCORE_HISTOGRAM_BUCKET))
+        
+        for period, key_sql in PERIOD_KEY_SQL.items():
+            current_key = key_sql.format("'now'")
+            cursor.execute(f'''
+                INSERT INTO period_scores
+                SELECT ?, {current_key}, id, player_name, score, round_reached, balls_count, play_date
+                FROM scores
+                WHERE id >= ? AND play_date >= datetime('now', '-32 days')
+                  AND {key_sql.format('play_date')} = {current_key}
+            ''', (period, first_id))
+            cursor.execute(f'''
+                DELETE FROM period_scores
+                WHERE period = ? AND period_key = {current_key} AND score_id IN (
+                    SELECT score_id FROM period_scores
+                    WHERE period = ? AND period_key = {current_key}
+                    ORDER BY score DESC, round_reached DESC, play_date DESC, score_id DESC
+                    LIMIT -1 OFFSET {LEADERBOARD_PERIOD_SIZE}
+                )
+            ''', (period, period))
+    
+    @traced('db')
+    def get_pending_verifications(self, limit: Optional[int] = None) -> List[Tuple[int, int, int, str]]:
+        """검증 대기 점수 조회 (id, 점수, 라운드, 리플레이 경로)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.execute('''
+                    SELECT id, score, round_reached, replay_path
+                    FROM scores
+                    WHERE verification = 'pending'
+                    ORDER BY id
+                    LIMIT ?
+                ''', (-1 if limit is None else limit,))
+                
+                return cursor.fetchall()
+                
+        except sqlite3.Error as e:
+            print(f"검증 대기 점수 조회 오류: {e}")
+            return []
+    
+    @traced('db')
+    def set_verification_results(self, results: List[Tuple[str, int]]) -> bool:
+        """점수 검증 결과 일괄 저장 ((상태, 점수 id) 목록)"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.get_connection() as conn:
                 cursor = conn.cursor()
+                cursor.executemany('UPDATE scores SET verification = ? WHERE id = ?', results)
+                conn.commit()
+                io_stats.record('db')
+                return True
                 
-                # 총 게임 수
-                cursor.execute('SELECT COUNT(*) FROM scores')
-                total_games = cursor.fetchone()[0]
+        except sqlite3.Error as e:
+            print(f"검증 결과 저장 오류: {e}")
+            return False
+    
+    @traced('db')
+    def save_replay_entry(self, entry: dict) -> bool:
+        """리플레이 카탈로그 항목 저장 (같은 경로가 있으면 교체)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
                 
-                # 최고 점수
-                cursor.execute('SELECT MAX(score) FROM scores')
-                highest_score = cursor.fetchone()[0] or 0
+                cursor.execute('''
+                    INSERT OR REPLACE INTO replays
+                        (path, player_name, mode, score, round_reached, shot_count,
+                         duration_ms, seed, file_size, index_offset, created)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, datetime(?, 'unixepoch'))
+                ''', (entry['path'], entry.get('player_name'), entry['mode'], entry['score'], entry['round'],
+                      entry['shot_count'], entry['duration_ms'], entry['seed'], entry['file_size'],
+                      entry['index_offset'], entry['created']))
                 
-                # 평균 점수
-                cursor.execute('SELECT AVG(score) FROM scores')
-                avg_score = cursor.fetchone()[0] or 0
+                conn.commit()
+                io_stats.record('db')
+                return True
                 
-                # 최고 라운드
-                cursor.execute('SELECT MAX(round_reached) FROM scores')
-                highest_round = cursor.fetchone()[0] or 0
+        except sqlite3.Error as e:
+            print(f"리플레이 카탈로그 저장 오류: {e}")
+            return False
+    
+    @traced('db')
+    def get_top_replays(self, limit: int = 20, mode: Optional[int] = None) -> List[Tuple]:
+        """점수 상위 리플레이 조회 (mode를 지정하면 해당 모드만)"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
                 
-                # 플레이어 수
-                cursor.execute('SELECT COUNT(DISTINCT player_name) FROM scores')
-                unique_players = cursor.fetchone()[0]
+                if mode is None:
+                    cursor.execute('''
+                        SELECT path, player_name, mode, score, round_reached, duration_ms,
+                               datetime(created, 'localtime') as formatted_date
+                        FROM replays
+                        ORDER BY score DESC
+                        LIMIT ?
+                    ''', (limit,))
+                else:
+                    cursor.execute('''
+                        SELECT path, player_name, mode, score, round_reached, duration_ms,
+                               datetime(created, 'localtime') as formatted_date
+                        FROM replays
+                        WHERE mode = ?
+                        ORDER BY score DESC
+                        LIMIT ?
+                    ''', (mode, limit))
+                
+                return cursor.fetchall()
+                
+        except sqlite3.Error as e:
+            print(f"리플레이 카탈로그 조회 오류: {e}")
+            return []
+    
+    @traced('db')
+    def remove_missing_replays(self, existing_paths) -> int:
+        """파일이 없어진 리플레이 카탈로그 항목 삭제"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                existing = set(existing_paths)
+                cursor.execute('SELECT path FROM replays')
+                missing = [(path,) for (path,) in cursor.fetchall() if path not in existing]
+                cursor.executemany('DELETE FROM replays WHERE path = ?', missing)
+                
+                conn.commit()
+                io_stats.record('db')
+                return len(missing)
+                
+        except sqlite3.Error as e:
+            print(f"리플레이 카탈로그 정리 오류: {e}")
+            return 0
+    
+    @traced('db')
+    def get_database_stats(self) -> dict:
+        """데이터베이스 통계 정보"""
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # 총 게임 수, 점수 합계, 최고 점수, 최고 라운드, 플레이어 수 (트리거로 유지되는 요약 행)
+                cursor.execute('''
+                    SELECT total_games, score_sum, highest_score, highest_round, unique_players
+                    FROM score_summary WHERE id = 1
+                ''')
+                total_games, score_sum, highest_score, highest_round, unique_players = cursor.fetchone()
                 
                 return {
                     'total_games': total_games,
                     'highest_score': highest_score,
-                    'average_score': round(avg_score, 1),
+                    'average_score': round(score_sum / total_games, 1) if total_games else 0,
                     'highest_round': highest_round,
                     'unique_players': unique_players
                 }
@@ -185,5 +1120,44 @@ class DatabaseManager:
             }
 
 
+class LeaderboardPager:
+    def __init__(self, manager: DatabaseManager, page_size: int = LEADERBOARD_PAGE_SIZE):
+        """랭킹 화면용 페이지 로더 (다음 페이지는 백그라운드 스레드에서 미리 읽음)"""
+        self.manager = manager
+        self.page_size = page_size
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="leaderboard")
+        self.reset()
+    
+    def reset(self):
+        """읽은 페이지 비우기 (랭킹 화면에 들어올 때 호출)"""
+        self.rows = []
+        self.cursor = None
+        self.exhausted = False
+        self.pending = None
+    
+    def poll(self):
+        """미리 읽기가 끝났으면 결과를 행 목록에 붙이기"""
+        if self.pending is not None and self.pending.done():
+            pending, self.pending = self.pending, None
+            rows, self.cursor = pending.result()
+            self.rows.extend(rows)
+            self.exhausted = self.cursor is None
+    
+    def get_rows(self, start: int, count: int) -> List[Tuple]:
+        """start번째부터 count개 행 반환 (남은 행이 한 페이지보다 적으면 다음 페이지 요청)"""
+        self.poll()
+        if not self.rows and not self.exhausted and self.pending is None:
+            # 첫 페이지는 바로 읽기
+            self.rows, self.cursor = self.manager.get_leaderboard_page(self.page_size)
+            self.exhausted = self.cursor is None
+        if not self.exhausted and self.pending is None and start + count + self.page_size > len(self.rows):
+            self.pending = self.executor.submit(self.manager.get_leaderboard_page, self.page_size, self.cursor)
+        return self.rows[start:start + count]
+    
+    def loading(self) -> bool:
+        """다음 페이지를 읽는 중인지 여부"""
+        return self.pending is not None
+
+
 # 전역 데이터베이스 매니저 인스턴스
 db_manager = DatabaseManager() 
\ No newline at end of file
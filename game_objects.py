@@ -3,104 +3,21 @@ import math
 import random
 from constants import *
 from language import get_text, set_language, get_current_language, language_manager
-from database import db_manager
+from database import db_manager, LeaderboardPager
+from rank import rank_service
 from shop import Shop
+from profiler import FrameProfiler, io_stats
+from memtrack import MemoryTracker
+from hud import PerformanceHUD
+from text_cache import TextCache
+from tracer import tracer, traced
+from simulation import SimulationClock, new_game_seed, create_rng_streams
+from replay import ReplayManager, SHOT_ROUND, SHOT_TICK, SHOT_X, SHOT_ANGLE, SHOT_PURCHASES
 import datetime
 import json
+from collections import namedtuple
+from concurrent.futures import Future
 import time
-import os
-
-
-class ReplayManager:
-    def __init__(self):
-        self.recording = False
-        self.playing = False
-        self.actions = []
-        self.current_action_index = 0
-        self.start_time = 0
-        
-    def start_recording(self):
-        """리플레이 기록 시작"""
-        self.recording = True
-        self.actions = []
-        self.start_time = time.time()
-        
-    def stop_recording(self):
-        """리플레이 기록 중지"""
-        self.recording = False
-        
-    def record_action(self, action_type, data, timestamp=None):
-        """액션 기록"""
-        if not self.recording or len(self.actions) >= MAX_REPLAY_ACTIONS:
-            return
-            
-        if timestamp is None:
-            timestamp = time.time() - self.start_time
-            
-        self.actions.append({
-            'type': action_type,
-            'data': data,
-            'timestamp': timestamp
-        })
-    
-    def save_replay(self, filename, score, round_num):
-        """리플레이 파일 저장"""
-        if not self.actions:
-            return False
-        
-        # replays 폴더 생성
-        if not os.path.exists('replays'):
-            os.makedirs('replays')
-            
-        replay_data = {
-            'version': '1.0',
-            'score': score,
-            'round': round_num,
-            'duration': time.time() - self.start_time,
-            'actions': self.actions,
-            'timestamp': datetime.datetime.now().isoformat()
-        }
-        
-        try:
-            with open(f"replays/{filename}.json", 'w') as f:
-                json.dump(replay_data, f)
-            return True
-        except:
-            return False
-    
-    def load_replay(self, filename):
-        """리플레이 파일 로드"""
-        try:
-            with open(f"replays/{filename}.json", 'r') as f:
-                replay_data = json.load(f)
-            self.actions = replay_data['actions']
-            self.current_action_index = 0
-            return replay_data
-        except:
-            return None
-    
-    def start_playback(self):
-        """리플레이 재생 시작"""
-        self.playing = True
-        self.current_action_index = 0
-        self.start_time = time.time()
-    
-    def stop_playback(self):
-        """리플레이 재생 중지"""
-        self.playing = False
-        
-    def get_next_action(self):
-        """다음 액션 가져오기"""
-        if not self.playing or self.current_action_index >= len(self.actions):
-            return None
-            
-        current_time = time.time() - self.start_time
-        action = self.actions[self.current_action_index]
-        
-        if current_time >= action['timestamp']:
-            self.current_action_index += 1
-            return action
-        return None
 
 
 class StatisticsManager:
@@ -135,11 +52,13 @@ class StatisticsManager:
         except:
             pass  # 파일이 없으면 기본값 사용
     
+    @traced('io')
     def save_stats(self):
         """통계 파일 저장"""
         try:
             with open('stats.json', 'w') as f:
                 json.dump(self.stats, f)
+            io_stats.record('file')
         except:
             pass
     
@@ -282,6 +201,7 @@ class AchievementManager:
             }
         }
         self.notifications = []  # 업적 알림 큐
+        self.suspended = False  # 리플레이 재생 중에는 업적을 갱신하지 않음
         self.load_achievements()
         
         # 각도 추적 변수들
@@ -299,17 +219,19 @@ class AchievementManager:
         except:
             pass  # 파일이 없으면 기본값 사용
     
+    @traced('io')
     def save_achievements(self):
         """업적 파일 저장"""
         try:
             with open('achievements.json', 'w') as f:
                 json.dump(self.achievements, f)
+            io_stats.record('file')
         except:
             pass
     
     def check_achievement(self, achievement_id, value=1):
         """업적 진행도 체크 및 업데이트"""
-        if achievement_id not in self.achievements:
+        if self.suspended or achievement_id not in self.achievements:
             return False
             
         achievement = self.achievements[achievement_id]
@@ -408,8 +330,7 @@ class GameModeManager:
         
         if mode == GAME_MODE_TIME_ATTACK:
             self.mode_data = {
-                'time_left': TIME_ATTACK_DURATION,
-                'start_time': time.time()
+                'time_left': TIME_ATTACK_DURATION
             }
         elif mode == GAME_MODE_PUZZLE:
             self.mode_data = {
@@ -425,9 +346,8 @@ class GameModeManager:
     def update(self, game):
         """모드별 업데이트 로직"""
         if self.current_mode == GAME_MODE_TIME_ATTACK:
-            # 시간 제한 모드: 시간 감소
-            current_time = time.time()
-            elapsed = current_time - self.mode_data['start_time']
+            # 시간 제한 모드: 시간 감소 (게임 시간 기준, 일시정지/상점 시간은 제외)
+            elapsed = game.sim_clock.get_seconds()
             self.mode_data['time_left'] = max(0, TIME_ATTACK_DURATION - elapsed)
             
             if self.mode_data['time_left'] <= 0:
@@ -484,11 +404,23 @@ class GameModeManager:
         return False
 
 
+ThemePalette = namedtuple('ThemePalette', [
+    'background', 'surface', 'darker_surface', 'text', 'text_secondary',
+    'accent', 'ball_color', 'ball_trail'
+])
+
+
 class ThemeManager:
     def __init__(self):
         self.current_theme = THEME_DARK
         self.manual_theme = None  # 수동으로 설정된 테마
         
+        # 테마 팔레트는 시작 시 한 번만 컴파일 (그리기 경로에서 할당 없음)
+        self.palettes = {
+            theme: ThemePalette(**colors)
+            for theme, colors in THEME_PALETTES.items()
+        }
+        
     def get_seasonal_theme(self):
         """현재 날짜에 따른 계절 테마 반환"""
         now = datetime.datetime.now()
@@ -534,73 +466,8 @@ class ThemeManager:
         self.manual_theme = None
     
     def get_theme_colors(self, theme):
-        """테마에 따른 색상 팔레트 반환"""
-        if theme == THEME_LIGHT:
-            return {
-                'background': LIGHT_BLACK,
-                'surface': LIGHT_SURFACE,
-                'darker_surface': LIGHT_DARKER_SURFACE,
-                'text': LIGHT_TEXT,
-                'text_secondary': LIGHT_TEXT_SECONDARY,
-                'accent': (0, 123, 255),
-                'ball_color': (0, 123, 255),
-                'ball_trail': (0, 123, 255)
-            }
-        elif theme == THEME_CHRISTMAS:
-            return {
-                'background': CHRISTMAS_DARK,
-                'surface': (40, 40, 50),
-                'darker_surface': (30, 30, 40),
-                'text': CHRISTMAS_WHITE,
-                'text_secondary': (200, 200, 200),
-                'accent': CHRISTMAS_RED,
-                'ball_color': CHRISTMAS_GOLD,
-                'ball_trail': CHRISTMAS_GOLD
-            }
-        elif theme == THEME_HALLOWEEN:
-            return {
-                'background': HALLOWEEN_BLACK,
-                'surface': (40, 20, 40),
-                'darker_surface': (30, 15, 30),
-                'text': HALLOWEEN_ORANGE,
-                'text_secondary': HALLOWEEN_GRAY,
-                'accent': HALLOWEEN_PURPLE,
-                'ball_color': HALLOWEEN_ORANGE,
-                'ball_trail': HALLOWEEN_ORANGE
-            }
-        elif theme == THEME_SPRING:
-            return {
-                'background': SPRING_WHITE,
-                'surface': (240, 248, 240),
-                'darker_surface': (230, 240, 230),
-                'text': (60, 120, 60),
-                'text_secondary': (100, 150, 100),
-                'accent': SPRING_PINK,
-                'ball_color': SPRING_GREEN,
-                'ball_trail': SPRING_GREEN
-            }
-        elif theme == THEME_SUMMER:
-            return {
-                'background': (240, 248, 255),
-                'surface': (230, 240, 250),
-                'darker_surface': (220, 230, 240),
-                'text': (30, 60, 120),
-                'text_secondary': (70, 100, 150),
-                'accent': SUMMER_BLUE,
-                'ball_color': SUMMER_CYAN,
-                'ball_trail': SUMMER_CYAN
-            }
-        else:  # THEME_DARK (기본)
-            return {
-                'background': BLACK,
-                'surface': DARK_SURFACE,
-                'darker_surface': DARKER_SURFACE,
-                'text': WHITE,
-                'text_secondary': TEXT_SECONDARY,
-                'accent': NEON_CYAN,
-                'ball_color': NEON_CYAN,
-                'ball_trail': NEON_CYAN
-            }
+        """테마에 따른 색상 팔레트 반환 (미리 컴파일된 불변 객체)"""
+        return self.palettes.get(theme, self.palettes[THEME_DARK])
 
 
 class Particle:
@@ -778,10 +645,10 @@ class Ball:
     
     def draw(self, screen):
         if self.active:
-            # 테마에 따른 공 색상 가져오기
-            theme_colors = self.game.theme_manager.get_theme_colors(self.game.current_theme) if self.game else None
-            ball_color = theme_colors['ball_color'] if theme_colors else NEON_CYAN
-            trail_color = theme_colors['ball_trail'] if theme_colors else NEON_CYAN
+            # 테마에 따른 공 색상 (게임이 테마 변경 시 전달한 팔레트 사용)
+            theme_colors = self.game.palette if self.game else None
+            ball_color = theme_colors.ball_color if theme_colors else NEON_CYAN
+            trail_color = theme_colors.ball_trail if theme_colors else NEON_CYAN
             
             # 트레일 그리기 (공보다 먼저 그려서 뒤에 표시)
             for i, point in enumerate(self.trail_points):
@@ -800,7 +667,7 @@ class Ball:
             pygame.draw.circle(screen, ball_color, (int(self.x), int(self.y)), self.radius)
             
             # 하이라이트 (3D 효과)
-            highlight_color = theme_colors['text'] if theme_colors else WHITE
+            highlight_color = theme_colors.text if theme_colors else WHITE
             highlight_pos = (int(self.x - self.radius//3), int(self.y - self.radius//3))
             pygame.draw.circle(screen, highlight_color, highlight_pos, self.radius//3)
             
@@ -825,7 +692,8 @@ class Block:
             
         # 투명 블록: 일정 확률로 공이 통과
         if self.block_type == BLOCK_TYPE_GHOST:
-            if random.random() < GHOST_BLOCK_PASS_CHANCE:
+            rng = game.rng if game else random
+            if rng.random() < GHOST_BLOCK_PASS_CHANCE:
                 return False  # 공이 통과함 (충돌하지 않음)
         
         # 방어막 블록: 3번 맞아야 파괴
@@ -875,16 +743,17 @@ class Block:
         if self.block_type != BLOCK_TYPE_NORMAL:
             game.achievement_manager.check_achievement('special_destroyer', 1)
         
+        rng = game.visual_rng  # 시각 효과 전용 난수 (게임 결과에 영향 없음)
         for _ in range(EXPLOSION_PARTICLE_COUNT):
             # 랜덤한 방향과 속도
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, EXPLOSION_PARTICLE_SPEED)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, EXPLOSION_PARTICLE_SPEED)
             dx = math.cos(angle) * speed
             dy = math.sin(angle) * speed
             
             # 파티클 크기와 수명 랜덤화
-            size = random.randint(2, 4)
-            life = random.randint(EXPLOSION_PARTICLE_LIFE // 2, EXPLOSION_PARTICLE_LIFE)
+            size = rng.randint(2, 4)
+            life = rng.randint(EXPLOSION_PARTICLE_LIFE // 2, EXPLOSION_PARTICLE_LIFE)
             
             particle = Particle(center_x, center_y, dx, dy, block_color, life, size)
             game.particles.append(particle)
@@ -1071,20 +940,21 @@ class BonusBall:
     
     def create_sparkle_particles(self, game):
         """보너스 볼 수집 시 반짝임 파티클 생성"""
+        rng = game.visual_rng  # 시각 효과 전용 난수 (게임 결과에 영향 없음)
         for _ in range(SPARKLE_PARTICLE_COUNT):
             # 랜덤한 방향과 속도
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, SPARKLE_PARTICLE_SPEED)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(1, SPARKLE_PARTICLE_SPEED)
             dx = math.cos(angle) * speed
             dy = math.sin(angle) * speed - 2  # 위쪽으로 약간 편향
             
             # 반짝임 색상 (노란색, 흰색, 초록색 중 랜덤)
             colors = [NEON_YELLOW, WHITE, NEON_GREEN]
-            color = random.choice(colors)
+            color = rng.choice(colors)
             
             # 파티클 크기와 수명
-            size = random.randint(1, 3)
-            life = random.randint(SPARKLE_PARTICLE_LIFE // 2, SPARKLE_PARTICLE_LIFE)
+            size = rng.randint(1, 3)
+            life = rng.randint(SPARKLE_PARTICLE_LIFE // 2, SPARKLE_PARTICLE_LIFE)
             
             particle = Particle(self.x, self.y, dx, dy, color, life, size)
             game.particles.append(particle)
@@ -1136,7 +1006,7 @@ class BonusBall:
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, profile=False, memtrack=False, trace=False, record_replays=True):
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("볼즈 게임")
@@ -1199,6 +1069,15 @@ class Game:
                 self.title_font = pygame.font.Font(None, TITLE_FONT_SIZE + 8)
                 self.menu_font = pygame.font.Font(None, MENU_FONT_SIZE + 8)
         
+        # 랭킹 화면 폰트 (매 프레임 만들면 TTF를 다시 읽고 텍스트 캐시도 적중하지 않으므로 한 번만 로드)
+        self.ranking_title_font = self.load_sized_font(36, self.large_font)
+        self.ranking_tab_font = self.load_sized_font(14, pygame.font.Font(None, 18))
+        self.ranking_header_font = self.load_sized_font(16, self.small_font)
+        self.ranking_row_font = self.load_sized_font(18, self.small_font)
+        self.ranking_date_font = self.load_sized_font(12, pygame.font.Font(None, 14))
+        self.ranking_info_font = self.load_sized_font(14, pygame.font.Font(None, 16))
+        self.ranking_empty_font = self.load_sized_font(20, self.font)
+        
         # 설정 값들
         self.settings = {
             "ball_speed": 11,
@@ -1219,6 +1098,9 @@ class Game:
         # 게임 오버 후 이름 입력 관련
         self.name_entered = False
         self.score_saved = False
+        self.score_future = None  # 쓰기 큐에 넣은 점수 저장 결과
+        self.rank_estimate = None  # 게임 종료 점수의 근사 백분위/순위
+        self.rank_future = None  # 정확한 순위 조회 결과
         
         # 게임 상태 관리
         self.game_state = GAME_STATE_TITLE
@@ -1245,7 +1127,15 @@ class Game:
         self.pause_menu_selected = 0
         
         # 리플레이 시스템
-        self.replay_manager = ReplayManager()
+        self.replay_manager = ReplayManager(record=record_replays)
+        
+        # 랭킹 화면 (페이지 단위로 읽으며 스크롤)
+        self.leaderboard_pager = LeaderboardPager(db_manager)
+        self.ranking_scroll = 0
+        self.ranking_period = 0  # LEADERBOARD_PERIODS 탭 번호
+        self.period_rankings = []  # 선택한 기간 탭의 랭킹 (탭을 바꿀 때 한 번 읽음)
+        self.ranking_stats = None  # 랭킹 화면 하단 통계 (화면을 열 때 읽고 점수가 저장되면 다시 읽음)
+        db_manager.score_listeners.append(self.on_scores_written)
         
         # 통계 시스템
         self.stats_manager = StatisticsManager()
@@ -1262,11 +1152,46 @@ class Game:
         self.achievement_manager = AchievementManager()
         self.blocks_destroyed_this_shot = 0
         
+        # 프레임 프로파일러 (F9: 보고서 저장)
+        # 메모리 추적 모드는 같은 측정 구간에서 시간 대신 할당 바이트를 집계
+        # 트레이스 모드는 같은 측정 구간을 trace-event 스팬으로 기록
+        if memtrack:
+            self.profiler = MemoryTracker(enabled=True)
+        elif trace and tracer.open():
+            self.profiler = tracer
+        else:
+            self.profiler = FrameProfiler(enabled=profile)
+        
+        # 성능 HUD (F3) 및 텍스트 서피스 캐시
+        self.hud = PerformanceHUD()
+        self.text_cache = TextCache()
+        
+        # 게임 시간 (게임플레이 코드는 벽시계 대신 이 시간을 사용)
+        self.sim_clock = SimulationClock()
+        
         self.reset_game()
         
         self.shop = Shop(self.font, self.score)
-        self.active_powerups = {1: False, 2: False, 3: False}  # 파워볼, 스피드볼, 매그넘볼
         
+    @property
+    def current_theme(self):
+        return self._current_theme
+    
+    @current_theme.setter
+    def current_theme(self, theme):
+        """테마 변경 시 컴파일된 팔레트를 그리기 코드에 전달"""
+        self._current_theme = theme
+        self.palette = self.theme_manager.get_theme_colors(theme)
+        
+    def load_sized_font(self, size, fallback):
+        """한글 폰트를 지정 크기로 로드 (한글 폰트가 없거나 실패하면 fallback)"""
+        try:
+            if self.current_font_path:
+                return pygame.font.Font(self.current_font_path, size)
+        except Exception:
+            pass
+        return fallback
+    
     def safe_render_text(self, font, text, color, fallback_font=None):
         """안전한 텍스트 렌더링 (한글 깨짐 방지)"""
         try:
@@ -1274,7 +1199,11 @@ class Game:
             if text is None:
                 text = ""
             text = str(text)
-            return font.render(text, True, color)
+            surface = self.text_cache.get(font, text, color)
+            if surface is None:
+                surface = font.render(text, True, color)
+                self.text_cache.put(font, text, color, surface)
+            return surface
         except Exception as e:
             # 폰트 렌더링 실패 시 대체 폰트 사용
             if fallback_font:
@@ -1367,7 +1296,14 @@ class Game:
                 self.theme_manager.set_manual_theme(theme_map[self.settings["theme"]])
                 self.current_theme = theme_map[self.settings["theme"]]
         
-    def reset_game(self):
+    def reset_game(self, seed=None):
+        # 게임별 시드: 같은 시드와 입력이면 같은 게임이 재현됨
+        self.seed = seed if seed is not None else new_game_seed()
+        self.replay_watched = False
+        self.replay_path = None  # 이번 게임에서 저장한 리플레이 경로
+        self.rng, self.visual_rng = create_rng_streams(self.seed)
+        self.sim_clock.reset()
+        
         self.balls = []
         self.blocks = []
         self.bonus_balls = []
@@ -1390,6 +1326,9 @@ class Game:
         self.input_active = False
         self.name_entered = False
         self.score_saved = False
+        self.score_future = None
+        self.rank_estimate = None
+        self.rank_future = None
         
         # 콤보 시스템 초기화
         self.combo_count = 0
@@ -1402,6 +1341,9 @@ class Game:
         # 파티클 시스템 초기화
         self.particles = []
         
+        # 파워업 초기화 (이전 게임에서 활성화된 효과가 남지 않도록)
+        self.active_powerups = {1: False, 2: False, 3: False}  # 파워볼, 스피드볼, 매그넘볼
+        
         # 테마 초기화
         self.current_theme = self.theme_manager.get_seasonal_theme()
         
@@ -1411,9 +1353,9 @@ class Game:
         self.highest_combo_this_game = 0
         self.powerups_used_this_game = 0
         
-        # 리플레이 기록 시작
+        # 리플레이 기록 시작 (시드와 모드, 이후 발사 입력만 기록)
         if not self.replay_manager.playing:
-            self.replay_manager.start_recording()
+            self.replay_manager.start_recording(self.seed, self.mode_manager.current_mode)
         
         # 업적 시스템 초기화
         self.blocks_destroyed_this_shot = 0
@@ -1428,7 +1370,7 @@ class Game:
     
     def add_score(self, points, block_color=None):
         """점수 추가 (콤보 시스템 포함)"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.get_ticks()
         
         # 콤보 시스템 처리
         if block_color:
@@ -1479,28 +1421,68 @@ class Game:
         """게임 점수를 데이터베이스에 저장"""
         if self.player_name.strip() and not self.score_saved:
             try:
-                success = db_manager.save_score(
-                    self.player_name.strip(),
-                    self.score,
-                    self.round_num,
-                    self.ball_count
-                )
-                if success:
-                    self.score_saved = True
-                    print(f"점수 저장 완료: {self.player_name} - {self.score}점")
-                return success
+                # 제출 점수는 검증용 리플레이를 함께 저장 (리플레이 관람 결과는 제외)
+                replay_path = None if self.replay_watched else self.save_game_replay(force=True)
+                row = (self.player_name.strip(), self.score, self.round_num, self.ball_count)
+                if replay_path is None:
+                    # 쓰기 큐에 넣고 바로 반환 (저장 결과는 score_future로 확인)
+                    self.score_future = db_manager.submit_score(*row)
+                else:
+                    # 리플레이 파일이 최종 이름으로 바뀐 뒤에 쓰기 큐에 넣음
+                    # (검증기가 아직 없는 파일을 보고 거부하지 않도록)
+                    score_future = Future()
+                    self.replay_manager.save_future.add_done_callback(
+                        lambda saved: self.submit_score_after_replay(row, replay_path, score_future, saved))
+                    self.score_future = score_future
+                self.score_saved = True
+                return True
             except Exception as e:
                 print(f"점수 저장 중 오류 발생: {e}")
                 return False
         return False
     
-    def get_rankings(self, limit=10):
-        """랭킹 조회"""
-        try:
-            return db_manager.get_top_scores(limit)
-        except Exception as e:
-            print(f"랭킹 조회 중 오류 발생: {e}")
-            return []
+    def submit_score_after_replay(self, row, replay_path, score_future, saved):
+        """리플레이 저장이 끝나면 점수 제출 (최종 파일이 없으면 리플레이 없이 제출, 결과는 score_future로 전달)"""
+        future = db_manager.submit_score(*row, replay_path if saved.result() else None)
+        future.add_done_callback(lambda stored: score_future.set_result(stored.exception() is None and stored.result()))
+    
+    def open_ranking(self):
+        """랭킹 화면 열기 (맨 위부터 다시 읽기)"""
+        self.game_state = GAME_STATE_RANKING
+        self.ranking_scroll = 0
+        self.ranking_period = 0
+        self.period_rankings = []
+        self.leaderboard_pager.reset()
+        self.ranking_stats = db_manager.get_database_stats()
+    
+    def on_scores_written(self, rows):
+        """점수 저장 알림 (쓰기 스레드에서 호출되므로 DB를 읽지 않고 통계만 다시 읽도록 표시)"""
+        self.ranking_stats = None
+    
+    def switch_ranking_period(self, delta):
+        """랭킹 기간 탭 전환 (전체 / 오늘 / 이번 주 / 이번 달)"""
+        self.ranking_period = (self.ranking_period + delta) % len(LEADERBOARD_PERIODS)
+        self.ranking_scroll = 0
+        period = LEADERBOARD_PERIODS[self.ranking_period]
+        if period == LEADERBOARD_PERIOD_ALL:
+            self.period_rankings = []
+        else:
+            self.period_rankings = db_manager.get_period_top_scores(period)
+    
+    def get_ranking_rows(self, start, count):
+        """선택한 탭의 start번째부터 count개 랭킹"""
+        if LEADERBOARD_PERIODS[self.ranking_period] == LEADERBOARD_PERIOD_ALL:
+            return self.leaderboard_pager.get_rows(start, count)
+        return self.period_rankings[start:start + count]
+    
+    def scroll_ranking(self, delta):
+        """랭킹 목록 스크롤 (읽어 둔 행 범위 안에서만 이동)"""
+        if LEADERBOARD_PERIODS[self.ranking_period] == LEADERBOARD_PERIOD_ALL:
+            loaded = len(self.leaderboard_pager.rows)
+        else:
+            loaded = len(self.period_rankings)
+        max_scroll = max(0, loaded - LEADERBOARD_VISIBLE_ROWS)
+        self.ranking_scroll = max(0, min(self.ranking_scroll + delta, max_scroll))
     
     def use_super_ball(self):
         pass  # 완전 삭제(호출도 제거)
@@ -1510,7 +1492,7 @@ class Game:
         occupied_positions = []  # 이미 사용된 위치들
         
         for col in range(BLOCKS_PER_ROW):
-            if random.random() < 0.6:  # 60% 확률로 블록 생성 (보너스 볼 공간 확보)
+            if self.rng.random() < 0.6:  # 60% 확률로 블록 생성 (보너스 볼 공간 확보)
                 # 화면을 꽉 채우도록 블록 위치 계산 (왼쪽 여백 1px)
                 x = 1 + col * (BLOCK_SIZE + BLOCK_MARGIN)
                 y = BLOCK_START_Y
@@ -1518,7 +1500,7 @@ class Game:
                 
                 # 특수 블록 타입 결정
                 block_type = BLOCK_TYPE_NORMAL
-                rand = random.random()
+                rand = self.rng.random()
                 
                 if rand < BOMB_BLOCK_CHANCE:
                     block_type = BLOCK_TYPE_BOMB
@@ -1531,10 +1513,10 @@ class Game:
                 occupied_positions.append(col)
         
         # 보너스 볼 생성 - 블록이 없는 위치에만 생성
-        if random.random() < BONUS_BALL_SPAWN_CHANCE and len(occupied_positions) < BLOCKS_PER_ROW:
+        if self.rng.random() < BONUS_BALL_SPAWN_CHANCE and len(occupied_positions) < BLOCKS_PER_ROW:
             available_cols = [col for col in range(BLOCKS_PER_ROW) if col not in occupied_positions]
             if available_cols:
-                col = random.choice(available_cols)
+                col = self.rng.choice(available_cols)
                 # 보너스 볼 위치도 동일하게 계산
                 x = 1 + col * (BLOCK_SIZE + BLOCK_MARGIN) + BLOCK_SIZE // 2
                 y = BLOCK_START_Y + BLOCK_SIZE // 2
@@ -1543,12 +1525,20 @@ class Game:
         
         # 슈퍼볼 아이템 생성 코드 완전 삭제
         
-    def handle_events(self):
-        for event in pygame.event.get():
+    def handle_events(self, events=None):
+        if events is None:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
             elif event.type == pygame.KEYDOWN:
-                if self.game_state == GAME_STATE_TITLE:
+                if event.key == pygame.K_F3:
+                    # 성능 HUD 표시 전환
+                    self.hud.toggle()
+                elif event.key == pygame.K_F9 and self.profiler.enabled:
+                    # 프로파일 보고서 저장
+                    self.profiler.dump()
+                elif self.game_state == GAME_STATE_TITLE:
                     self.handle_title_input(event.key)
                 elif self.game_state == GAME_STATE_GAME:
                     if event.key == pygame.K_ESCAPE and not self.game_over:
@@ -1576,23 +1566,22 @@ class Game:
                                 self.player_name += event.unicode
                         self.input_active = True
                     elif event.key == pygame.K_r and self.game_over:
-                        # 게임 종료 시 통계 업데이트
-                        self.stats_manager.update_game_end(
-                            self.score, self.round_num, self.blocks_destroyed_by_type,
-                            self.combos_this_game, self.highest_combo_this_game,
-                            self.powerups_used_this_game, self.bonus_balls_collected
-                        )
-                        
-                        # 모드별 업적 체크
-                        if self.mode_manager.current_mode == GAME_MODE_TIME_ATTACK:
-                            self.achievement_manager.check_achievement('time_master', self.score)
-                        elif self.mode_manager.current_mode == GAME_MODE_PUZZLE and self.mode_manager.is_game_complete(self):
-                            self.achievement_manager.check_achievement('puzzle_solver', 1)
-                        
-                        # 높은 점수 시 리플레이 저장
-                        if self.score >= REPLAY_SAVE_THRESHOLD:
-                            self.replay_manager.save_replay(f"replay_{int(time.time())}", self.score, self.round_num)
+                        # 리플레이 관람이 끝난 경우 통계/업적/리플레이를 갱신하지 않음
+                        if not self.replay_watched:
+                            self.record_game_end()
                         self.reset_game()
+                    elif self.replay_manager.playing and not self.paused:
+                        # 리플레이 재생 조작 (배속 전환, 라운드 이동)
+                        if event.key == pygame.K_TAB:
+                            self.replay_manager.cycle_speed()
+                        elif event.key == pygame.K_LEFT:
+                            self.seek_replay(self.round_num - 1)
+                        elif event.key == pygame.K_RIGHT:
+                            self.seek_replay(self.round_num + 1)
+                        elif event.key == pygame.K_PAGEUP:
+                            self.seek_replay(self.round_num - REPLAY_KEYFRAME_INTERVAL)
+                        elif event.key == pygame.K_PAGEDOWN:
+                            self.seek_replay(self.round_num + REPLAY_KEYFRAME_INTERVAL)
                     elif self.paused:
                         # 일시정지 메뉴 처리
                         if event.key == pygame.K_UP:
@@ -1620,6 +1609,20 @@ class Game:
                 elif self.game_state == GAME_STATE_RANKING:
                     if event.key == pygame.K_ESCAPE:
                         self.game_state = GAME_STATE_TITLE
+                    elif event.key == pygame.K_UP:
+                        self.scroll_ranking(-1)
+                    elif event.key == pygame.K_DOWN:
+                        self.scroll_ranking(1)
+                    elif event.key == pygame.K_PAGEUP:
+                        self.scroll_ranking(-LEADERBOARD_VISIBLE_ROWS)
+                    elif event.key == pygame.K_PAGEDOWN:
+                        self.scroll_ranking(LEADERBOARD_VISIBLE_ROWS)
+                    elif event.key == pygame.K_HOME:
+                        self.ranking_scroll = 0
+                    elif event.key == pygame.K_LEFT:
+                        self.switch_ranking_period(-1)
+                    elif event.key == pygame.K_RIGHT or event.key == pygame.K_TAB:
+                        self.switch_ranking_period(1)
                 elif self.game_state == GAME_STATE_STATISTICS:
                     if event.key == pygame.K_ESCAPE:
                         self.game_state = GAME_STATE_TITLE
@@ -1638,7 +1641,7 @@ class Game:
                     if event.key == pygame.K_ESCAPE:
                         self.game_state = GAME_STATE_TITLE
             elif event.type == pygame.MOUSEMOTION:
-                if self.game_state == GAME_STATE_GAME and not self.game_over:
+                if self.game_state == GAME_STATE_GAME and not self.game_over and not self.replay_manager.playing:
                     # 마우스 위치로 발사각도 계산
                     mouse_x, mouse_y = event.pos
                     if mouse_y < SCREEN_HEIGHT - BOTTOM_UI_HEIGHT:
@@ -1675,7 +1678,7 @@ class Game:
                             elif self.selected_menu == 2:  # 게임 설정
                                 self.game_state = GAME_STATE_SETTINGS
                             elif self.selected_menu == 3:  # 랭킹
-                                self.game_state = GAME_STATE_RANKING
+                                self.open_ranking()
                             elif self.selected_menu == 4:  # 통계
                                 self.game_state = GAME_STATE_STATISTICS
                             elif self.selected_menu == 5:  # 업적
@@ -1683,21 +1686,23 @@ class Game:
                             elif self.selected_menu == 6:  # 게임 종료
                                 return False
                             break
-                elif self.game_state == GAME_STATE_GAME and not self.game_over and not self.round_in_progress:
+                elif (self.game_state == GAME_STATE_GAME and not self.game_over and not self.round_in_progress
+                      and not self.replay_manager.playing):
                     self.start_launch()
                     
-        # 상점이 열려있을 때는 상점 이벤트만 처리
-        if self.shop.open:
+        # 상점이 열려있을 때는 상점 이벤트만 처리 (리플레이 재생 중에는 기록된 구매를 사용)
+        if self.shop.open and not self.replay_manager.playing:
             shop_events = pygame.event.get()
             for shop_event in shop_events:
                 if shop_event.type == pygame.MOUSEBUTTONDOWN:
                     pos = shop_event.pos
                     # 아이템 구매
-                    for item in self.shop.items:
+                    for index, item in enumerate(self.shop.items):
                         if 'btn_rect' in item and item['btn_rect'].collidepoint(pos):
                             if self.shop.buy(item):
                                 # 게임의 점수도 업데이트
                                 self.score = self.shop.player_score
+                                self.replay_manager.record_purchase(index)
                     # 닫기 버튼
                     if hasattr(self.shop, 'close_rect') and self.shop.close_rect.collidepoint(pos):
                         self.shop.open = False
@@ -1724,7 +1729,7 @@ class Game:
             elif self.selected_menu == 2:  # 게임 설정
                 self.game_state = GAME_STATE_SETTINGS
             elif self.selected_menu == 3:  # 랭킹
-                self.game_state = GAME_STATE_RANKING
+                self.open_ranking()
             elif self.selected_menu == 4:  # 통계
                 self.game_state = GAME_STATE_STATISTICS
             elif self.selected_menu == 5:  # 업적
@@ -1740,10 +1745,15 @@ class Game:
                 self.mode_manager.mode_data.get('balls_left', 0) <= 0):
                 return
                 
+            # 리플레이: 키프레임 라운드면 발사 직전 상태를 기록한 뒤 발사 시점의 게임 틱과 위치/각도 기록
+            if self.replay_manager.wants_keyframe(self.round_num):
+                self.replay_manager.record_keyframe(self.round_num, self.capture_keyframe())
+            self.replay_manager.record_shot(self.round_num, self.sim_clock.steps, self.launch_x, self.launch_angle)
+            
             # 새 라운드 시작
             self.round_in_progress = True
             self.launching = True
-            self.launch_start_time = pygame.time.get_ticks()
+            self.launch_start_time = self.sim_clock.get_ticks()
             self.balls_launched = 0
             self.blocks_destroyed_this_shot = 0
             
@@ -1763,7 +1773,206 @@ class Game:
             self.balls.append(ball)
             self.balls_launched += 1
         
+    def record_game_end(self):
+        """게임 종료 시 통계, 모드별 업적, 리플레이 저장"""
+        self.stats_manager.update_game_end(
+            self.score, self.round_num, self.blocks_destroyed_by_type,
+            self.combos_this_game, self.highest_combo_this_game,
+            self.powerups_used_this_game, self.bonus_balls_collected
+        )
+        
+        # 모드별 업적 체크
+        if self.mode_manager.current_mode == GAME_MODE_TIME_ATTACK:
+            self.achievement_manager.check_achievement('time_master', self.score)
+        elif self.mode_manager.current_mode == GAME_MODE_PUZZLE and self.mode_manager.is_game_complete(self):
+            self.achievement_manager.check_achievement('puzzle_solver', 1)
+        
+        # 높은 점수 시 리플레이 저장 (아니면 기록 파일 삭제, 점수 제출 시 이미 저장됨)
+        self.save_game_replay()
+    
+    def estimate_rank(self):
+        """게임 종료 점수의 전체 순위 (근사값을 바로 계산하고 정확한 순위는 백그라운드 조회)"""
+        self.rank_estimate = rank_service.estimate(self.score)
+        self.rank_future = rank_service.request_exact_rank(self.score)
+    
+    def save_game_replay(self, force=False):
+        """게임 종료 리플레이 저장 (force가 아니면 높은 점수일 때만, 저장 경로 반환)"""
+        if self.replay_path is None and self.replay_manager.recording:
+            if force or self.score >= REPLAY_SAVE_THRESHOLD:
+                self.replay_path = self.replay_manager.save_replay(
+                    f"replay_{int(time.time())}_{self.seed:08x}", self.score, self.round_num,
+                    self.player_name.strip(), self.sim_clock.get_ticks())
+            else:
+                self.replay_manager.stop_recording()
+        return self.replay_path
+    
+    def start_replay(self, replay_data):
+        """리플레이 재생 시작 (같은 시드와 모드로 게임을 다시 시작하고 기록된 입력을 재현)"""
+        self.mode_manager.set_mode(replay_data['mode'])
+        self.replay_manager.start_playback(replay_data)
+        self.achievement_manager.suspended = True
+        self.reset_game(seed=replay_data['seed'])
+        self.replay_watched = True
+        self.game_state = GAME_STATE_GAME
+        self.paused = False
+    
+    def finish_replay(self):
+        """리플레이 재생 종료 (결과 화면만 표시하고 점수는 저장하지 않음)"""
+        self.replay_manager.stop_playback()
+        self.achievement_manager.suspended = False
+        self.game_over = True
+        self.score_saved = True
+        self.name_entered = True
+        self.input_active = False
+    
+    def capture_keyframe(self):
+        """리플레이 키프레임용 게임 상태 (발사 직전, 이후 진행에 영향을 주는 값만 포함)"""
+        return {
+            'round': self.round_num,
+            'ball_count': self.ball_count,
+            'score': self.score,
+            'high_score': self.high_score,
+            'steps': self.sim_clock.steps,
+            'rng': self.rng.getstate(),
+            'launch_x': self.launch_x,
+            'launch_angle': self.launch_angle,
+            'last_ball_x': self.last_ball_x,
+            'blocks': [
+                [block.x, block.y, block.health, block.max_health, block.block_type, block.shield_hits, block.active]
+                for block in self.blocks
+            ],
+            'bonus_balls': [[bonus.x, bonus.y, bonus.active, bonus.collected] for bonus in self.bonus_balls],
+            'combo': [self.combo_count, self.combo_multiplier, self.last_block_color, self.last_combo_time,
+                      self.combo_display_time, self.combo_score_gained],
+            'stats': [dict(self.blocks_destroyed_by_type), self.combos_this_game, self.highest_combo_this_game,
+                      self.powerups_used_this_game, self.bonus_balls_collected],
+            'powerups': [key for key, active in self.active_powerups.items() if active],
+            'owned_items': [self.shop.items.index(item) for item in self.shop.owned_items],
+            'shop_score': self.shop.player_score,
+            'mode_data': dict(self.mode_manager.mode_data),
+            'theme': self.current_theme
+        }
+    
+    def restore_keyframe(self, state):
+        """리플레이 키프레임 상태 복원 (다음 update에서 키프레임 직후 발사부터 이어서 재현)"""
+        self.round_num = state['round']
+        self.ball_count = state['ball_count']
+        self.score = state['score']
+        self.high_score = state['high_score']
+        self.sim_clock.steps = state['steps']
+        version, internal, gauss_next = state['rng']
+        self.rng.setstate((version, tuple(internal), gauss_next))
+        self.launch_x = state['launch_x']
+        self.launch_angle = state['launch_angle']
+        self.last_ball_x = state['last_ball_x']
+        
+        self.blocks = []
+        for x, y, health, max_health, block_type, shield_hits, active in state['blocks']:
+            block = Block(x, y, health, block_type)
+            block.max_health = max_health
+            block.shield_hits = shield_hits
+            block.active = active
+            self.blocks.append(block)
+        self.bonus_balls = []
+        for x, y, active, collected in state['bonus_balls']:
+            bonus = BonusBall(x, y)
+            bonus.active = active
+            bonus.collected = collected
+            self.bonus_balls.append(bonus)
+        
+        (self.combo_count, self.combo_multiplier, last_block_color, self.last_combo_time,
+         self.combo_display_time, self.combo_score_gained) = state['combo']
+        self.last_block_color = tuple(last_block_color) if last_block_color is not None else None
+        (blocks_destroyed_by_type, self.combos_this_game, self.highest_combo_this_game,
+         self.powerups_used_this_game, self.bonus_balls_collected) = state['stats']
+        self.blocks_destroyed_by_type = dict(blocks_destroyed_by_type)
+        self.active_powerups = {key: key in state['powerups'] for key in (1, 2, 3)}
+        self.shop.open = False
+        self.shop.owned_items = [self.shop.items[index] for index in state['owned_items']]
+        self.shop.player_score = state['shop_score']
+        self.mode_manager.mode_data = dict(state['mode_data'])
+        self.current_theme = state['theme']
+        
+        # 발사 직전 상태: 진행 중인 공과 시각 효과 없음
+        self.balls = []
+        self.particles = []
+        self.balls_launched = 0
+        self.launching = False
+        self.round_in_progress = False
+        self.game_over = False
+    
+    def seek_replay(self, target_round):
+        """재생 중인 리플레이의 지정 라운드로 이동 (가장 가까운 이전 키프레임에서 헤드리스 재시뮬레이션)"""
+        replay_manager = self.replay_manager
+        if not replay_manager.playing:
+            return
+        last_round = replay_manager.replay_data.get('round') or target_round
+        target_round = max(1, min(target_round, last_round))
+        keyframe = replay_manager.find_keyframe(target_round)
+        
+        # 앞으로 이동하면서 현재 라운드가 키프레임보다 가까우면 현재 상태에서 계속 진행
+        if target_round >= self.round_num and (keyframe is None or keyframe['round'] <= self.round_num):
+            pass
+        elif keyframe is not None:
+            self.restore_keyframe(keyframe['state'])
+            replay_manager.current_shot_index = keyframe['shot']
+        else:
+            self.mode_manager.set_mode(replay_manager.replay_data['mode'])
+            self.reset_game(seed=replay_manager.replay_data['seed'])
+            self.replay_watched = True
+            replay_manager.current_shot_index = 0
+        
+        # 손상되었거나 끝나지 않는 리플레이로 화면이 멈추지 않도록 재시뮬레이션과 같은 틱 상한 적용
+        ticks = 0
+        while replay_manager.playing and self.round_num < target_round and not self.game_over:
+            if ticks >= REPLAY_MAX_TICKS:
+                print(f"리플레이 이동 중단: {REPLAY_MAX_TICKS}틱 안에 {target_round}라운드에 도달하지 못했습니다.")
+                replay_manager.stop_playback()
+                break
+            self.update()
+            ticks += 1
+    
+    def update_replay_speed(self, frame_start):
+        """배속 재생: 프레임당 추가 update 실행 (최대 배속은 프레임 예산 안에서 가능한 만큼)"""
+        speed = self.replay_manager.get_speed()
+        budget = REPLAY_MAX_SPEED_BUDGET / FPS
+        extra_ticks = 0
+        while self.replay_manager.playing and not self.paused and not self.game_over:
+            if speed and extra_ticks >= speed - 1:
+                break
+            if not speed and time.perf_counter() - frame_start >= budget:
+                break
+            self.update()
+            extra_ticks += 1
+    
+    def apply_replay_inputs(self):
+        """재생 중인 리플레이의 상점 구매와 발사 입력 적용 (update 틱마다 호출)"""
+        if self.game_over:
+            self.finish_replay()
+            return
+        shot = self.replay_manager.get_next_shot()
+        if shot is None:
+            if not self.round_in_progress:
+                self.finish_replay()
+            return
+        
+        if self.shop.open:
+            for index in shot[SHOT_PURCHASES]:
+                if self.shop.buy(self.shop.items[index]):
+                    self.score = self.shop.player_score
+            self.shop.open = False
+        
+        if not self.round_in_progress and self.sim_clock.steps >= shot[SHOT_TICK]:
+            self.launch_angle = shot[SHOT_ANGLE]
+            if self.launch_x != shot[SHOT_X]:
+                print(f"리플레이 불일치: 라운드 {shot[SHOT_ROUND]} 발사 위치 {self.launch_x} != {shot[SHOT_X]}")
+            self.start_launch()
+            self.replay_manager.advance_shot()
+        
     def update(self):
+        if self.replay_manager.playing:
+            self.apply_replay_inputs()
+            
         if self.shop.open:
             return
             
@@ -1771,9 +1980,13 @@ class Game:
             return
             
         if self.game_over or self.paused:
+            if self.game_over and self.rank_estimate is None and not self.replay_manager.playing and not self.replay_watched:
+                self.estimate_rank()
             return
             
-        current_time = pygame.time.get_ticks()
+        # 게임 시간은 실제로 진행되는 update 틱마다 일정하게 증가
+        self.sim_clock.advance()
+        current_time = self.sim_clock.get_ticks()
         
         # 자동 공 연속 발사 (연속 클릭하지 않아도 됨) - 슈퍼볼 모드에서는 스킵
         if (self.launching and self.balls_launched < self.ball_count and 
@@ -1789,9 +2002,13 @@ class Game:
             self.balls_launched += 1
             
         # 공 이동 및 충돌 처리
+        profiler = self.profiler
         for ball in self.balls[:]:
+            section_start = profiler.start()
             ball.move()
+            profiler.stop('update.physics', section_start)
             
+            section_start = profiler.start()
             # 블록과 충돌 검사
             for block in self.blocks[:]:  # 복사본을 사용하여 안전한 반복
                 if ball.bounce_block(block):
@@ -1817,6 +2034,7 @@ class Game:
                     self.bonus_balls_collected += 1  # 라운드 종료 후 적용
                     
             # 슈퍼볼 아이템 수집 코드 완전 삭제
+            profiler.stop('update.collision', section_start)
                     
         # 보너스 볼은 고정된 위치에 있으므로 이동하지 않음
             
@@ -1885,10 +2103,14 @@ class Game:
             self.active_powerups[3] = False
         
         # 콤보 시스템 업데이트
+        section_start = profiler.start()
         self.update_combo_system()
+        profiler.stop('update.combo_achievements', section_start)
         
         # 파티클 시스템 업데이트 (메모리 누수 방지)
+        section_start = profiler.start()
         self.update_particles()
+        profiler.stop('update.particles', section_start)
         
         # 게임 모드별 업데이트
         self.mode_manager.update(self)
@@ -1898,7 +2120,9 @@ class Game:
             self.game_over = True
         
         # 업적 알림 업데이트
+        section_start = profiler.start()
         self.achievement_manager.update_notifications()
+        profiler.stop('update.combo_achievements', section_start)
         
         # 메모리 정리 (파티클이 너무 많이 쌓이는 것 방지)
         if len(self.particles) > 500:
@@ -1959,7 +2183,7 @@ class Game:
     
     def update_combo_system(self):
         """콤보 시스템 업데이트"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.get_ticks()
         
         # 콤보 시간 초과 시 리셋
         if current_time - self.last_combo_time > COMBO_TIME_WINDOW:
@@ -2074,7 +2298,7 @@ class Game:
     
     def draw_combo_ui(self, screen):
         """콤보 UI 표시"""
-        current_time = pygame.time.get_ticks()
+        current_time = self.sim_clock.get_ticks()
         
         # 콤보가 활성화되어 있거나 표시 시간이 남아있는 경우
         if (self.combo_count >= MIN_COMBO_COUNT or 
@@ -2154,76 +2378,76 @@ class Game:
         
     def draw_ui(self):
         # 테마 색상 가져오기
-        theme_colors = self.theme_manager.get_theme_colors(self.current_theme)
+        theme_colors = self.palette
         
         # 상단 UI - 글래스모피즘 스타일
         ui_surface = pygame.Surface((SCREEN_WIDTH, TOP_UI_HEIGHT), pygame.SRCALPHA)
-        ui_surface.fill((*theme_colors['surface'], 200))  # 반투명 배경
+        ui_surface.fill((*theme_colors.surface, 200))  # 반투명 배경
         self.screen.blit(ui_surface, (0, 0))
         
         # 상단 테두리 (테마 액센트)
-        pygame.draw.line(self.screen, theme_colors['accent'], (0, TOP_UI_HEIGHT-1), (SCREEN_WIDTH, TOP_UI_HEIGHT-1), 2)
+        pygame.draw.line(self.screen, theme_colors.accent, (0, TOP_UI_HEIGHT-1), (SCREEN_WIDTH, TOP_UI_HEIGHT-1), 2)
         
         # 점수 카드 (왼쪽)
         score_card = pygame.Rect(15, 10, 150, 60)
-        pygame.draw.rect(self.screen, theme_colors['darker_surface'], score_card, border_radius=8)
-        pygame.draw.rect(self.screen, theme_colors['ball_color'], score_card, 1, border_radius=8)
+        pygame.draw.rect(self.screen, theme_colors.darker_surface, score_card, border_radius=8)
+        pygame.draw.rect(self.screen, theme_colors.ball_color, score_card, 1, border_radius=8)
         
         # 점수 텍스트
-        score_label = self.safe_render_text(self.small_font, "SCORE", theme_colors['text_secondary'])
-        score_value = self.safe_render_text(self.font, f"{self.score:,}", theme_colors['ball_color'])
+        score_label = self.safe_render_text(self.small_font, "SCORE", theme_colors.text_secondary)
+        score_value = self.safe_render_text(self.font, f"{self.score:,}", theme_colors.ball_color)
         self.screen.blit(score_label, (25, 20))
         self.screen.blit(score_value, (25, 40))
         
         # 베스트 스코어 (작게)
         if self.high_score > 0:
-            best_text = self.safe_render_text(self.small_font, f"BEST: {self.high_score:,}", theme_colors['text_secondary'])
+            best_text = self.safe_render_text(self.small_font, f"BEST: {self.high_score:,}", theme_colors.text_secondary)
             self.screen.blit(best_text, (180, 25))
         
         # 라운드/모드 정보 카드 (오른쪽)
         info_card = pygame.Rect(SCREEN_WIDTH - 100, 10, 85, 60)
-        pygame.draw.rect(self.screen, theme_colors['darker_surface'], info_card, border_radius=8)
-        pygame.draw.rect(self.screen, theme_colors['accent'], info_card, 1, border_radius=8)
+        pygame.draw.rect(self.screen, theme_colors.darker_surface, info_card, border_radius=8)
+        pygame.draw.rect(self.screen, theme_colors.accent, info_card, 1, border_radius=8)
         
         # 모드별 정보 표시
         if self.mode_manager.current_mode == GAME_MODE_TIME_ATTACK:
             time_left = self.mode_manager.mode_data.get('time_left', 0)
-            info_label = self.safe_render_text(self.small_font, "TIME", theme_colors['text_secondary'])
-            info_value = self.safe_render_text(self.font, f"{int(time_left)}", theme_colors['accent'])
+            info_label = self.safe_render_text(self.small_font, "TIME", theme_colors.text_secondary)
+            info_value = self.safe_render_text(self.font, f"{int(time_left)}", theme_colors.accent)
         elif self.mode_manager.current_mode == GAME_MODE_PUZZLE:
             balls_left = self.mode_manager.mode_data.get('balls_left', 0)
-            info_label = self.safe_render_text(self.small_font, "BALLS", theme_colors['text_secondary'])
-            info_value = self.safe_render_text(self.font, f"{balls_left}", theme_colors['accent'])
+            info_label = self.safe_render_text(self.small_font, "BALLS", theme_colors.text_secondary)
+            info_value = self.safe_render_text(self.font, f"{balls_left}", theme_colors.accent)
         elif self.mode_manager.current_mode == GAME_MODE_SURVIVAL:
             speed = self.mode_manager.mode_data.get('speed_multiplier', 1.0)
-            info_label = self.safe_render_text(self.small_font, "SPEED", theme_colors['text_secondary'])
-            info_value = self.safe_render_text(self.font, f"{speed:.1f}x", theme_colors['accent'])
+            info_label = self.safe_render_text(self.small_font, "SPEED", theme_colors.text_secondary)
+            info_value = self.safe_render_text(self.font, f"{speed:.1f}x", theme_colors.accent)
         else:  # 클래식 모드
-            info_label = self.safe_render_text(self.small_font, "ROUND", theme_colors['text_secondary'])
-            info_value = self.safe_render_text(self.font, f"{self.round_num}", theme_colors['accent'])
+            info_label = self.safe_render_text(self.small_font, "ROUND", theme_colors.text_secondary)
+            info_value = self.safe_render_text(self.font, f"{self.round_num}", theme_colors.accent)
         
         self.screen.blit(info_label, (SCREEN_WIDTH - 90, 20))
         self.screen.blit(info_value, (SCREEN_WIDTH - 75, 40))
         
         # 하단 UI - 글래스모피즘 스타일
         bottom_surface = pygame.Surface((SCREEN_WIDTH, BOTTOM_UI_HEIGHT), pygame.SRCALPHA)
-        bottom_surface.fill((*theme_colors['surface'], 200))
+        bottom_surface.fill((*theme_colors.surface, 200))
         self.screen.blit(bottom_surface, (0, SCREEN_HEIGHT - BOTTOM_UI_HEIGHT))
         
         # 하단 테두리
-        pygame.draw.line(self.screen, theme_colors['accent'], (0, SCREEN_HEIGHT - BOTTOM_UI_HEIGHT), 
+        pygame.draw.line(self.screen, theme_colors.accent, (0, SCREEN_HEIGHT - BOTTOM_UI_HEIGHT), 
                         (SCREEN_WIDTH, SCREEN_HEIGHT - BOTTOM_UI_HEIGHT), 2)
         
         # 공 개수 표시 (중앙, 더 큰 스타일)
         ball_bg = pygame.Rect(SCREEN_WIDTH//2 - 60, SCREEN_HEIGHT - 80, 120, 50)
-        pygame.draw.rect(self.screen, theme_colors['darker_surface'], ball_bg, border_radius=25)
-        pygame.draw.rect(self.screen, theme_colors['ball_color'], ball_bg, 2, border_radius=25)
+        pygame.draw.rect(self.screen, theme_colors.darker_surface, ball_bg, border_radius=25)
+        pygame.draw.rect(self.screen, theme_colors.ball_color, ball_bg, 2, border_radius=25)
         
         # 공 아이콘 (원형)
-        pygame.draw.circle(self.screen, theme_colors['ball_color'], (SCREEN_WIDTH//2 - 30, SCREEN_HEIGHT - 55), 8)
-        pygame.draw.circle(self.screen, theme_colors['text'], (SCREEN_WIDTH//2 - 30, SCREEN_HEIGHT - 55), 8, 2)
+        pygame.draw.circle(self.screen, theme_colors.ball_color, (SCREEN_WIDTH//2 - 30, SCREEN_HEIGHT - 55), 8)
+        pygame.draw.circle(self.screen, theme_colors.text, (SCREEN_WIDTH//2 - 30, SCREEN_HEIGHT - 55), 8, 2)
         
-        ball_count_text = self.safe_render_text(self.font, f"×{self.ball_count}", theme_colors['text'])
+        ball_count_text = self.safe_render_text(self.font, f"×{self.ball_count}", theme_colors.text)
         text_rect = ball_count_text.get_rect()
         text_rect.center = (SCREEN_WIDTH//2 + 10, SCREEN_HEIGHT - 55)
         self.screen.blit(ball_count_text, text_rect)
@@ -2246,7 +2470,9 @@ class Game:
         
     def draw(self):
         # 테마에 따른 배경
+        section_start = self.profiler.start()
         self.draw_themed_background(self.screen)
+        self.profiler.stop('draw.background', section_start)
         
         if self.game_state == GAME_STATE_TITLE:
             self.draw_title()
@@ -2262,6 +2488,9 @@ class Game:
             self.draw_mode_select()
         elif self.game_state == GAME_STATE_ACHIEVEMENTS:
             self.draw_achievements()
+        
+        # 성능 HUD는 모든 화면 위에 표시
+        self.hud.draw(self.screen, self)
             
         pygame.display.flip()
         
@@ -2350,27 +2579,38 @@ class Game:
         self.screen.blit(control_text, control_rect)
         
     def draw_game(self):
+        profiler = self.profiler
+        
         # UI 그리기
+        section_start = profiler.start()
         self.draw_ui()
+        profiler.stop('draw.ui', section_start)
         
         # 블록 그리기
+        section_start = profiler.start()
         for block in self.blocks:
             block.draw(self.screen)
             
         # 보너스 볼 그리기
         for bonus in self.bonus_balls:
             bonus.draw(self.screen)
+        profiler.stop('draw.blocks', section_start)
             
         # 슈퍼볼 아이템 그리기 코드 삭제
             
         # 공 그리기
+        section_start = profiler.start()
         for ball in self.balls:
             ball.draw(self.screen)
+        profiler.stop('draw.balls', section_start)
         
         # 파티클 그리기
+        section_start = profiler.start()
         for particle in self.particles:
             particle.draw(self.screen)
+        profiler.stop('draw.particles', section_start)
             
+        section_start = profiler.start()
         # 조준선 그리기
         self.draw_aim_line()
         
@@ -2379,11 +2619,15 @@ class Game:
         
         # 업적 알림 그리기
         self.draw_achievement_notifications()
+        profiler.stop('draw.ui', section_start)
         
         # 상점 그리기
         if self.shop.open:
+            section_start = profiler.start()
             self.shop.draw(self.screen)
+            profiler.stop('draw.shop', section_start)
         
+        section_start = profiler.start()
         # 일시정지 화면
         if self.paused:
             self.draw_pause_menu()
@@ -2419,6 +2663,19 @@ class Game:
             self.screen.blit(score_label, score_label_rect)
             self.screen.blit(score_value, score_value_rect)
             
+            # 전체 게임 대비 순위 (정확한 순위가 오기 전에는 근사 순위에 ~ 표시)
+            if self.rank_estimate is not None and self.rank_estimate['total'] > 0:
+                if self.rank_future is not None and self.rank_future.done():
+                    rank, below, total = self.rank_future.result()
+                    percentile = below * 100 / total if total else 0.0
+                    rank_label = f"#{rank:,}"
+                else:
+                    percentile = self.rank_estimate['percentile']
+                    rank_label = f"#~{self.rank_estimate['rank']:,}"
+                rank_text = self.safe_render_text(self.small_font, f"Beat {percentile:.1f}% of games • {rank_label}", NEON_YELLOW)
+                rank_rect = rank_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 128))
+                self.screen.blit(rank_text, rank_rect)
+            
             # 이름 입력 또는 저장 완료 상태에 따른 메시지
             if not self.name_entered and not self.score_saved:
                 name_prompt_text = self.font.render("Enter your name:", True, WHITE)
@@ -2447,9 +2704,15 @@ class Game:
                 self.screen.blit(confirm_text, confirm_rect)
                 
             elif self.score_saved:
-                # 저장 완료 메시지
-                saved_icon = "✓"
-                saved_text = self.font.render(f"{saved_icon} Score Saved!", True, NEON_GREEN)
+                # 저장 완료 메시지 (쓰기 큐 처리 중이면 저장 중 표시)
+                if self.score_future is not None and not self.score_future.done():
+                    saved_text = self.font.render("Saving...", True, TEXT_SECONDARY)
+                elif self.score_future is not None and \
+                        (self.score_future.exception() is not None or not self.score_future.result()):
+                    saved_text = self.font.render("Save Failed", True, ORANGE)
+                else:
+                    saved_icon = "✓"
+                    saved_text = self.font.render(f"{saved_icon} Score Saved!", True, NEON_GREEN)
                 saved_rect = saved_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 20))
                 self.screen.blit(saved_text, saved_rect)
                 
@@ -2481,6 +2744,22 @@ class Game:
             self.screen.blit(help_text2, help_rect2)
             
             # 슈퍼볼 도움말 삭제
+        
+        if self.replay_manager.playing:
+            self.draw_replay_overlay()
+        
+        profiler.stop('draw.ui', section_start)
+            
+    def draw_replay_overlay(self):
+        """리플레이 재생 정보 (배속, 라운드, 조작법)"""
+        speed = self.replay_manager.get_speed()
+        speed_text = f"{speed}x" if speed else "MAX"
+        last_round = self.replay_manager.replay_data.get('round') or '?'
+        status = self.safe_render_text(self.small_font, f"REPLAY {speed_text}  R{self.round_num}/{last_round}", self.palette.ball_color)
+        controls = self.safe_render_text(self.small_font, "TAB: Speed • Left/Right: Round • PgUp/PgDn: -/+10", self.palette.text_secondary)
+        y = SCREEN_HEIGHT - BOTTOM_UI_HEIGHT - status.get_height() - controls.get_height() - 8
+        self.screen.blit(status, (15, y))
+        self.screen.blit(controls, (15, y + status.get_height()))
             
     def draw_settings(self):
         # 다크 그라데이션 배경
@@ -2597,40 +2876,38 @@ class Game:
         pygame.draw.rect(self.screen, NEON_YELLOW, ranking_card, 3, border_radius=20)
         
         # 제목 (트로피 이모지와 네온 효과)
-        try:
-            if self.current_font_path:
-                title_font = pygame.font.Font(self.current_font_path, 36)
-            else:
-                title_font = self.large_font
-        except:
-            title_font = self.large_font
-        title_text = self.safe_render_text(title_font, "🏆 " + get_text('ranking_title'), NEON_YELLOW)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 80))
+        title_text = self.safe_render_text(self.ranking_title_font, "🏆 " + get_text('ranking_title'), NEON_YELLOW)
+        title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 68))
         self.screen.blit(title_text, title_rect)
         
-        # 데이터베이스에서 랭킹 가져오기
-        rankings = self.get_rankings(8)  # 화면에 맞게 8개로 제한
+        # 기간 탭 (선택된 탭 강조)
+        tab_width = (SCREEN_WIDTH - 60) // len(LEADERBOARD_PERIODS)
+        for index, period in enumerate(LEADERBOARD_PERIODS):
+            tab_rect = pygame.Rect(30 + index * tab_width, 86, tab_width - 4, 20)
+            selected = index == self.ranking_period
+            if selected:
+                pygame.draw.rect(self.screen, DARK_SURFACE, tab_rect, border_radius=6)
+                pygame.draw.rect(self.screen, NEON_YELLOW, tab_rect, 1, border_radius=6)
+            tab_text = self.safe_render_text(self.ranking_tab_font, LEADERBOARD_PERIOD_LABELS[period],
+                                             NEON_YELLOW if selected else TEXT_SECONDARY)
+            self.screen.blit(tab_text, tab_text.get_rect(center=tab_rect.center))
+        
+        # 현재 스크롤 위치의 랭킹 가져오기 (전체 탭은 다음 페이지를 미리 읽어 둠)
+        rankings = self.get_ranking_rows(self.ranking_scroll, LEADERBOARD_VISIBLE_ROWS)
         
         if rankings:
             # 헤더 카드
             header_card = pygame.Rect(30, 110, SCREEN_WIDTH - 60, 30)
             pygame.draw.rect(self.screen, DARK_SURFACE, header_card, border_radius=8)
             
-            try:
-                if self.current_font_path:
-                    header_font = pygame.font.Font(self.current_font_path, 16)
-                else:
-                    header_font = self.small_font
-            except:
-                header_font = self.small_font
-            
-            header_text = header_font.render("RANK  PLAYER    SCORE   ROUND", True, TEXT_SECONDARY)
+            header_text = self.safe_render_text(self.ranking_header_font, "RANK  PLAYER    SCORE   ROUND", TEXT_SECONDARY)
             header_rect = header_text.get_rect(center=(SCREEN_WIDTH//2, 125))
             self.screen.blit(header_text, header_rect)
             
             # 랭킹 목록 (카드 스타일)
-            for i, (name, score, round_reached, balls_count, play_date) in enumerate(rankings):
-                y = 155 + i * 55
+            for row, (name, score, round_reached, balls_count, play_date) in enumerate(rankings):
+                i = self.ranking_scroll + row  # 전체 순위 (0부터)
+                y = 155 + row * 55
                 
                 # 랭킹 카드
                 rank_card = pygame.Rect(30, y, SCREEN_WIDTH - 60, 45)
@@ -2656,97 +2933,72 @@ class Game:
                     pygame.draw.rect(self.screen, DARK_GRAY, rank_card, 1, border_radius=10)
                     text_color = WHITE
                     rank_icon = f"{i+1}"
-                
-                try:
-                    if self.current_font_path:
-                        rank_font = pygame.font.Font(self.current_font_path, 18)
-                    else:
-                        rank_font = self.small_font
-                except:
-                    rank_font = self.small_font
+                rank_font = self.ranking_row_font
                 
                 # 순위 표시
-                rank_text = rank_font.render(rank_icon, True, text_color)
+                rank_text = self.safe_render_text(rank_font, rank_icon, text_color)
                 self.screen.blit(rank_text, (45, y + 5))
                 
                 # 플레이어 이름
-                name_text = rank_font.render(name[:8], True, text_color)
+                name_text = self.safe_render_text(rank_font, name[:8], text_color)
                 self.screen.blit(name_text, (80, y + 5))
                 
                 # 점수 (강조)
-                score_text = rank_font.render(f"{score:,}", True, NEON_CYAN)
+                score_text = self.safe_render_text(rank_font, f"{score:,}", NEON_CYAN)
                 score_rect = score_text.get_rect()
                 score_rect.right = SCREEN_WIDTH - 120
                 score_rect.y = y + 5
                 self.screen.blit(score_text, score_rect)
                 
                 # 라운드
-                round_text = rank_font.render(f"R{round_reached}", True, text_color)
+                round_text = self.safe_render_text(rank_font, f"R{round_reached}", text_color)
                 round_rect = round_text.get_rect()
                 round_rect.right = SCREEN_WIDTH - 50
                 round_rect.y = y + 5
                 self.screen.blit(round_text, round_rect)
                 
                 # 날짜 (작게)
-                try:
-                    if self.current_font_path:
-                        date_font = pygame.font.Font(self.current_font_path, 12)
-                    else:
-                        date_font = pygame.font.Font(None, 14)
-                except:
-                    date_font = pygame.font.Font(None, 14)
-                
                 date_str = play_date.split()[0] if play_date else ""
-                date_text = date_font.render(date_str, True, TEXT_SECONDARY)
+                date_text = self.safe_render_text(self.ranking_date_font, date_str, TEXT_SECONDARY)
                 self.screen.blit(date_text, (80, y + 25))
+            
+            # 스크롤 위치 표시
+            first = self.ranking_scroll + 1
+            last = self.ranking_scroll + len(rankings)
+            all_tab = LEADERBOARD_PERIODS[self.ranking_period] == LEADERBOARD_PERIOD_ALL
+            more = "..." if all_tab and self.leaderboard_pager.loading() else ""
+            scroll_text = self.safe_render_text(self.ranking_info_font,
+                                                f"#{first}-{last}{more}  Up/Down PgUp/PgDn  Left/Right: Tab", TEXT_SECONDARY)
+            scroll_rect = scroll_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 90))
+            self.screen.blit(scroll_text, scroll_rect)
         else:
             # 랭킹이 없을 때
             empty_card = pygame.Rect(40, SCREEN_HEIGHT//2 - 40, SCREEN_WIDTH - 80, 80)
             pygame.draw.rect(self.screen, DARK_SURFACE, empty_card, border_radius=12)
             pygame.draw.rect(self.screen, TEXT_SECONDARY, empty_card, 1, border_radius=12)
             
-            try:
-                if self.current_font_path:
-                    no_rank_font = pygame.font.Font(self.current_font_path, 20)
-                else:
-                    no_rank_font = self.font
-            except:
-                no_rank_font = self.font
-            
-            no_rank_text = no_rank_font.render("No scores yet", True, TEXT_SECONDARY)
+            no_rank_text = self.safe_render_text(self.ranking_empty_font, "No scores yet", TEXT_SECONDARY)
             no_rank_rect = no_rank_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
             self.screen.blit(no_rank_text, no_rank_rect)
         
         # 통계 정보 (하단 카드)
-        stats = db_manager.get_database_stats()
+        if self.ranking_stats is None:
+            self.ranking_stats = db_manager.get_database_stats()
+        stats = self.ranking_stats
         if stats['total_games'] > 0:
             stats_card = pygame.Rect(30, SCREEN_HEIGHT - 70, SCREEN_WIDTH - 60, 40)
             pygame.draw.rect(self.screen, DARK_SURFACE, stats_card, border_radius=10)
             
-            try:
-                if self.current_font_path:
-                    stats_font = pygame.font.Font(self.current_font_path, 14)
-                else:
-                    stats_font = pygame.font.Font(None, 16)
-            except:
-                stats_font = pygame.font.Font(None, 16)
-            
-            stats_text = stats_font.render(
-                f"Total Games: {stats['total_games']} • Avg Score: {stats['average_score']}", 
-                True, TEXT_SECONDARY
+            stats_text = self.safe_render_text(
+                self.ranking_info_font,
+                f"Total Games: {stats['total_games']} • Avg Score: {stats['average_score']}",
+                TEXT_SECONDARY
             )
             stats_rect = stats_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
             self.screen.blit(stats_text, stats_rect)
         
         # 돌아가기 안내
-        try:
-            if self.current_font_path:
-                back_font = pygame.font.Font(self.current_font_path, 16)
-            else:
-                back_font = self.small_font
-        except:
-            back_font = self.small_font
-        back_text = back_font.render("ESC: " + get_text('back_to_title'), True, TEXT_SECONDARY)
+        back_text = self.safe_render_text(self.ranking_header_font, "ESC: " + get_text('back_to_title'), TEXT_SECONDARY)
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 20))
         self.screen.blit(back_text, back_rect)
     
@@ -2759,12 +3011,12 @@ class Game:
         
         # 일시정지 카드
         pause_card = pygame.Rect(50, SCREEN_HEIGHT//2 - 120, SCREEN_WIDTH - 100, 240)
-        theme_colors = self.theme_manager.get_theme_colors(self.current_theme)
-        pygame.draw.rect(self.screen, theme_colors['darker_surface'], pause_card, border_radius=20)
-        pygame.draw.rect(self.screen, theme_colors['accent'], pause_card, 3, border_radius=20)
+        theme_colors = self.palette
+        pygame.draw.rect(self.screen, theme_colors.darker_surface, pause_card, border_radius=20)
+        pygame.draw.rect(self.screen, theme_colors.accent, pause_card, 3, border_radius=20)
         
         # 일시정지 타이틀
-        pause_title = self.safe_render_text(self.large_font, "⏸️ PAUSED", theme_colors['accent'])
+        pause_title = self.safe_render_text(self.large_font, "⏸️ PAUSED", theme_colors.accent)
         pause_rect = pause_title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 80))
         self.screen.blit(pause_title, pause_rect)
         
@@ -2776,15 +3028,15 @@ class Game:
             
             if i == self.pause_menu_selected:
                 # 선택된 옵션
-                option_surface = self.safe_render_text(self.font, f"▶ {option}", theme_colors['accent'])
+                option_surface = self.safe_render_text(self.font, f"▶ {option}", theme_colors.accent)
             else:
-                option_surface = self.safe_render_text(self.font, option, theme_colors['text'])
+                option_surface = self.safe_render_text(self.font, option, theme_colors.text)
             
             option_rect = option_surface.get_rect(center=(SCREEN_WIDTH//2, y))
             self.screen.blit(option_surface, option_rect)
         
         # 조작 안내
-        help_text = self.safe_render_text(self.small_font, "↑↓: Select • ENTER: Confirm • ESC: Resume", theme_colors['text_secondary'])
+        help_text = self.safe_render_text(self.small_font, "↑↓: Select • ENTER: Confirm • ESC: Resume", theme_colors.text_secondary)
         help_rect = help_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 90))
         self.screen.blit(help_text, help_rect)
     
@@ -2793,15 +3045,15 @@ class Game:
         # 테마 배경
         self.draw_themed_background(self.screen)
         
-        theme_colors = self.theme_manager.get_theme_colors(self.current_theme)
+        theme_colors = self.palette
         
         # 통계 메인 카드
         stats_card = pygame.Rect(20, 50, SCREEN_WIDTH - 40, SCREEN_HEIGHT - 100)
-        pygame.draw.rect(self.screen, theme_colors['darker_surface'], stats_card, border_radius=20)
-        pygame.draw.rect(self.screen, theme_colors['accent'], stats_card, 3, border_radius=20)
+        pygame.draw.rect(self.screen, theme_colors.darker_surface, stats_card, border_radius=20)
+        pygame.draw.rect(self.screen, theme_colors.accent, stats_card, 3, border_radius=20)
         
         # 제목
-        title_text = self.safe_render_text(self.large_font, "📊 STATISTICS", theme_colors['accent'])
+        title_text = self.safe_render_text(self.large_font, "📊 STATISTICS", theme_colors.accent)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 90))
         self.screen.blit(title_text, title_rect)
         
@@ -2827,20 +3079,20 @@ class Game:
             y = 140 + row * 35
             
             # 라벨
-            label_surface = self.safe_render_text(self.small_font, label + ":", theme_colors['text_secondary'])
+            label_surface = self.safe_render_text(self.small_font, label + ":", theme_colors.text_secondary)
             self.screen.blit(label_surface, (x, y))
             
             # 값
-            value_surface = self.safe_render_text(self.font, value, theme_colors['text'])
+            value_surface = self.safe_render_text(self.font, value, theme_colors.text)
             self.screen.blit(value_surface, (x, y + 15))
         
         # 블록별 파괴 통계
         block_stats_y = 480
-        block_title = self.safe_render_text(self.font, "Blocks Destroyed by Type:", theme_colors['text'])
+        block_title = self.safe_render_text(self.font, "Blocks Destroyed by Type:", theme_colors.text)
         self.screen.blit(block_title, (40, block_stats_y))
         
         block_types = [
-            ("Normal", self.stats_manager.stats['blocks_destroyed']['normal'], theme_colors['text']),
+            ("Normal", self.stats_manager.stats['blocks_destroyed']['normal'], theme_colors.text),
             ("Bomb", self.stats_manager.stats['blocks_destroyed']['bomb'], (255, 69, 0)),
             ("Shield", self.stats_manager.stats['blocks_destroyed']['shield'], (70, 130, 180)),
             ("Ghost", self.stats_manager.stats['blocks_destroyed']['ghost'], (147, 112, 219))
@@ -2853,17 +3105,17 @@ class Game:
             # 블록 타입 아이콘 (작은 사각형)
             block_rect = pygame.Rect(x, y, 20, 20)
             pygame.draw.rect(self.screen, color, block_rect, border_radius=4)
-            pygame.draw.rect(self.screen, theme_colors['text'], block_rect, 1, border_radius=4)
+            pygame.draw.rect(self.screen, theme_colors.text, block_rect, 1, border_radius=4)
             
             # 타입명과 개수
-            type_text = self.safe_render_text(self.small_font, block_type, theme_colors['text_secondary'])
-            count_text = self.safe_render_text(self.small_font, str(count), theme_colors['text'])
+            type_text = self.safe_render_text(self.small_font, block_type, theme_colors.text_secondary)
+            count_text = self.safe_render_text(self.small_font, str(count), theme_colors.text)
             
             self.screen.blit(type_text, (x + 25, y))
             self.screen.blit(count_text, (x + 25, y + 12))
         
         # 뒤로가기 안내
-        back_text = self.safe_render_text(self.small_font, "ESC: Back to Menu", theme_colors['text_secondary'])
+        back_text = self.safe_render_text(self.small_font, "ESC: Back to Menu", theme_colors.text_secondary)
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 30))
         self.screen.blit(back_text, back_rect)
     
@@ -2872,15 +3124,15 @@ class Game:
         # 테마 배경
         self.draw_themed_background(self.screen)
         
-        theme_colors = self.theme_manager.get_theme_colors(self.current_theme)
+        theme_colors = self.palette
         
         # 모드 선택 메인 카드
         mode_card = pygame.Rect(20, 50, SCREEN_WIDTH - 40, SCREEN_HEIGHT - 100)
-        pygame.draw.rect(self.screen, theme_colors['darker_surface'], mode_card, border_radius=20)
-        pygame.draw.rect(self.screen, theme_colors['accent'], mode_card, 3, border_radius=20)
+        pygame.draw.rect(self.screen, theme_colors.darker_surface, mode_card, border_radius=20)
+        pygame.draw.rect(self.screen, theme_colors.accent, mode_card, 3, border_radius=20)
         
         # 제목
-        title_text = self.safe_render_text(self.large_font, "🎯 CHALLENGE MODES", theme_colors['accent'])
+        title_text = self.safe_render_text(self.large_font, "🎯 CHALLENGE MODES", theme_colors.accent)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 90))
         self.screen.blit(title_text, title_rect)
         
@@ -2900,19 +3152,19 @@ class Game:
             
             if i == self.mode_select_index:
                 # 선택된 모드
-                pygame.draw.rect(self.screen, theme_colors['surface'], mode_item_card, border_radius=12)
-                pygame.draw.rect(self.screen, theme_colors['accent'], mode_item_card, 2, border_radius=12)
-                name_color = theme_colors['accent']
-                desc_color = theme_colors['text']
+                pygame.draw.rect(self.screen, theme_colors.surface, mode_item_card, border_radius=12)
+                pygame.draw.rect(self.screen, theme_colors.accent, mode_item_card, 2, border_radius=12)
+                name_color = theme_colors.accent
+                desc_color = theme_colors.text
                 
                 # 선택 인디케이터
                 indicator = pygame.Rect(45, y - 30, 4, 70)
-                pygame.draw.rect(self.screen, theme_colors['accent'], indicator, border_radius=2)
+                pygame.draw.rect(self.screen, theme_colors.accent, indicator, border_radius=2)
             else:
-                pygame.draw.rect(self.screen, theme_colors['darker_surface'], mode_item_card, border_radius=12)
-                pygame.draw.rect(self.screen, theme_colors['text_secondary'], mode_item_card, 1, border_radius=12)
-                name_color = theme_colors['text']
-                desc_color = theme_colors['text_secondary']
+                pygame.draw.rect(self.screen, theme_colors.darker_surface, mode_item_card, border_radius=12)
+                pygame.draw.rect(self.screen, theme_colors.text_secondary, mode_item_card, 1, border_radius=12)
+                name_color = theme_colors.text
+                desc_color = theme_colors.text_secondary
             
             # 모드 이름
             name_surface = self.safe_render_text(self.font, mode_name, name_color)
@@ -2925,7 +3177,7 @@ class Game:
             self.screen.blit(desc_surface, desc_rect)
         
         # 조작 안내
-        help_text = self.safe_render_text(self.small_font, "↑↓: Select • ENTER: Start • ESC: Back", theme_colors['text_secondary'])
+        help_text = self.safe_render_text(self.small_font, "↑↓: Select • ENTER: Start • ESC: Back", theme_colors.text_secondary)
         help_rect = help_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 30))
         self.screen.blit(help_text, help_rect)
     
@@ -2934,22 +3186,22 @@ class Game:
         # 테마 배경
         self.draw_themed_background(self.screen)
         
-        theme_colors = self.theme_manager.get_theme_colors(self.current_theme)
+        theme_colors = self.palette
         
         # 업적 메인 카드
         achievement_card = pygame.Rect(20, 50, SCREEN_WIDTH - 40, SCREEN_HEIGHT - 100)
-        pygame.draw.rect(self.screen, theme_colors['darker_surface'], achievement_card, border_radius=20)
-        pygame.draw.rect(self.screen, theme_colors['accent'], achievement_card, 3, border_radius=20)
+        pygame.draw.rect(self.screen, theme_colors.darker_surface, achievement_card, border_radius=20)
+        pygame.draw.rect(self.screen, theme_colors.accent, achievement_card, 3, border_radius=20)
         
         # 제목과 진행률
-        title_text = self.safe_render_text(self.large_font, "🏆 ACHIEVEMENTS", theme_colors['accent'])
+        title_text = self.safe_render_text(self.large_font, "🏆 ACHIEVEMENTS", theme_colors.accent)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH//2, 80))
         self.screen.blit(title_text, title_rect)
         
         # 진행률 표시
         completion = self.achievement_manager.get_completion_percentage()
         progress_text = f"{self.achievement_manager.get_unlocked_count()}/{self.achievement_manager.get_total_count()} ({completion:.0f}%)"
-        progress_surface = self.safe_render_text(self.small_font, progress_text, theme_colors['text_secondary'])
+        progress_surface = self.safe_render_text(self.small_font, progress_text, theme_colors.text_secondary)
         progress_rect = progress_surface.get_rect(center=(SCREEN_WIDTH//2, 105))
         self.screen.blit(progress_surface, progress_rect)
         
@@ -2968,18 +3220,18 @@ class Game:
             
             if achievement['unlocked']:
                 # 달성된 업적
-                pygame.draw.rect(self.screen, theme_colors['surface'], achievement_item_rect, border_radius=8)
+                pygame.draw.rect(self.screen, theme_colors.surface, achievement_item_rect, border_radius=8)
                 pygame.draw.rect(self.screen, NEON_GREEN, achievement_item_rect, 2, border_radius=8)
                 name_color = NEON_GREEN
-                desc_color = theme_colors['text']
+                desc_color = theme_colors.text
                 progress_color = NEON_GREEN
             else:
                 # 미달성 업적
-                pygame.draw.rect(self.screen, theme_colors['darker_surface'], achievement_item_rect, border_radius=8)
-                pygame.draw.rect(self.screen, theme_colors['text_secondary'], achievement_item_rect, 1, border_radius=8)
-                name_color = theme_colors['text_secondary']
-                desc_color = theme_colors['text_secondary']
-                progress_color = theme_colors['text_secondary']
+                pygame.draw.rect(self.screen, theme_colors.darker_surface, achievement_item_rect, border_radius=8)
+                pygame.draw.rect(self.screen, theme_colors.text_secondary, achievement_item_rect, 1, border_radius=8)
+                name_color = theme_colors.text_secondary
+                desc_color = theme_colors.text_secondary
+                progress_color = theme_colors.text_secondary
             
             # 업적 아이콘과 이름
             icon_name = f"{achievement['icon']} {achievement['name']}"
@@ -3000,7 +3252,7 @@ class Game:
                 self.screen.blit(progress_surface, progress_rect)
         
         # 뒤로가기 안내
-        back_text = self.safe_render_text(self.small_font, "ESC: Back to Menu", theme_colors['text_secondary'])
+        back_text = self.safe_render_text(self.small_font, "ESC: Back to Menu", theme_colors.text_secondary)
         back_rect = back_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 30))
         self.screen.blit(back_text, back_rect)
     
@@ -3009,7 +3261,7 @@ class Game:
         if not self.achievement_manager.notifications:
             return
         
-        theme_colors = self.theme_manager.get_theme_colors(self.current_theme)
+        theme_colors = self.palette
         current_time = pygame.time.get_ticks()
         
         for i, notification in enumerate(self.achievement_manager.notifications):
@@ -3023,6 +3275,8 @@ class Game:
                 alpha = int(255 * ((notification['duration'] - elapsed) / 500))
             else:
                 alpha = 255
+            # 만료 직후 정리되기 전 프레임에서 음수가 되지 않도록 제한
+            alpha = max(0, min(255, alpha))
             
             # 알림 위치 (여러 개일 경우 위로 쌓임)
             y = 200 + i * 80
@@ -3052,12 +3306,74 @@ class Game:
             desc_rect = desc_surface.get_rect(center=(SCREEN_WIDTH//2, y + 55))
             self.screen.blit(desc_surface, desc_rect)
         
+    def is_idle_screen(self):
+        """게임 진행이 없는 대기 화면인지 여부 (메뉴 화면 또는 일시정지)"""
+        if self.game_state == GAME_STATE_GAME:
+            return self.paused
+        return self.game_state in (
+            GAME_STATE_TITLE, GAME_STATE_SETTINGS, GAME_STATE_RANKING,
+            GAME_STATE_STATISTICS, GAME_STATE_MODE_SELECT, GAME_STATE_ACHIEVEMENTS
+        )
+    
+    def get_idle_redraw_interval(self):
+        """대기 화면의 다시 그리기 간격 (밀리세컨드)"""
+        # 설정/랭킹 화면은 자체 배경으로 전체를 덮으므로 애니메이션이 없음
+        if self.game_state in (GAME_STATE_SETTINGS, GAME_STATE_RANKING):
+            return IDLE_STATIC_REDRAW_INTERVAL
+        # 타이틀 파티클이나 테마 장식이 움직이는 화면은 낮은 프레임레이트로 갱신
+        if self.game_state == GAME_STATE_TITLE or self.current_theme in ANIMATED_THEMES:
+            return 1000 // IDLE_FPS
+        return IDLE_STATIC_REDRAW_INTERVAL
+    
+    def wait_idle_events(self, timeout):
+        """입력이 오거나 다음 애니메이션 프레임이 될 때까지 블로킹 대기"""
+        event = pygame.event.wait(max(1, timeout))
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+        
     def run(self):
         running = True
+        last_draw_time = 0
         while running:
+            if self.is_idle_screen():
+                # 대기 화면: 바쁜 루프 대신 이벤트 대기, 입력 또는 애니메이션 시점에만 그리기
+                interval = self.get_idle_redraw_interval()
+                events = self.wait_idle_events(interval - (pygame.time.get_ticks() - last_draw_time))
+                running = self.handle_events(events)
+                update_start = time.perf_counter()
+                self.update()
+                draw_start = time.perf_counter()
+                if events or pygame.time.get_ticks() - last_draw_time >= interval:
+                    self.draw()
+                    self.hud.record_frame(draw_start - update_start, time.perf_counter() - draw_start)
+                    last_draw_time = pygame.time.get_ticks()
+                continue
+            
+            self.profiler.begin_frame()
+            section_start = self.profiler.start()
             running = self.handle_events()
+            self.profiler.stop('handle_events', section_start)
+            section_start = self.profiler.start()
+            update_start = time.perf_counter()
             self.update()
+            if self.replay_manager.playing:
+                self.update_replay_speed(update_start)
+            draw_start = time.perf_counter()
+            self.profiler.stop('update.total', section_start)
+            section_start = self.profiler.start()
             self.draw()
+            self.hud.record_frame(draw_start - update_start, time.perf_counter() - draw_start)
+            self.profiler.stop('draw.total', section_start)
+            self.profiler.end_frame()
+            last_draw_time = pygame.time.get_ticks()
             self.clock.tick(FPS)
+        
+        # 종료 시 프로파일 보고서 저장
+        if self.profiler.enabled and self.profiler.frames:
+            self.profiler.dump()
+        tracer.close()
+        self.replay_manager.close()
+        db_manager.shutdown()
             
         pygame.quit()
\ No newline at end of file
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+성능 HUD 모듈
+F3으로 켜고 끄는 오버레이 (FPS, 프레임 시간 그래프, update/draw 비율,
+공/블록/파티클/궤적 개수, 텍스트 캐시 적중률, 초당 DB/파일 쓰기 횟수)
+"""
+
+import pygame
+from collections import deque
+from time import perf_counter
+
+from constants import *
+from profiler import io_stats
+
+
+class PerformanceHUD:
+    def __init__(self, samples: int = HUD_SAMPLES):
+        """HUD 초기화 (꺼진 상태에서는 측정값을 기록하지 않음)"""
+        self.visible = False
+        self.frame_times = deque(maxlen=samples)  # 프레임 간격 (밀리초)
+        self.update_times = deque(maxlen=samples)
+        self.draw_times = deque(maxlen=samples)
+        self.last_frame = None
+        self.last_refresh = 0
+        self.lines = []  # 렌더링된 텍스트 줄 (HUD_REFRESH_INTERVAL마다 갱신)
+        self.font = pygame.font.Font(None, 18)
+        self.panel = pygame.Surface((HUD_WIDTH, HUD_HEIGHT), pygame.SRCALPHA)
+
+    def toggle(self):
+        """HUD 표시 전환 (다시 켤 때 이전 측정값 초기화)"""
+        self.visible = not self.visible
+        self.frame_times.clear()
+        self.update_times.clear()
+        self.draw_times.clear()
+        self.last_frame = None
+        self.last_refresh = 0
+
+    def record_frame(self, update_time: float, draw_time: float):
+        """프레임의 update/draw 소요 시간 기록 (초 단위)"""
+        if not self.visible:
+            return
+        now = perf_counter()
+        if self.last_frame is not None:
+            self.frame_times.append((now - self.last_frame) * 1000)
+        self.last_frame = now
+        self.update_times.append(update_time * 1000)
+        self.draw_times.append(draw_time * 1000)
+
+    def get_fps(self) -> float:
+        """최근 프레임 간격 기준 FPS"""
+        if not self.frame_times:
+            return 0.0
+        mean = sum(self.frame_times) / len(self.frame_times)
+        return 1000.0 / mean if mean > 0 else 0.0
+
+    def refresh_lines(self, game):
+        """표시할 텍스트 줄 다시 렌더링"""
+        frame_mean = sum(self.frame_times) / len(self.frame_times) if self.frame_times else 0.0
+        frame_max = max(self.frame_times) if self.frame_times else 0.0
+        update_mean = sum(self.update_times) / len(self.update_times) if self.update_times else 0.0
+        draw_mean = sum(self.draw_times) / len(self.draw_times) if self.draw_times else 0.0
+        work = update_mean + draw_mean
+        draw_share = draw_mean / work * 100 if work > 0 else 0.0
+
+        blocks = sum(1 for block in game.blocks if block.active)
+        trail_points = sum(len(ball.trail_points) for ball in game.balls)
+        writes = io_stats.get_recent()
+        cache = game.text_cache
+
+        texts = [
+            f"FPS {self.get_fps():.0f}  frame {frame_mean:.1f}ms (max {frame_max:.1f})",
+            f"update {update_mean:.2f}ms  draw {draw_mean:.2f}ms ({draw_share:.0f}% draw)",
+            f"balls {len(game.balls)}  blocks {blocks}  particles {len(game.particles)}  trail {trail_points}",
+            f"text cache {cache.get_hit_rate() * 100:.0f}% hit ({len(cache.surfaces)} cached)",
+            f"writes/s  db {writes.get('db', 0)}  file {writes.get('file', 0)}"
+        ]
+        self.lines = [self.font.render(text, True, WHITE) for text in texts]
+
+    def draw_sparkline(self, screen, rect):
+        """프레임 시간 그래프 (점선: 목표 프레임 시간)"""
+        pygame.draw.rect(screen, (60, 60, 70), rect, 1)
+        budget = 1000.0 / FPS
+        scale = max(budget * 2, max(self.frame_times) if self.frame_times else 0.0)
+        budget_y = rect.bottom - int(budget / scale * rect.height)
+        for x in range(rect.left, rect.right, 6):
+            pygame.draw.line(screen, GRAY, (x, budget_y), (min(x + 3, rect.right), budget_y))
+
+        if len(self.frame_times) < 2:
+            return
+        step = rect.width / (self.frame_times.maxlen - 1)
+        points = [
+            (rect.left + i * step, rect.bottom - min(rect.height, value / scale * rect.height))
+            for i, value in enumerate(self.frame_times)
+        ]
+        color = NEON_GREEN if max(self.frame_times) <= budget * 1.5 else ORANGE
+        pygame.draw.lines(screen, color, False, points)
+
+    def draw(self, screen, game):
+        """다른 모든 요소 위에 HUD 그리기"""
+        if not self.visible:
+            return
+        now = pygame.time.get_ticks()
+        if not self.lines or now - self.last_refresh >= HUD_REFRESH_INTERVAL:
+            self.refresh_lines(game)
+            self.last_refresh = now
+
+        self.panel.fill((0, 0, 0, 170))
+        screen.blit(self.panel, (HUD_MARGIN, HUD_MARGIN))
+        y = HUD_MARGIN + 6
+        for line in self.lines:
+            screen.blit(line, (HUD_MARGIN + 6, y))
+            y += line.get_height() + 2
+        graph_rect = pygame.Rect(HUD_MARGIN + 6, y + 4, HUD_WIDTH - 12, HUD_HEIGHT - (y - HUD_MARGIN) - 10)
+        self.draw_sparkline(screen, graph_rect)
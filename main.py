@@ -7,10 +7,13 @@ Python과 Pygame을 사용한 숫자 블록 브레이커 게임
 - 마우스 움직임: 발사 각도 조정
 - 마우스 클릭: 공 발사
 - R 키: 게임 재시작 (게임 오버 시)
+- F3 키: 성능 HUD 표시 전환
+- F9 키: 프로파일/메모리 보고서 저장, 트레이스 기록 (--profile, --memtrack, --trace 실행 시)
 """
 
 import pygame
 import os
+import sys
 from game_objects import Game
 from language import get_text
 
@@ -36,7 +39,28 @@ def main():
     except Exception as e:
         print(f"아이콘 로딩 실패: {e}")
     
-    game = Game()
+    # --profile: 서브시스템별 프레임 프로파일링 (F9 또는 종료 시 보고서 저장)
+    # --memtrack: tracemalloc 기반 프레임별 할당 추적 (F9 또는 종료 시 보고서 저장)
+    # --trace: Chrome/Perfetto trace-event JSON 기록 (trace.json)
+    game = Game(profile='--profile' in sys.argv, memtrack='--memtrack' in sys.argv,
+                trace='--trace' in sys.argv)
+    
+    # --replay <파일>: 저장된 리플레이 재생
+    if '--replay' in sys.argv and sys.argv.index('--replay') + 1 < len(sys.argv):
+        replay_data = game.replay_manager.load_replay(sys.argv[sys.argv.index('--replay') + 1])
+        if replay_data is not None:
+            game.start_replay(replay_data)
+            # --seek <라운드>: 지정 라운드부터 재생 (가장 가까운 키프레임에서 재시뮬레이션)
+            if '--seek' in sys.argv and sys.argv.index('--seek') + 1 < len(sys.argv):
+                game.seek_replay(int(sys.argv[sys.argv.index('--seek') + 1]))
+    
+    # --scenario <파일>: 저장된 스트레스 시나리오 상태에서 시작
+    if '--scenario' in sys.argv and sys.argv.index('--scenario') + 1 < len(sys.argv):
+        from scenario import Scenario
+        scenario = Scenario.load(sys.argv[sys.argv.index('--scenario') + 1])
+        if scenario is not None:
+            scenario.build(game)
+    
     game.run()
 
 if __name__ == "__main__":
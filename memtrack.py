@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+메모리 추적 모듈
+tracemalloc 기반 프레임별 할당 진단 모드
+- 프레임/서브시스템별 일시 할당 바이트 (구간 내 최대 사용량 - 시작 사용량)
+- 프레임별 GC 실행 횟수와 일시정지 시간
+- 줄 단위 상위 할당 위치, 세션 최대 RSS
+
+FrameProfiler와 같은 begin_frame/start/stop/end_frame 인터페이스를 제공하므로
+Game의 프로파일링 구간을 그대로 사용함 (pygame.Surface 픽셀 버퍼는 SDL이 할당하므로
+추적 대상이 아니며, Surface 객체 자체와 튜플/리스트 등 파이썬 할당만 집계됨)
+"""
+
+import gc
+import sys
+import json
+import datetime
+import tracemalloc
+from time import perf_counter
+from collections import deque
+from typing import Optional
+
+from constants import MEMTRACK_WINDOW, MEMTRACK_OUTPUT, MEMTRACK_SNAPSHOT_INTERVAL, MEMTRACK_TOP_SITES
+from profiler import summarize
+
+
+def get_peak_rss_bytes() -> Optional[int]:
+    """프로세스 최대 RSS (바이트, 지원하지 않는 플랫폼에서는 None)"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 바이트 단위
+        return peak if sys.platform == 'darwin' else peak * 1024
+    except ImportError:
+        pass
+
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+            _fields_ = [
+                ('cb', wintypes.DWORD),
+                ('PageFaultCount', wintypes.DWORD),
+                ('PeakWorkingSetSize', ctypes.c_size_t),
+                ('WorkingSetSize', ctypes.c_size_t),
+                ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+                ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+                ('PagefileUsage', ctypes.c_size_t),
+                ('PeakPagefileUsage', ctypes.c_size_t),
+            ]
+
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize
+    except (ImportError, AttributeError, OSError):
+        pass
+    return None
+
+
+class MemoryTracker:
+    def __init__(self, enabled: bool = False, window: int = MEMTRACK_WINDOW,
+                 snapshot_interval: int = MEMTRACK_SNAPSHOT_INTERVAL):
+        """메모리 추적기 초기화 (활성화 시 tracemalloc 시작)"""
+        self.enabled = enabled
+        self.window = window
+        self.snapshot_interval = snapshot_interval
+        self.frames = 0
+        self.samples = {}  # 서브시스템 이름 -> 프레임별 일시 할당 바이트
+        self.current = {}
+        self.stack = []  # 열린 구간: [시작 시점 사용량, 구간 내 최대 사용량]
+        self.frame_stats = {
+            'net_bytes': deque(maxlen=window),
+            'gc_collections': deque(maxlen=window),
+            'gc_pause_ms': deque(maxlen=window)
+        }
+        self.frame_start_bytes = 0
+        self.gc_collections = 0
+        self.gc_pause = 0.0
+        self.gc_started = 0.0
+        self.net_blocks_per_frame = deque(maxlen=window)
+        self.site_growth = {}  # "파일:줄" -> [증가 바이트, 증가 블록 수]
+        self.last_snapshot = None
+        self.peak_rss = None
+
+        if enabled:
+            self.start_tracing()
+
+    def start_tracing(self):
+        """tracemalloc과 GC 콜백 등록"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(1)
+        gc.callbacks.append(self.on_gc)
+        self.last_snapshot = self.take_snapshot()
+
+    def stop_tracing(self):
+        """tracemalloc과 GC 콜백 해제"""
+        if self.on_gc in gc.callbacks:
+            gc.callbacks.remove(self.on_gc)
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.enabled = False
+
+    def on_gc(self, phase, info):
+        """GC 실행 횟수와 일시정지 시간 집계"""
+        if phase == 'start':
+            self.gc_started = perf_counter()
+        else:
+            self.gc_collections += 1
+            self.gc_pause += perf_counter() - self.gc_started
+
+    def take_snapshot(self):
+        """추적기 자체 할당을 제외한 스냅샷"""
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def fold_peak(self):
+        """현재까지의 최대 사용량을 열린 구간에 반영하고 최대값 초기화"""
+        current, peak = tracemalloc.get_traced_memory()
+        for entry in self.stack:
+            if peak > entry[1]:
+                entry[1] = peak
+        tracemalloc.reset_peak()
+        return current
+
+    def begin_frame(self):
+        """프레임 추적 시작 (프레임을 가장 바깥 구간으로 취급)"""
+        if not self.enabled:
+            return
+        self.current = {}
+        self.stack = []
+        self.gc_collections = 0
+        self.gc_pause = 0.0
+        current = self.fold_peak()
+        self.frame_start_bytes = current
+        self.stack.append([current, current])
+
+    def start(self) -> int:
+        """구간 시작 (중첩 구간 지원)"""
+        if not self.enabled:
+            return 0
+        current = self.fold_peak()
+        self.stack.append([current, current])
+        return len(self.stack)
+
+    def stop(self, name: str, start: int):
+        """구간 종료: 구간 내 최대 사용량 - 시작 사용량을 일시 할당 바이트로 누적"""
+        if not self.enabled or not self.stack:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        start_bytes, section_peak = self.stack.pop()
+        for entry in self.stack:
+            if peak > entry[1]:
+                entry[1] = peak
+        allocated = max(section_peak, peak) - start_bytes
+        self.current[name] = self.current.get(name, 0) + allocated
+
+    def add(self, name: str, value: float):
+        """외부 측정값 누적"""
+        if not self.enabled:
+            return
+        self.current[name] = self.current.get(name, 0) + value
+
+    def end_frame(self):
+        """프레임 종료: 프레임/서브시스템 통계 기록, 주기적으로 스냅샷 비교"""
+        if not self.enabled or not self.stack:
+            return
+        current, peak = tracemalloc.get_traced_memory()
+        start_bytes, frame_peak = self.stack[0]
+        self.stack = []
+        self.current['frame'] = max(frame_peak, peak) - start_bytes
+
+        for name, value in self.current.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.window)
+            self.samples[name].append(value)
+        self.current = {}
+
+        self.frame_stats['net_bytes'].append(current - self.frame_start_bytes)
+        self.frame_stats['gc_collections'].append(self.gc_collections)
+        self.frame_stats['gc_pause_ms'].append(self.gc_pause * 1000)
+        self.frames += 1
+
+        if self.frames % self.snapshot_interval == 0:
+            self.sample_sites()
+            rss = get_peak_rss_bytes()
+            if rss is not None:
+                self.peak_rss = max(self.peak_rss or 0, rss)
+
+    def sample_sites(self):
+        """이전 스냅샷 대비 줄 단위 메모리 증가량 집계"""
+        snapshot = self.take_snapshot()
+        if self.last_snapshot is not None:
+            diffs = snapshot.compare_to(self.last_snapshot, 'lineno')
+            net_blocks = 0
+            for diff in diffs:
+                net_blocks += diff.count_diff
+                if diff.size_diff <= 0:
+                    continue
+                frame = diff.traceback[0]
+                key = f"{frame.filename}:{frame.lineno}"
+                growth = self.site_growth.setdefault(key, [0, 0])
+                growth[0] += diff.size_diff
+                growth[1] += max(0, diff.count_diff)
+            self.net_blocks_per_frame.append(net_blocks / self.snapshot_interval)
+        self.last_snapshot = snapshot
+
+    def get_report(self) -> dict:
+        """메모리 진단 보고서"""
+        top_live = []
+        if self.enabled and tracemalloc.is_tracing():
+            for stat in self.take_snapshot().statistics('lineno')[:MEMTRACK_TOP_SITES]:
+                frame = stat.traceback[0]
+                top_live.append({'site': f"{frame.filename}:{frame.lineno}", 'bytes': stat.size, 'blocks': stat.count})
+
+        top_growth = sorted(self.site_growth.items(), key=lambda item: item[1][0], reverse=True)[:MEMTRACK_TOP_SITES]
+        current, _ = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        rss = get_peak_rss_bytes()
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss or 0, rss)
+
+        return {
+            'generated_at': datetime.datetime.now().isoformat(),
+            'frames': self.frames,
+            'window': self.window,
+            'traced_bytes': current,
+            'peak_rss_bytes': self.peak_rss,
+            'per_frame': {
+                'allocated': summarize(list(self.samples.get('frame', [])), 1, 'bytes'),
+                'net': summarize(list(self.frame_stats['net_bytes']), 1, 'bytes'),
+                'net_blocks_sampled': summarize(list(self.net_blocks_per_frame), 1, 'blocks'),
+                'gc_collections': sum(self.frame_stats['gc_collections']),
+                'gc_pause': summarize(list(self.frame_stats['gc_pause_ms']), 1, 'ms')
+            },
+            'subsystems': {
+                name: summarize(list(values), 1, 'bytes')
+                for name, values in sorted(self.samples.items()) if name != 'frame'
+            },
+            'top_growth_sites': [
+                {'site': site, 'bytes': growth[0], 'blocks': growth[1]} for site, growth in top_growth
+            ],
+            'top_live_sites': top_live
+        }
+
+    def dump(self, path: str = MEMTRACK_OUTPUT) -> bool:
+        """보고서를 JSON 파일로 저장"""
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.get_report(), f, indent=2)
+            print(f"메모리 보고서 저장 완료: {path}")
+            return True
+        except (OSError, TypeError) as e:
+            print(f"메모리 보고서 저장 오류: {e}")
+            return False
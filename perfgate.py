@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+성능 회귀 검사 모듈
+벤치마크를 반복 실행해 커밋된 기준선(perf_baseline.json)과 비교하고,
+95% 신뢰구간 기준으로도 임계값 이상 느려진 시나리오가 있으면 실패(종료 코드 1)
+(마이크로 벤치마크는 노이즈가 커서 기본적으로 참고용으로만 표시)
+
+사용법:
+    python perfgate.py                       # 기준선과 비교
+    python perfgate.py --threshold 0.15      # 허용 증가율 지정 (기본 10%)
+    python perfgate.py --include-micro       # 마이크로 벤치마크도 판정에 포함
+    python perfgate.py --update-baseline     # 현재 결과를 기준선으로 저장
+"""
+
+import os
+import sys
+import json
+import math
+
+from benchmark import REPO_DIR, LAUNCH_DIR, run_benchmarks
+
+PERF_BASELINE = "perf_baseline.json"  # 저장소에 커밋되는 기준선 파일
+PERF_THRESHOLD = 0.10  # 허용되는 평균 소요 시간 증가율
+PERF_REPEAT = 10  # 신뢰구간 계산을 위한 반복 실행 횟수
+
+# 95% 양측 t 분포 임계값 (자유도 1~30, 그 이상은 정규분포 근사)
+T_CRITICAL_95 = [
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042
+]
+
+
+def confidence_interval(values):
+    """반복 측정값의 평균과 95% 신뢰구간 (mean, low, high)"""
+    if not values:
+        return 0.0, 0.0, 0.0
+    n = len(values)
+    mean = sum(values) / n
+    if n < 2:
+        return mean, mean, mean
+    variance = sum((value - mean) ** 2 for value in values) / (n - 1)
+    t = T_CRITICAL_95[n - 2] if n - 1 <= len(T_CRITICAL_95) else 1.96
+    margin = t * math.sqrt(variance / n)
+    return mean, mean - margin, mean + margin
+
+
+def collect_metrics(results):
+    """벤치마크 결과에서 검사 대상 지표 추출 (이름 -> 반복별 ms, 낮을수록 좋음)"""
+    metrics = {}
+    for name, data in results.get('micro', {}).items():
+        if data.get('runs_ms'):
+            metrics[f"micro.{name}"] = data['runs_ms']
+    for name, data in results.get('macro', {}).items():
+        if data.get('update_runs_ms'):
+            metrics[f"macro.{name}.update"] = data['update_runs_ms']
+        if data.get('draw_runs_ms'):
+            metrics[f"macro.{name}.draw"] = data['draw_runs_ms']
+    return metrics
+
+
+def compare(baseline, current, threshold=PERF_THRESHOLD, include_micro=False):
+    """지표별 비교 결과 목록과 회귀 여부 반환"""
+    base_metrics = collect_metrics(baseline)
+    current_metrics = collect_metrics(current)
+    rows = []
+    regressed = False
+
+    for name, values in current_metrics.items():
+        mean, low, high = confidence_interval(values)
+        gated = include_micro or not name.startswith('micro.')
+        row = {'name': name, 'mean_ms': mean, 'ci_ms': (low, high), 'status': 'new', 'gated': gated}
+        if name in base_metrics:
+            base_mean, base_low, base_high = confidence_interval(base_metrics[name])
+            change = (mean - base_mean) / base_mean if base_mean else 0.0
+            row.update({'baseline_ms': base_mean, 'baseline_ci_ms': (base_low, base_high), 'change': change})
+            # 신뢰구간의 유리한 쪽 경계끼리 비교해도 임계값을 넘을 때만 판정 (노이즈로 인한 오탐 방지)
+            if low > base_high * (1 + threshold):
+                row['status'] = 'regressed' if gated else 'slower'
+                regressed = regressed or gated
+            elif high < base_low * (1 - threshold):
+                row['status'] = 'improved'
+            else:
+                row['status'] = 'ok'
+        if name.endswith('.update') and mean > 0:
+            # 초당 update 틱 수 (신뢰구간 상한/하한이 뒤바뀜)
+            row['ticks_per_second'] = (1000.0 / mean, 1000.0 / high if high > 0 else 0.0, 1000.0 / low if low > 0 else 0.0)
+        rows.append(row)
+
+    for name in base_metrics:
+        if name not in current_metrics:
+            rows.append({'name': name, 'status': 'missing'})
+    return rows, regressed
+
+
+def print_report(rows, threshold):
+    """비교 결과 표 출력"""
+    print(f"\n성능 회귀 검사 (허용 증가율 {threshold * 100:.0f}%, 95% 신뢰구간)")
+    for row in rows:
+        if row['status'] == 'missing':
+            print(f"  [missing]   {row['name']}: 현재 결과에 없음")
+            continue
+        low, high = row['ci_ms']
+        line = f"  [{row['status']:<9}] {row['name']}: {row['mean_ms']:.4g}ms [{low:.4g}, {high:.4g}]"
+        if 'baseline_ms' in row:
+            line += f" / 기준선 {row['baseline_ms']:.4g}ms ({row['change'] * 100:+.1f}%)"
+        if not row['gated']:
+            line += " (참고용)"
+        if 'ticks_per_second' in row:
+            tps, tps_low, tps_high = row['ticks_per_second']
+            line += f" / {tps:.0f} ticks/s [{tps_low:.0f}, {tps_high:.0f}]"
+        print(line)
+
+
+def load_baseline(path):
+    """기준선 파일 로드 (없거나 손상되면 None)"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"기준선 로드 오류: {e}")
+        return None
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="SpinBall 성능 회귀 검사")
+    parser.add_argument('--baseline', default=os.path.join(REPO_DIR, PERF_BASELINE), help="기준선 JSON 경로")
+    parser.add_argument('--threshold', type=float, default=PERF_THRESHOLD, help="허용 평균 증가율 (0.10 = 10%%)")
+    parser.add_argument('--repeat', type=int, default=PERF_REPEAT, help="반복 실행 횟수")
+    parser.add_argument('--quick', action='store_true', help="측정량을 줄여 빠르게 실행")
+    parser.add_argument('--scenario', action='append', default=[], help="추가 매크로 시나리오 파일")
+    parser.add_argument('--include-micro', action='store_true', help="마이크로 벤치마크도 판정에 포함")
+    parser.add_argument('--update-baseline', action='store_true', help="현재 결과를 기준선으로 저장")
+    args = parser.parse_args()
+
+    baseline_path = os.path.join(LAUNCH_DIR, args.baseline)
+    scenario_paths = [os.path.join(LAUNCH_DIR, path) for path in args.scenario]
+    current = run_benchmarks(quick=args.quick, scenario_paths=scenario_paths, repeat=max(2, args.repeat))
+
+    if args.update_baseline:
+        try:
+            with open(baseline_path, 'w') as f:
+                json.dump(current, f, indent=2)
+            print(f"기준선 저장 완료: {baseline_path}")
+            return 0
+        except OSError as e:
+            print(f"기준선 저장 오류: {e}")
+            return 2
+
+    baseline = load_baseline(baseline_path)
+    if baseline is None:
+        print("기준선이 없습니다. --update-baseline으로 먼저 생성하세요.")
+        return 2
+    if baseline.get('meta', {}).get('platform') != current['meta']['platform']:
+        print("경고: 기준선과 실행 환경이 다릅니다. 결과 비교에 주의하세요.")
+    if baseline.get('meta', {}).get('quick') != current['meta']['quick']:
+        print("경고: 기준선과 측정량(--quick)이 다릅니다.")
+
+    rows, regressed = compare(baseline, current, args.threshold, args.include_micro)
+    print_report(rows, args.threshold)
+    if regressed:
+        print("\n성능 회귀가 감지되었습니다.")
+        return 1
+    print("\n성능 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
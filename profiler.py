@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+프레임 프로파일러 모듈
+Game.update / Game.draw 하위 단계별 소요 시간을 측정하고
+최근 프레임 기준 p50/p95/p99 백분위수를 JSON으로 내보냄
+(DB/파일 쓰기 횟수 집계용 io_stats 포함)
+"""
+
+import json
+import datetime
+import threading
+from collections import deque
+from time import perf_counter
+from typing import Dict, List
+
+from constants import PROFILER_WINDOW, PROFILER_OUTPUT, IO_STATS_WINDOW
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값 목록에서 백분위수 계산 (nearest-rank 방식)"""
+    if not sorted_values:
+        return 0.0
+    rank = int(round(pct / 100.0 * (len(sorted_values) - 1)))
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+
+def summarize(values: List[float], scale: float = 1000.0, unit: str = 'ms') -> Dict[str, float]:
+    """측정값 요약 통계 (기본: 초 단위 값을 밀리초로 변환)"""
+    ordered = sorted(values)
+    keys = ('mean', 'p50', 'p95', 'p99', 'max')
+    if not ordered:
+        return {'samples': 0, **{f"{key}_{unit}": 0.0 for key in keys}}
+    stats = {
+        'mean': sum(ordered) / len(ordered),
+        'p50': percentile(ordered, 50),
+        'p95': percentile(ordered, 95),
+        'p99': percentile(ordered, 99),
+        'max': ordered[-1]
+    }
+    return {'samples': len(ordered), **{f"{key}_{unit}": round(stats[key] * scale, 4) for key in keys}}
+
+
+class FrameProfiler:
+    def __init__(self, enabled: bool = False, window: int = PROFILER_WINDOW):
+        """프로파일러 초기화 (비활성화 상태에서는 측정 비용이 거의 없음)"""
+        self.enabled = enabled
+        self.window = window
+        self.samples = {}  # 서브시스템 이름 -> 최근 프레임 소요 시간 (초)
+        self.current = {}  # 현재 프레임에서 누적 중인 소요 시간
+        self.frame_start = 0.0
+        self.frames = 0
+
+    def begin_frame(self):
+        """프레임 측정 시작"""
+        if not self.enabled:
+            return
+        self.current = {}
+        self.frame_start = perf_counter()
+
+    def end_frame(self):
+        """현재 프레임의 서브시스템별 누적 시간을 롤링 윈도우에 반영"""
+        if not self.enabled:
+            return
+        self.current['frame'] = perf_counter() - self.frame_start
+        for name, elapsed in self.current.items():
+            if name not in self.samples:
+                self.samples[name] = deque(maxlen=self.window)
+            self.samples[name].append(elapsed)
+        self.current = {}
+        self.frames += 1
+
+    def start(self) -> float:
+        """구간 측정 시작 시각 반환"""
+        return perf_counter() if self.enabled else 0.0
+
+    def stop(self, name: str, start: float):
+        """구간 측정 종료 (같은 프레임에서 여러 번 호출되면 누적)"""
+        if not self.enabled:
+            return
+        self.current[name] = self.current.get(name, 0.0) + (perf_counter() - start)
+
+    def add(self, name: str, elapsed: float):
+        """외부에서 측정한 소요 시간 누적"""
+        if not self.enabled:
+            return
+        self.current[name] = self.current.get(name, 0.0) + elapsed
+
+    def reset(self):
+        """수집된 측정값 초기화"""
+        self.samples = {}
+        self.current = {}
+        self.frames = 0
+
+    def get_report(self) -> dict:
+        """서브시스템별 롤링 백분위수 보고서"""
+        return {
+            'generated_at': datetime.datetime.now().isoformat(),
+            'frames': self.frames,
+            'window': self.window,
+            'subsystems': {
+                name: summarize(list(values))
+                for name, values in sorted(self.samples.items())
+            }
+        }
+
+    def dump(self, path: str = PROFILER_OUTPUT) -> bool:
+        """보고서를 JSON 파일로 저장"""
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.get_report(), f, indent=2)
+            print(f"프로파일 보고서 저장 완료: {path}")
+            return True
+        except (OSError, TypeError) as e:
+            print(f"프로파일 보고서 저장 오류: {e}")
+            return False
+
+
+class IOStats:
+    def __init__(self, window: float = IO_STATS_WINDOW):
+        """DB/파일 쓰기 횟수 집계 (최근 window초 및 누적)"""
+        self.window = window
+        self.recent = deque()  # (기록 시각, 종류)
+        self.totals = {}
+        self.lock = threading.Lock()  # 리플레이 기록 스레드에서도 호출
+
+    def record(self, kind: str):
+        """쓰기 1회 기록 (kind: 'db' 또는 'file')"""
+        now = perf_counter()
+        with self.lock:
+            self.recent.append((now, kind))
+            self.totals[kind] = self.totals.get(kind, 0) + 1
+            self.prune(now)
+
+    def prune(self, now: float):
+        """집계 구간을 벗어난 기록 제거"""
+        while self.recent and now - self.recent[0][0] > self.window:
+            self.recent.popleft()
+
+    def get_recent(self) -> Dict[str, int]:
+        """최근 window초 동안의 종류별 쓰기 횟수"""
+        counts = {}
+        with self.lock:
+            self.prune(perf_counter())
+            for _, kind in self.recent:
+                counts[kind] = counts.get(kind, 0) + 1
+        return counts
+
+
+# 전역 쓰기 횟수 집계 인스턴스
+io_stats = IOStats()
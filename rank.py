@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+순위 서비스 모듈
+DB의 점수 구간별 게임 수(score_histogram)를 펜윅 트리로 메모리에 올려
+점수의 백분위와 순위를 O(log n)으로 근사하고, 정확한 순위는 요청 시 백그라운드에서 조회
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from constants import SCORE_HISTOGRAM_BUCKET
+from database import DatabaseManager, db_manager
+
+
+class ScoreHistogram:
+    def __init__(self, size: int = 1024):
+        """구간별 게임 수 누적합 트리 (구간 수가 넘치면 두 배로 늘림)"""
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.counts = [0] * size
+        self.total = 0
+
+    def grow(self, bucket: int):
+        """bucket이 들어갈 수 있게 트리 크기 늘리기 (다시 구성)"""
+        size = self.size
+        while bucket >= size:
+            size *= 2
+        counts = self.counts + [0] * (size - self.size)
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.counts = [0] * size
+        self.total = 0
+        for index, games in enumerate(counts):
+            if games:
+                self.add(index, games)
+
+    def add(self, bucket: int, games: int = 1):
+        """구간에 게임 수 더하기"""
+        if bucket >= self.size:
+            self.grow(bucket)
+        self.counts[bucket] += games
+        self.total += games
+        index = bucket + 1
+        while index <= self.size:
+            self.tree[index] += games
+            index += index & -index
+
+    def prefix(self, bucket: int) -> int:
+        """bucket보다 앞 구간들의 게임 수 합"""
+        bucket = min(bucket, self.size)
+        games = 0
+        while bucket > 0:
+            games += self.tree[bucket]
+            bucket -= bucket & -bucket
+        return games
+
+    def count(self, bucket: int) -> int:
+        """구간 하나의 게임 수"""
+        return self.counts[bucket] if bucket < self.size else 0
+
+
+class RankService:
+    def __init__(self, manager: DatabaseManager, bucket_size: int = SCORE_HISTOGRAM_BUCKET):
+        """순위 서비스 초기화 (점수 분포는 처음 조회할 때 읽고 이후 저장되는 점수로 갱신)"""
+        self.manager = manager
+        self.bucket_size = bucket_size
+        self.histogram = None
+        self.loaded_id = 0  # 분포를 읽을 때 이미 반영되어 있던 마지막 점수 id
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rank")
+        manager.score_listeners.append(self.on_scores_written)
+
+    def load(self) -> ScoreHistogram:
+        """점수 분포 반환 (없으면 DB에서 읽기, lock을 잡은 상태에서 호출)"""
+        if self.histogram is None:
+            self.histogram = ScoreHistogram()
+            buckets, self.loaded_id = self.manager.get_score_histogram()
+            for bucket, games in buckets:
+                self.histogram.add(bucket, games)
+        return self.histogram
+
+    def on_scores_written(self, rows):
+        """점수 저장 알림 처리 (rows가 None이면 분포를 DB에서 다시 읽음, 행의 마지막 값은 점수 id)"""
+        with self.lock:
+            if rows is None:
+                self.histogram = None
+                return
+            if self.histogram is None:
+                return
+            # 커밋 후 알림이 오기 전에 분포를 읽었으면 그 점수는 이미 분포에 들어 있으므로 건너뜀
+            for row in rows:
+                if row[-1] > self.loaded_id:
+                    self.histogram.add(row[1] // self.bucket_size)
+
+    def estimate(self, score: int) -> dict:
+        """점수의 근사 백분위와 순위 (구간 안에서는 균등 분포로 가정)"""
+        with self.lock:
+            histogram = self.load()
+            bucket = score // self.bucket_size
+            offset = (score - bucket * self.bucket_size) / self.bucket_size
+            in_bucket = histogram.count(bucket)
+            below = histogram.prefix(bucket) + in_bucket * offset
+            above = histogram.total - histogram.prefix(bucket + 1) + in_bucket * max(0.0, 1 - offset - 1 / self.bucket_size)
+            total = histogram.total
+        return {
+            'percentile': below * 100 / total if total else 0.0,
+            'rank': int(round(above)) + 1,
+            'total': total
+        }
+
+    def request_exact_rank(self, score: int) -> Future:
+        """정확한 순위를 백그라운드에서 조회 (Future 결과: 순위, 더 낮은 점수의 게임 수, 전체 게임 수)"""
+        return self.executor.submit(self.manager.get_score_rank, score)
+
+
+# 전역 순위 서비스 인스턴스
+rank_service = RankService(db_manager)
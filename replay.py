@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+리플레이 모듈
+입력만 기록하는 리플레이 (게임 시드, 모드, 설정, 라운드별 발사 기록)
+게임 시간과 난수가 시드로 결정되므로 재생 시 같은 입력을 다시 넣어 게임을 재시뮬레이션함
+
+발사 기록: [라운드, 발사 틱, 발사 x, 발사 각도, [상점 구매 아이템 인덱스...]]
+(발사 틱은 조준 중에도 게임 시간이 흐르는 시간 제한 모드와 콤보 판정을 재현하기 위해 필요)
+
+저장 형식은 바이너리 컨테이너(.sbr, replay_format.py)이며 이전 JSON 리플레이도 읽을 수 있음
+발사 기록은 게임 중 백그라운드 스레드가 기록 중 파일(.part)에 블록 단위로 이어 쓰고,
+게임 종료 시에는 푸터 기록과 파일 이름 변경만 요청하므로 메인 스레드가 멈추지 않음
+REPLAY_KEYFRAME_INTERVAL 라운드마다 발사 직전 게임 상태를 키프레임으로 함께 기록해
+재생 중 원하는 라운드로 이동할 때 가장 가까운 이전 키프레임부터 재시뮬레이션함
+
+저장된 리플레이는 DB의 replays 테이블(카탈로그)에 점수/라운드/모드/시간/플레이어와 함께 등록되어
+파일을 열지 않고 목록을 조회할 수 있음
+
+사용법:
+    python replay.py replays/replay_1700000000.sbr              # 헤드리스 재시뮬레이션 및 점수 검증
+    python replay.py --convert replays/replay_1700000000.json   # JSON 리플레이를 .sbr로 변환
+    python replay.py --reindex                                  # replays 폴더로 카탈로그 다시 만들기
+    python replay.py --top survival                             # 모드별 점수 상위 20개 리플레이
+"""
+
+import os
+import sys
+import queue
+import atexit
+import threading
+from concurrent.futures import Future
+
+from constants import (SIM_STEP_MS, REPLAY_DIR, REPLAY_MAX_TICKS, REPLAY_EXTENSION, REPLAY_COMPRESS,
+                       REPLAY_STREAM_BLOCK_RECORDS, REPLAY_KEYFRAME_INTERVAL, REPLAY_SPEEDS, REPLAY_CATALOG_LIMIT,
+                       GAME_MODE_CLASSIC, GAME_MODE_TIME_ATTACK, GAME_MODE_SURVIVAL, GAME_MODE_PUZZLE)
+from replay_format import (ReplayFormatError, ReplayWriter, write_replay, read_replay, read_summary,
+                           import_json_replay)
+from database import db_manager
+from profiler import io_stats
+from tracer import traced
+
+# 발사 기록 필드 인덱스
+SHOT_ROUND = 0
+SHOT_TICK = 1
+SHOT_X = 2
+SHOT_ANGLE = 3
+SHOT_PURCHASES = 4
+
+# 명령줄 모드 이름
+MODE_NAMES = {
+    'classic': GAME_MODE_CLASSIC,
+    'time_attack': GAME_MODE_TIME_ATTACK,
+    'survival': GAME_MODE_SURVIVAL,
+    'puzzle': GAME_MODE_PUZZLE
+}
+
+
+def catalog_entry(path, summary):
+    """리플레이 요약을 카탈로그 항목으로 변환"""
+    return {
+        'path': path,
+        'player_name': summary.get('player_name'),
+        'mode': summary['mode'],
+        'score': summary['score'],
+        'round': summary['round'],
+        'shot_count': summary['shot_count'],
+        'duration_ms': summary.get('duration_ms') or 0,
+        'seed': summary['seed'],
+        'file_size': summary['file_size'],
+        'index_offset': summary['index_offset'],
+        'created': summary['created']
+    }
+
+
+def rebuild_catalog(directory=REPLAY_DIR):
+    """리플레이 폴더를 훑어 카탈로그 다시 만들기 (헤더/푸터만 읽음, 등록 수 반환)"""
+    paths = []
+    count = 0
+    try:
+        entries = [entry.path for entry in os.scandir(directory)
+                   if entry.is_file() and entry.name.endswith(REPLAY_EXTENSION)]
+    except OSError as e:
+        print(f"리플레이 폴더 읽기 오류: {e}")
+        return 0
+    for path in sorted(entries):
+        try:
+            summary = read_summary(path)
+        except (OSError, ValueError, ReplayFormatError) as e:
+            print(f"리플레이 요약 읽기 오류: {path} ({e})")
+            continue
+        if not summary['complete']:
+            continue
+        paths.append(path)
+        if db_manager.save_replay_entry(catalog_entry(path, summary)):
+            count += 1
+    db_manager.remove_missing_replays(paths)
+    return count
+
+
+class ReplayStreamWriter:
+    def __init__(self):
+        """백그라운드 리플레이 기록 스레드 (명령 큐로 메인 스레드와 통신, 첫 명령 시 시작)"""
+        self.queue = queue.Queue()
+        self.thread = None
+        # 아래 필드는 기록 스레드에서만 사용
+        self.file = None
+        self.writer = None
+        self.part_path = os.path.join(REPLAY_DIR, f"recording_{os.getpid()}_{id(self):x}{REPLAY_EXTENSION}.part")
+
+    def submit(self, command, *args):
+        """기록 스레드에 명령 전달 (즉시 반환)"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="replay-writer", daemon=True)
+            self.thread.start()
+            atexit.register(self.close)
+        self.queue.put((command, args))
+
+    def run(self):
+        """명령 처리 루프"""
+        while True:
+            command, args = self.queue.get()
+            try:
+                if command == 'open':
+                    self.open(*args)
+                elif command == 'shot':
+                    self.append(*args)
+                elif command == 'keyframe':
+                    self.add_keyframe(*args)
+                elif command == 'finalize':
+                    self.finalize(*args)
+                elif command == 'discard':
+                    self.discard()
+                elif command == 'stop':
+                    self.discard()
+                    db_manager.close()
+                    return
+            except Exception as e:
+                # 어떤 오류에도 기록 스레드가 죽지 않도록 현재 기록만 버리고 다음 명령 처리
+                print(f"리플레이 기록 오류: {e}")
+                self.discard()
+            finally:
+                self.queue.task_done()
+
+    def open(self, seed, mode, settings):
+        """기록 중 파일(.part) 생성 및 헤더 기록"""
+        self.discard()
+        os.makedirs(REPLAY_DIR, exist_ok=True)
+        self.file = open(self.part_path, 'wb')
+        self.writer = ReplayWriter(self.file, seed, mode, settings, REPLAY_COMPRESS, REPLAY_STREAM_BLOCK_RECORDS)
+
+    def append(self, shot):
+        """발사 기록 추가 (블록이 채워지면 디스크로 내보냄)"""
+        if self.writer is None:
+            return
+        self.writer.append(shot)
+        if not self.writer.pending:
+            self.file.flush()
+
+    def add_keyframe(self, round_num, state):
+        """키프레임 블록 기록 및 디스크로 내보냄"""
+        if self.writer is None:
+            return
+        self.writer.add_keyframe(round_num, state)
+        self.file.flush()
+
+    @traced('io')
+    def finalize(self, path, score, round_num, result, saved):
+        """남은 블록과 인덱스/푸터를 기록하고 최종 파일 이름으로 변경한 뒤 카탈로그에 등록
+        (saved Future에 최종 파일이 생겼는지 여부를 알림)"""
+        created = False
+        try:
+            if self.writer is None:
+                return
+            self.writer.finalize(score, round_num, result)
+            self.file.close()
+            self.file = None
+            self.writer = None
+            os.replace(self.part_path, path)
+            created = True
+            io_stats.record('file')
+        finally:
+            # 실패해도 항상 알려야 점수 제출이 멈추지 않음
+            saved.set_result(created)
+
+        # 카탈로그 등록이 실패해도 리플레이 파일은 그대로 둠 (--reindex로 다시 등록 가능)
+        try:
+            db_manager.save_replay_entry(catalog_entry(path, read_summary(path)))
+        except Exception as e:
+            print(f"리플레이 카탈로그 등록 오류: {e}")
+
+    def discard(self):
+        """완료되지 않은 기록 파일 삭제"""
+        self.writer = None
+        if self.file is None:
+            return
+        try:
+            self.file.close()
+            os.remove(self.part_path)
+        except OSError:
+            pass
+        self.file = None
+
+    def close(self):
+        """대기 중인 명령을 모두 처리하고 스레드 종료 (완료되지 않은 기록은 삭제)"""
+        if self.thread is None or not self.thread.is_alive():
+            return
+        self.queue.put(('stop', ()))
+        self.thread.join()
+
+
+class ReplayManager:
+    def __init__(self, record=True):
+        self.record = record  # False면 기록하지 않음 (헤드리스 검증 워커 등)
+        self.recording = False
+        self.playing = False
+        self.seed = None
+        self.mode = None
+        self.shot_count = 0
+        self.pending_purchases = []  # 다음 발사 전에 구매한 아이템
+        self.current_shot_index = 0
+        self.replay_data = None  # 재생 중인 리플레이
+        self.speed_index = 0  # REPLAY_SPEEDS 인덱스
+        self.save_future = None  # 마지막 저장 요청의 완료 여부 (결과: 최종 파일 생성 여부)
+        self.stream = ReplayStreamWriter()
+
+    def start_recording(self, seed, mode):
+        """리플레이 기록 시작 (저장되지 않은 이전 기록은 버림)"""
+        self.stop_recording()
+        if not self.record:
+            return
+        self.recording = True
+        self.seed = seed
+        self.mode = mode
+        self.shot_count = 0
+        self.pending_purchases = []
+        self.stream.submit('open', seed, mode, {'sim_step_ms': SIM_STEP_MS})
+
+    def stop_recording(self):
+        """리플레이 기록 중지 (저장하지 않고 기록 파일 삭제)"""
+        if self.recording:
+            self.stream.submit('discard')
+        self.recording = False
+
+    def record_purchase(self, item_index):
+        """상점 구매 기록 (다음 발사에 포함)"""
+        if self.recording:
+            self.pending_purchases.append(item_index)
+
+    def record_shot(self, round_num, tick, launch_x, launch_angle):
+        """발사 기록 (기록 스레드로 전달)"""
+        if not self.recording:
+            return
+        self.stream.submit('shot', [round_num, tick, launch_x, launch_angle, self.pending_purchases])
+        self.pending_purchases = []
+        self.shot_count += 1
+
+    def wants_keyframe(self, round_num):
+        """이번 라운드 발사 직전에 키프레임을 기록할지 여부"""
+        return self.recording and round_num % REPLAY_KEYFRAME_INTERVAL == 0
+
+    def record_keyframe(self, round_num, state):
+        """키프레임 기록 (다음 발사 직전 게임 상태, 직렬화는 기록 스레드에서 수행)"""
+        if self.recording:
+            self.stream.submit('keyframe', round_num, state)
+
+    @traced('io')
+    def save_replay(self, filename, score, round_num, player_name=None, duration_ms=0):
+        """리플레이 저장 (발사 기록은 이미 기록 중이므로 마무리만 요청하고 즉시 반환, 저장 경로 반환)
+        (파일은 기록 스레드에서 최종 이름으로 바뀌므로 완료 여부는 save_future로 확인)"""
+        if not self.recording or not self.shot_count:
+            self.stop_recording()
+            return None
+        path = os.path.join(REPLAY_DIR, filename + REPLAY_EXTENSION)
+        result = {'player_name': player_name or None, 'duration_ms': int(duration_ms)}
+        self.save_future = Future()
+        self.stream.submit('finalize', path, score, round_num, result, self.save_future)
+        self.recording = False
+        return path
+
+    def close(self):
+        """기록 스레드 종료 (대기 중인 저장 완료까지 대기)"""
+        self.stream.close()
+
+    def load_replay(self, path):
+        """리플레이 파일 로드 (.json은 JSON 입력 기록으로 가져옴, 읽을 수 없으면 None)"""
+        try:
+            if path.endswith('.json'):
+                return import_json_replay(path)
+            return read_replay(path)
+        except ReplayFormatError as e:
+            print(f"지원하지 않는 리플레이 형식입니다: {path} ({e})")
+        except (OSError, ValueError) as e:
+            print(f"리플레이 로드 오류: {e}")
+        return None
+
+    def start_playback(self, replay_data):
+        """리플레이 재생 시작"""
+        self.stop_recording()
+        self.playing = True
+        self.replay_data = replay_data
+        self.current_shot_index = 0
+        self.speed_index = 0
+
+    def stop_playback(self):
+        """리플레이 재생 중지"""
+        self.playing = False
+
+    def get_next_shot(self):
+        """다음 발사 기록 (없으면 None)"""
+        if not self.playing or self.current_shot_index >= len(self.replay_data['shots']):
+            return None
+        return self.replay_data['shots'][self.current_shot_index]
+
+    def advance_shot(self):
+        """다음 발사 기록으로 이동"""
+        self.current_shot_index += 1
+
+    def cycle_speed(self):
+        """재생 배속 전환 (1× → 4× → 16× → 최대)"""
+        self.speed_index = (self.speed_index + 1) % len(REPLAY_SPEEDS)
+
+    def get_speed(self):
+        """현재 재생 배속 (0: 최대 배속)"""
+        return REPLAY_SPEEDS[self.speed_index]
+
+    def find_keyframe(self, round_num):
+        """지정 라운드 이하에서 가장 가까운 키프레임 (없으면 None)"""
+        best = None
+        for keyframe in self.replay_data.get('keyframes', []):
+            if keyframe['round'] <= round_num and (best is None or keyframe['round'] > best['round']):
+                best = keyframe
+        return best
+
+
+def simulate_replay(game, replay_data, max_ticks=REPLAY_MAX_TICKS):
+    """리플레이를 헤드리스로 재시뮬레이션 (그리기 없이 update만 실행)"""
+    game.start_replay(replay_data)
+    ticks = 0
+    while game.replay_manager.playing and ticks < max_ticks:
+        game.update()
+        ticks += 1
+    game.replay_manager.stop_playback()
+    return {
+        'score': game.score,
+        'round': game.round_num,
+        'ticks': ticks,
+        'verified': game.score == replay_data.get('score') and game.round_num == replay_data.get('round')
+    }
+
+
+def main():
+    from time import perf_counter
+
+    # pygame 임포트 전에 헤드리스 드라이버 설정
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    from game_objects import Game
+
+    if len(sys.argv) < 2:
+        print("사용법: python replay.py [--convert] <리플레이 파일> | --reindex | --top [모드]")
+        return 2
+
+    if sys.argv[1] == '--reindex':
+        print(f"리플레이 카탈로그 등록: {rebuild_catalog()}개")
+        return 0
+
+    if sys.argv[1] == '--top':
+        mode = MODE_NAMES.get(sys.argv[2].lower()) if len(sys.argv) > 2 else None
+        for rank, (path, player, mode_id, score, round_reached, duration_ms, date) in enumerate(
+                db_manager.get_top_replays(REPLAY_CATALOG_LIMIT, mode), 1):
+            print(f"{rank:3d}. {score:>8,}점  라운드 {round_reached:<4d} {duration_ms / 1000:7.1f}초  "
+                  f"{player or '-':<10} {date}  {path}")
+        return 0
+
+    game = Game()
+    replay_data = game.replay_manager.load_replay(sys.argv[-1])
+    if replay_data is None:
+        return 2
+
+    if '--convert' in sys.argv:
+        path = os.path.splitext(sys.argv[-1])[0] + REPLAY_EXTENSION
+        try:
+            write_replay(path, replay_data, REPLAY_COMPRESS)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"리플레이 변환 오류: {e}")
+            return 1
+        print(f"리플레이 변환 완료: {path} ({os.path.getsize(path)}바이트)")
+        return 0
+
+    start = perf_counter()
+    result = simulate_replay(game, replay_data)
+    elapsed = perf_counter() - start
+    print(f"재시뮬레이션: 점수 {result['score']} (기록 {replay_data.get('score')}), "
+          f"라운드 {result['round']} (기록 {replay_data.get('round')})")
+    print(f"{result['ticks']}틱, {elapsed:.2f}초 ({result['round'] / elapsed if elapsed else 0:.0f} 라운드/초)")
+    print("검증 성공" if result['verified'] else "검증 실패: 기록된 결과와 다릅니다")
+    return 0 if result['verified'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
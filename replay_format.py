@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+바이너리 리플레이 컨테이너 모듈 (.sbr)
+
+파일 구조 (모든 정수는 리틀 엔디언):
+    헤더    : 매직(SBRP), 형식 버전, 플래그, 시드, 모드, 게임 틱 간격, 생성 시각, 메타데이터 길이
+              + 메타데이터 JSON (설정 등 확장 필드)
+    블록들  : 블록 헤더(종류, 페이로드 길이, 기록 수, CRC32) + 페이로드 (플래그에 따라 zlib 압축)
+              - 발사 블록: 고정 길이 발사 기록 묶음
+              - 키프레임 블록: 발사 직전 게임 상태 JSON (기록 수 자리에 해당 발사 인덱스)
+              - 결과 블록: 게임 종료 시 정보 JSON (플레이어 이름, 게임 시간), 인덱스 직전에 기록
+    인덱스  : 블록별 (종류, 파일 오프셋, 라운드, 기록 수)
+    푸터    : 최종 점수, 최종 라운드, 전체 발사 수, 인덱스 오프셋, 매직(SBRE)
+
+헤더와 푸터만 읽으면 결과를 확인할 수 있어 많은 리플레이를 빠르게 훑을 수 있고,
+기록은 블록 단위로 이어 쓰고 읽음. 푸터가 없는 파일(기록 중 종료)은 블록을 순차적으로 복구함.
+버전 1 파일(키프레임 없음, 블록 종류 필드 없음)도 읽을 수 있음.
+"""
+
+import json
+import zlib
+import struct
+import time
+
+from constants import SHOP_ITEMS, REPLAY_FORMAT_VERSION, REPLAY_BLOCK_RECORDS
+
+MAGIC = b"SBRP"
+FOOTER_MAGIC = b"SBRE"
+BINARY_VERSION = 2
+
+FLAG_ZLIB = 0x1  # 블록 페이로드 zlib 압축
+
+# 블록 종류
+BLOCK_SHOTS = 0
+BLOCK_KEYFRAME = 1
+BLOCK_RESULT = 2
+
+HEADER = struct.Struct("<4sHHQBddI")      # 매직, 버전, 플래그, 시드, 모드, 틱 간격, 생성 시각, 메타 길이
+BLOCK_HEADER = struct.Struct("<BIII")     # 종류, 페이로드 길이, 기록 수, 압축 전 CRC32
+INDEX_ENTRY = struct.Struct("<BQII")      # 종류, 블록 오프셋, 라운드, 기록 수
+BLOCK_HEADER_V1 = struct.Struct("<III")   # 버전 1: 종류 없이 발사 블록만 있음
+INDEX_ENTRY_V1 = struct.Struct("<QII")
+FOOTER = struct.Struct("<qIIQ4s")         # 점수, 라운드, 발사 수, 인덱스 오프셋, 매직
+
+# 발사 기록: 라운드, 틱, 발사 x, 발사 각도, 상점 아이템별 구매 수
+PURCHASE_SLOTS = len(SHOP_ITEMS)
+SHOT_RECORD = struct.Struct("<IIdd" + "B" * PURCHASE_SLOTS)
+
+
+class ReplayFormatError(Exception):
+    """리플레이 파일 형식 오류"""
+
+
+def pack_shot(shot) -> bytes:
+    """발사 기록 [라운드, 틱, x, 각도, [구매 인덱스...]]를 고정 길이 바이트로 변환"""
+    counts = [0] * PURCHASE_SLOTS
+    for index in shot[4]:
+        counts[index] = min(255, counts[index] + 1)
+    return SHOT_RECORD.pack(shot[0], shot[1], shot[2], shot[3], *counts)
+
+
+def unpack_shots(payload: bytes, count: int) -> list:
+    """고정 길이 바이트 묶음을 발사 기록 목록으로 변환"""
+    shots = []
+    for values in SHOT_RECORD.iter_unpack(payload[:count * SHOT_RECORD.size]):
+        purchases = [index for index in range(PURCHASE_SLOTS) for _ in range(values[4 + index])]
+        shots.append([values[0], values[1], values[2], values[3], purchases])
+    return shots
+
+
+class ReplayWriter:
+    def __init__(self, file, seed: int, mode: int, settings: dict,
+                 compress: bool = True, block_records: int = REPLAY_BLOCK_RECORDS):
+        """바이너리 리플레이 기록 시작 (헤더 기록)"""
+        self.file = file
+        self.flags = FLAG_ZLIB if compress else 0
+        self.block_records = block_records
+        self.pending = []  # 아직 블록으로 쓰지 않은 발사 기록
+        self.index = []
+        self.shot_count = 0
+        meta = json.dumps({'settings': settings}, separators=(',', ':')).encode()
+        self.file.write(HEADER.pack(MAGIC, BINARY_VERSION, self.flags, seed & 0xFFFFFFFFFFFFFFFF, mode,
+                                    settings.get('sim_step_ms', 0.0), time.time(), len(meta)))
+        self.file.write(meta)
+
+    def append(self, shot):
+        """발사 기록 추가 (블록이 가득 차면 파일에 기록)"""
+        self.pending.append(shot)
+        self.shot_count += 1
+        if len(self.pending) >= self.block_records:
+            self.flush_block()
+
+    def flush_block(self):
+        """대기 중인 기록을 블록 하나로 기록"""
+        if not self.pending:
+            return
+        raw = b"".join(pack_shot(shot) for shot in self.pending)
+        self.write_block(BLOCK_SHOTS, raw, self.pending[0][0], len(self.pending))
+        self.pending = []
+
+    def add_keyframe(self, round_num: int, state: dict):
+        """다음 발사 직전의 게임 상태를 키프레임 블록으로 기록"""
+        self.flush_block()
+        raw = json.dumps({'round': round_num, 'state': state}, separators=(',', ':')).encode()
+        self.write_block(BLOCK_KEYFRAME, raw, round_num, self.shot_count)
+
+    def write_block(self, kind: int, raw: bytes, round_num: int, count: int):
+        """블록 헤더와 페이로드 기록 및 인덱스 추가"""
+        payload = zlib.compress(raw) if self.flags & FLAG_ZLIB else raw
+        self.index.append((kind, self.file.tell(), round_num, count))
+        self.file.write(BLOCK_HEADER.pack(kind, len(payload), count, zlib.crc32(raw)))
+        self.file.write(payload)
+
+    def finalize(self, score: int, round_num: int, result: dict = None):
+        """남은 블록, 결과 블록, 인덱스, 푸터 기록 (인덱스 오프셋 반환)"""
+        self.flush_block()
+        if result:
+            raw = json.dumps(result, separators=(',', ':')).encode()
+            self.write_block(BLOCK_RESULT, raw, round_num, 0)
+        index_offset = self.file.tell()
+        for entry in self.index:
+            self.file.write(INDEX_ENTRY.pack(*entry))
+        self.file.write(FOOTER.pack(score, round_num, self.shot_count, index_offset, FOOTER_MAGIC))
+        return index_offset
+
+
+def read_header(file) -> dict:
+    """헤더와 메타데이터 읽기"""
+    data = file.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ReplayFormatError("헤더가 손상되었습니다")
+    magic, version, flags, seed, mode, sim_step_ms, created, meta_len = HEADER.unpack(data)
+    if magic != MAGIC:
+        raise ReplayFormatError("리플레이 파일이 아닙니다")
+    if version not in (1, BINARY_VERSION):
+        raise ReplayFormatError(f"지원하지 않는 바이너리 버전입니다: {version}")
+    meta = json.loads(file.read(meta_len).decode() or "{}")
+    return {
+        'version': version, 'flags': flags, 'seed': seed, 'mode': mode, 'created': created,
+        'settings': meta.get('settings', {'sim_step_ms': sim_step_ms}),
+        'body_offset': HEADER.size + meta_len
+    }
+
+
+def read_footer(file, header: dict):
+    """푸터와 블록 인덱스 읽기 (푸터가 없으면 None)"""
+    file.seek(0, 2)
+    size = file.tell()
+    if size < HEADER.size + FOOTER.size:
+        return None
+    file.seek(size - FOOTER.size)
+    score, round_num, shot_count, index_offset, magic = FOOTER.unpack(file.read(FOOTER.size))
+    if magic != FOOTER_MAGIC or index_offset > size - FOOTER.size:
+        return None
+    file.seek(index_offset)
+    entry = INDEX_ENTRY if header['version'] >= 2 else INDEX_ENTRY_V1
+    entries = (size - FOOTER.size - index_offset) // entry.size
+    index = [entry.unpack(file.read(entry.size)) for _ in range(entries)]
+    if header['version'] < 2:
+        index = [(BLOCK_SHOTS,) + values for values in index]
+    return {'score': score, 'round': round_num, 'shot_count': shot_count, 'index': index,
+            'index_offset': index_offset, 'file_size': size}
+
+
+def read_block(file, header: dict):
+    """현재 위치의 블록 하나를 (종류, 기록 수, 내용)으로 읽기 (파일 끝이나 불완전한 블록이면 None)
+    내용은 발사 블록이면 발사 기록 목록, 키프레임 블록이면 {'round', 'shot', 'state'}"""
+    if header['version'] >= 2:
+        data = file.read(BLOCK_HEADER.size)
+        if len(data) < BLOCK_HEADER.size:
+            return None
+        kind, length, count, crc = BLOCK_HEADER.unpack(data)
+    else:
+        data = file.read(BLOCK_HEADER_V1.size)
+        if len(data) < BLOCK_HEADER_V1.size:
+            return None
+        kind = BLOCK_SHOTS
+        length, count, crc = BLOCK_HEADER_V1.unpack(data)
+    payload = file.read(length)
+    if len(payload) < length:
+        return None
+    try:
+        raw = zlib.decompress(payload) if header['flags'] & FLAG_ZLIB else payload
+    except zlib.error:
+        return None
+    if zlib.crc32(raw) != crc:
+        return None
+    if kind == BLOCK_KEYFRAME:
+        keyframe = json.loads(raw.decode())
+        keyframe['shot'] = count
+        return kind, count, keyframe
+    if kind == BLOCK_RESULT:
+        return kind, count, json.loads(raw.decode())
+    if len(raw) < count * SHOT_RECORD.size:
+        return None
+    return kind, count, unpack_shots(raw, count)
+
+
+def iter_blocks(file, header: dict, footer=None):
+    """블록을 순서대로 읽기 (푸터가 없으면 온전한 블록까지만 복구)"""
+    if footer is not None:
+        for _, offset, _, _ in footer['index']:
+            file.seek(offset)
+            block = read_block(file, header)
+            if block is None:
+                raise ReplayFormatError("블록이 손상되었습니다")
+            yield block
+        return
+
+    file.seek(header['body_offset'])
+    while True:
+        block = read_block(file, header)
+        if block is None:
+            return
+        yield block
+
+
+def iter_shots(file, header: dict, footer=None):
+    """발사 기록을 블록 단위로 순차 읽기"""
+    for kind, _, shots in iter_blocks(file, header, footer):
+        if kind == BLOCK_SHOTS:
+            yield from shots
+
+
+def read_summary(path: str) -> dict:
+    """헤더, 푸터, 결과 블록만 읽어 리플레이 요약 반환 (발사/키프레임 블록은 읽지 않음)"""
+    with open(path, 'rb') as f:
+        header = read_header(f)
+        footer = read_footer(f, header)
+        summary = {key: header[key] for key in ('seed', 'mode', 'created', 'settings')}
+        if footer is not None:
+            summary.update({key: footer[key] for key in ('score', 'round', 'shot_count', 'index_offset', 'file_size')})
+            summary['keyframes'] = sum(1 for entry in footer['index'] if entry[0] == BLOCK_KEYFRAME)
+            for kind, offset, _, _ in footer['index']:
+                if kind == BLOCK_RESULT:
+                    f.seek(offset)
+                    block = read_block(f, header)
+                    if block is not None:
+                        summary.update(block[2])
+    summary['complete'] = footer is not None
+    return summary
+
+
+def read_replay(path: str) -> dict:
+    """바이너리 리플레이를 리플레이 데이터 딕셔너리로 읽기"""
+    with open(path, 'rb') as f:
+        header = read_header(f)
+        footer = read_footer(f, header)
+        shots = []
+        keyframes = []
+        result = {}
+        for kind, _, data in iter_blocks(f, header, footer):
+            if kind == BLOCK_SHOTS:
+                shots.extend(data)
+            elif kind == BLOCK_KEYFRAME:
+                keyframes.append(data)
+            elif kind == BLOCK_RESULT:
+                result = data
+    return {
+        'version': REPLAY_FORMAT_VERSION,
+        'seed': header['seed'],
+        'mode': header['mode'],
+        'settings': header['settings'],
+        'score': footer['score'] if footer else None,
+        'round': footer['round'] if footer else None,
+        'shots': shots,
+        'keyframes': keyframes,
+        'player_name': result.get('player_name'),
+        'duration_ms': result.get('duration_ms'),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(header['created'])),
+        'complete': footer is not None
+    }
+
+
+def write_replay(path: str, replay_data: dict, compress: bool = True):
+    """리플레이 데이터 딕셔너리를 바이너리 파일로 저장"""
+    with open(path, 'wb') as f:
+        writer = ReplayWriter(f, replay_data['seed'], replay_data['mode'],
+                              replay_data.get('settings', {}), compress)
+        keyframes = {keyframe['shot']: keyframe for keyframe in replay_data.get('keyframes', [])}
+        for index, shot in enumerate(replay_data['shots']):
+            if index in keyframes:
+                writer.add_keyframe(keyframes[index]['round'], keyframes[index]['state'])
+            writer.append(shot)
+        result = {key: replay_data[key] for key in ('player_name', 'duration_ms') if replay_data.get(key) is not None}
+        writer.finalize(replay_data.get('score') or 0, replay_data.get('round') or 0, result)
+
+
+def import_json_replay(path: str) -> dict:
+    """JSON 입력 기록 리플레이(버전 2) 읽기"""
+    with open(path, 'r') as f:
+        replay_data = json.load(f)
+    if replay_data.get('version') != REPLAY_FORMAT_VERSION or 'shots' not in replay_data:
+        # 버전 1 JSON(벽시계 액션 로그)은 시드가 없어 재시뮬레이션할 수 없음
+        raise ReplayFormatError("시드와 발사 기록이 없는 JSON 리플레이는 가져올 수 없습니다")
+    return replay_data
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+점수 가져오기/내보내기 도구
+여러 기기의 리더보드를 합치기 위해 scores 테이블을 CSV/JSONL로 스트리밍 내보내고,
+다른 기기에서 내보낸 파일을 대량으로 가져옴 ((플레이어, 점수, 날짜)가 같은 행은 건너뜀)
+검증 결과(verified/rejected)도 함께 옮기며, 리플레이 파일은 옮기지 않으므로 검증 대기 점수는 검증 상태 없이 가져옴
+
+사용법:
+    python score_sync.py export scores.csv          # CSV로 내보내기 (.jsonl이면 JSON Lines)
+    python score_sync.py import a.csv b.jsonl       # 파일들을 현재 DB로 가져오기
+"""
+
+import sys
+
+from database import db_manager
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="SpinBall 점수 대량 가져오기/내보내기")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    export_parser = subparsers.add_parser('export', help="점수를 CSV/JSONL로 내보내기")
+    export_parser.add_argument('path', help="출력 파일 (.csv 또는 .jsonl)")
+    import_parser = subparsers.add_parser('import', help="CSV/JSONL 점수 파일 가져오기")
+    import_parser.add_argument('paths', nargs='+', help="가져올 파일들")
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        db_manager.export_scores(args.path)
+        return 0
+
+    stats = db_manager.import_scores(args.paths)
+    if stats['error'] is not None:
+        print(f"가져오기 실패: 변경 사항을 모두 되돌렸습니다. ({stats['seconds']:.1f}초)")
+        return 1
+    print(f"가져오기 완료: 읽음 {stats['read']}, 추가 {stats['imported']}, "
+          f"중복 {stats['duplicates']}, 잘못된 행 {stats['invalid']} ({stats['seconds']:.1f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
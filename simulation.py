@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+시뮬레이션 모듈
+게임플레이 코드가 읽는 결정적 게임 시간과 게임별 난수 스트림
+- 게임 시간은 Game.update 1회당 SIM_STEP_MS씩 진행 (벽시계와 무관하므로
+  헤드리스에서는 실시간보다 빠르게 실행 가능)
+- 게임플레이 난수(블록 생성, 투명 블록 통과)와 시각 효과 난수(파티클)를 분리해
+  파티클 연출이 바뀌어도 같은 시드와 입력의 게임 결과는 동일함
+"""
+
+import random
+
+from constants import SIM_STEP_MS, VISUAL_RNG_SALT
+
+
+class SimulationClock:
+    def __init__(self, step_ms: float = SIM_STEP_MS):
+        """게임 시간 초기화 (밀리세컨드 단위)"""
+        self.step_ms = step_ms
+        self.steps = 0
+
+    def advance(self):
+        """게임 시간 1틱 진행"""
+        self.steps += 1
+
+    def get_ticks(self) -> float:
+        """게임 시작 후 경과한 게임 시간 (밀리세컨드)"""
+        return self.steps * self.step_ms
+
+    def get_seconds(self) -> float:
+        """게임 시작 후 경과한 게임 시간 (초)"""
+        return self.steps * self.step_ms / 1000.0
+
+    def reset(self):
+        """게임 시간 초기화"""
+        self.steps = 0
+
+
+def new_game_seed() -> int:
+    """새 게임 시드 생성"""
+    return random.getrandbits(32)
+
+
+def create_rng_streams(seed: int):
+    """시드에서 (게임플레이 난수, 시각 효과 난수) 생성"""
+    return random.Random(seed), random.Random(seed ^ VISUAL_RNG_SALT)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+시나리오 모듈 테스트
+
+사용법:
+    python -m unittest test_scenario
+"""
+
+import os
+
+# pygame 임포트 전에 헤드리스 드라이버 설정
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import sys
+import shutil
+import tempfile
+import unittest
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+
+
+class ScenarioBuildTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """임시 작업 디렉터리에서 게임 생성 (게임 모듈은 임포트 시 현재 폴더에 DB를 만듦)"""
+        cls.launch_dir = os.getcwd()
+        cls.work_dir = tempfile.mkdtemp(prefix="spinball_test_")
+        os.chdir(cls.work_dir)
+        from game_objects import Game
+        cls.game = Game()
+
+    @classmethod
+    def tearDownClass(cls):
+        """리플레이 기록 스레드와 DB 연결을 닫고 임시 작업 디렉터리 삭제"""
+        from database import db_manager
+        cls.game.replay_manager.close()
+        db_manager.shutdown()
+        os.chdir(cls.launch_dir)
+        shutil.rmtree(cls.work_dir, ignore_errors=True)
+
+    def test_build_leaves_no_recording(self):
+        """직접 구성한 보드는 시드로 재현할 수 없으므로 리플레이를 기록하지 않음"""
+        from scenario import Scenario
+        game = Scenario.for_round(50, seed=1234).build(self.game)
+        self.assertFalse(game.replay_manager.recording)
+        self.assertIsNone(game.save_game_replay(force=True))
+
+    def test_build_applies_state(self):
+        """시나리오의 라운드/공 개수/점수가 게임에 적용됨"""
+        from scenario import Scenario
+        scenario = Scenario.for_round(20, seed=7)
+        game = scenario.build(self.game)
+        self.assertEqual(game.round_num, scenario.round_num)
+        self.assertEqual(game.ball_count, scenario.ball_count)
+        self.assertEqual(game.score, scenario.score)
+
+
+if __name__ == "__main__":
+    unittest.main()
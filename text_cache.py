@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+텍스트 캐시 모듈
+같은 폰트/문자열/색상으로 반복 렌더링되는 텍스트 서피스를 재사용하는 LRU 캐시
+"""
+
+from collections import OrderedDict
+
+from constants import TEXT_CACHE_SIZE
+
+
+class TextCache:
+    def __init__(self, max_size: int = TEXT_CACHE_SIZE):
+        """텍스트 서피스 캐시 초기화"""
+        self.max_size = max_size
+        self.surfaces = OrderedDict()  # (폰트, 문자열, 색상) -> 서피스
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, font, text: str, color):
+        """캐시된 서피스 반환 (없으면 None)"""
+        key = (font, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.surfaces.move_to_end(key)
+        self.hits += 1
+        return surface
+
+    def put(self, font, text: str, color, surface):
+        """서피스 저장 (가장 오래 사용되지 않은 항목부터 제거)"""
+        self.surfaces[(font, text, tuple(color))] = surface
+        if len(self.surfaces) > self.max_size:
+            self.surfaces.popitem(last=False)
+
+    def get_hit_rate(self) -> float:
+        """캐시 적중률 (0.0 ~ 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """캐시와 통계 초기화"""
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
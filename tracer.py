@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+트레이스 모듈
+Chrome/Perfetto trace-event JSON 내보내기 (python main.py --trace)
+
+FrameProfiler와 같은 begin_frame/start/stop/end_frame 인터페이스로 Game의 측정 구간을
+스팬 이벤트로 기록하고, @traced 데코레이터로 DB 호출과 JSON 저장도 기록함.
+한 프레임에서 여러 번 측정되는 구간(공별 물리/충돌)은 이벤트 수가 공 개수에 비례하므로
+프레임당 하나의 합계 스팬으로 묶어 별도 트랙(aggregated)에 표시함.
+이벤트는 제한된 크기의 버퍼에 모았다가 파일에 이어 쓰며, 쓸 때마다 배열을 닫아 두므로
+세션 도중에도 파일이 항상 유효한 JSON임 (chrome://tracing 또는 ui.perfetto.dev에서 열기)
+"""
+
+import os
+import json
+import threading
+import functools
+from time import perf_counter
+
+from constants import TRACE_OUTPUT, TRACE_BUFFER_EVENTS
+
+TRACE_TAIL = b"\n]\n"
+MAIN_TID = 1
+AGGREGATE_TID = 2
+
+
+class TraceWriter:
+    def __init__(self, buffer_size: int = TRACE_BUFFER_EVENTS):
+        """트레이스 기록기 초기화 (open 전까지 비활성화)"""
+        self.enabled = False
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.file = None
+        self.path = None
+        self.end_pos = 0  # 닫는 괄호 직전 위치 (다음 이벤트를 이어 쓸 위치)
+        self.events_written = 0
+        self.frames = 0
+        self.frame_start = 0.0
+        self.current = {}  # 이번 프레임 구간: 이름 -> [첫 시작, 마지막 종료, 누적 시간, 호출 수]
+        self.origin = perf_counter()
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+
+    def open(self, path: str = TRACE_OUTPUT) -> bool:
+        """트레이스 파일 생성 및 기록 시작"""
+        try:
+            self.file = open(path, 'wb')
+            self.file.write(b"[")
+            self.end_pos = self.file.tell()
+            self.file.write(TRACE_TAIL)
+            self.file.flush()
+        except OSError as e:
+            print(f"트레이스 파일 생성 오류: {e}")
+            self.file = None
+            return False
+        self.path = path
+        self.enabled = True
+        self.origin = perf_counter()
+        self.emit({'name': 'process_name', 'ph': 'M', 'pid': self.pid, 'tid': 0, 'args': {'name': 'SpinBall'}})
+        self.emit({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': MAIN_TID, 'args': {'name': 'main'}})
+        self.emit({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': AGGREGATE_TID,
+                   'args': {'name': 'aggregated (per frame)'}})
+        return True
+
+    def emit(self, event: dict):
+        """이벤트를 버퍼에 추가 (가득 차면 파일로 내보냄)"""
+        with self.lock:
+            self.buffer.append(event)
+            full = len(self.buffer) >= self.buffer_size
+        if full:
+            self.flush()
+
+    def span(self, name: str, category: str, start: float, end: float, args: dict = None, tid: int = None):
+        """완료된 구간 이벤트 기록 (perf_counter 시각, 초 단위)"""
+        if tid is None:
+            tid = MAIN_TID if threading.current_thread() is threading.main_thread() else threading.get_ident()
+        event = {
+            'name': name, 'cat': category, 'ph': 'X', 'pid': self.pid, 'tid': tid,
+            'ts': round((start - self.origin) * 1e6, 3), 'dur': round((end - start) * 1e6, 3)
+        }
+        if args:
+            event['args'] = args
+        self.emit(event)
+
+    def flush(self):
+        """버퍼의 이벤트를 파일에 이어 쓰고 배열을 다시 닫음"""
+        with self.lock:
+            events, self.buffer = self.buffer, []
+            if self.file is None or not events:
+                return
+            try:
+                self.file.seek(self.end_pos)
+                chunk = ",\n".join(json.dumps(event, separators=(',', ':')) for event in events)
+                self.file.write((",\n" if self.events_written else "\n").encode() + chunk.encode())
+                self.end_pos = self.file.tell()
+                self.file.write(TRACE_TAIL)
+                self.file.flush()
+                self.events_written += len(events)
+            except (OSError, TypeError) as e:
+                print(f"트레이스 기록 오류: {e}")
+
+    def close(self):
+        """남은 이벤트를 기록하고 파일 닫기"""
+        self.flush()
+        self.enabled = False
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+            self.file = None
+
+    # FrameProfiler 호환 인터페이스
+    def begin_frame(self):
+        """프레임 구간 시작"""
+        if self.enabled:
+            self.current = {}
+            self.frame_start = perf_counter()
+
+    def end_frame(self):
+        """프레임과 하위 구간 기록 (반복 구간은 합계 트랙에 나란히 배치)"""
+        if not self.enabled:
+            return
+        self.span('frame', 'frame', self.frame_start, perf_counter(), {'frame': self.frames})
+        cursor = None
+        for name, (first, last, total, calls) in sorted(self.current.items(), key=lambda item: item[1][0]):
+            category = name.split('.')[0]
+            if calls == 1:
+                self.span(name, category, first, last)
+                continue
+            cursor = first if cursor is None else max(cursor, first)
+            self.span(name, category, cursor, cursor + total,
+                      {'calls': calls, 'wall_ms': round((last - first) * 1000, 3)}, AGGREGATE_TID)
+            cursor += total
+        self.current = {}
+        self.frames += 1
+
+    def start(self) -> float:
+        """구간 시작 시각 반환"""
+        return perf_counter() if self.enabled else 0.0
+
+    def stop(self, name: str, start: float):
+        """구간 종료 (프레임 종료 시 기록, 이름의 첫 부분을 카테고리로 사용)"""
+        if not self.enabled:
+            return
+        self.add_section(name, start, perf_counter())
+
+    def add(self, name: str, elapsed: float):
+        """외부에서 측정한 소요 시간을 현재 시각에서 끝나는 구간으로 기록"""
+        if not self.enabled:
+            return
+        end = perf_counter()
+        self.add_section(name, end - elapsed, end)
+
+    def add_section(self, name: str, start: float, end: float):
+        """이번 프레임 구간 누적"""
+        section = self.current.get(name)
+        if section is None:
+            self.current[name] = [start, end, end - start, 1]
+        else:
+            section[1] = end
+            section[2] += end - start
+            section[3] += 1
+
+    def dump(self, path: str = None) -> bool:
+        """버퍼를 파일에 기록 (F9 또는 종료 시)"""
+        if self.file is None:
+            return False
+        self.flush()
+        print(f"트레이스 기록 완료: {self.path} ({self.events_written}개 이벤트)")
+        return True
+
+
+# 전역 트레이스 기록기 (DB/파일 저장 함수에서 사용)
+tracer = TraceWriter()
+
+
+def traced(category: str):
+    """함수 호출을 트레이스 구간으로 기록하는 데코레이터 (비활성화 시 비용 거의 없음)"""
+    def decorator(func):
+        name = func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.span(name, category, start, perf_counter())
+        return wrapper
+    return decorator
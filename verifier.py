@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+점수 검증 모듈
+제출된 점수(scores 테이블의 검증 대기 행)의 리플레이를 헤드리스로 재시뮬레이션해
+기록된 점수/라운드와 같으면 verified, 다르거나 리플레이를 읽을 수 없으면 rejected로 표시
+
+워커 프로세스는 시작 시 Game을 한 번만 만들고 계속 재사용하며(워커 풀 유지),
+--watch로 실행하면 같은 풀로 새 제출을 주기적으로 검증함
+
+사용법:
+    python verifier.py                  # 검증 대기 점수를 모두 검증
+    python verifier.py --workers 4      # 워커 프로세스 수 지정 (기본: CPU 수)
+    python verifier.py --watch          # 새 제출을 계속 검증
+"""
+
+import os
+
+# pygame 임포트 전에 헤드리스 드라이버 설정 (워커 프로세스에도 상속됨)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from database import db_manager
+
+VERIFY_POLL_INTERVAL = 5.0  # --watch 모드의 검증 대기 조회 간격 (초)
+VERIFY_BATCH_SIZE = 256  # 한 번에 가져와 검증하는 제출 수
+
+STATUS_VERIFIED = 'verified'
+STATUS_REJECTED = 'rejected'
+
+# 워커 프로세스 전용 게임 인스턴스 (init_worker에서 생성)
+worker_game = None
+
+
+def init_worker():
+    """워커 프로세스 초기화 (게임 인스턴스를 한 번만 생성, 리플레이 기록은 하지 않음)"""
+    global worker_game
+    from game_objects import Game
+    worker_game = Game(record_replays=False)
+
+
+def warm_up():
+    """워커 시작 확인용 빈 작업"""
+    return os.getpid()
+
+
+def verify_submission(submission):
+    """제출 하나 검증 (워커 프로세스에서 실행)"""
+    from replay import simulate_replay
+
+    score_id, claimed_score, claimed_round, replay_path = submission
+    cpu_start = time.process_time()
+    result = {'id': score_id, 'status': STATUS_REJECTED, 'reason': None, 'rounds': 0, 'ticks': 0, 'cpu': 0.0}
+
+    replay_data = None
+    if replay_path and os.path.exists(replay_path):
+        replay_data = worker_game.replay_manager.load_replay(replay_path)
+    if replay_data is None:
+        result['reason'] = "리플레이 없음"
+    elif not replay_data.get('complete', True):
+        result['reason'] = "완료되지 않은 리플레이"
+    else:
+        simulated = simulate_replay(worker_game, replay_data)
+        result['rounds'] = simulated['round']
+        result['ticks'] = simulated['ticks']
+        if simulated['score'] == claimed_score and simulated['round'] == claimed_round:
+            result['status'] = STATUS_VERIFIED
+        else:
+            result['reason'] = f"재시뮬레이션 결과 {simulated['score']}점/{simulated['round']}라운드"
+
+    result['cpu'] = time.process_time() - cpu_start
+    return result
+
+
+class VerificationService:
+    def __init__(self, workers: int = None):
+        """검증 워커 풀 시작 (모든 워커가 게임 인스턴스를 만들 때까지 대기)"""
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker)
+        for future in [self.executor.submit(warm_up) for _ in range(self.workers)]:
+            future.result()
+
+    def verify(self, submissions) -> dict:
+        """제출 목록을 병렬 검증하고 결과를 DB에 일괄 저장 (처리량 지표 반환)"""
+        start = time.perf_counter()
+        futures = [self.executor.submit(verify_submission, submission) for submission in submissions]
+        results = []
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result['reason']:
+                print(f"검증 실패: 점수 #{result['id']} ({result['reason']})")
+        db_manager.set_verification_results([(result['status'], result['id']) for result in results])
+        elapsed = time.perf_counter() - start
+
+        rounds = sum(result['rounds'] for result in results)
+        cpu = sum(result['cpu'] for result in results)
+        return {
+            'replays': len(results),
+            'verified': sum(1 for result in results if result['status'] == STATUS_VERIFIED),
+            'rejected': sum(1 for result in results if result['status'] == STATUS_REJECTED),
+            'wall_s': elapsed,
+            'replays_per_s': len(results) / elapsed if elapsed > 0 else 0.0,
+            'rounds': rounds,
+            'cpu_ms_per_round': cpu * 1000 / rounds if rounds else 0.0,
+            'ticks': sum(result['ticks'] for result in results)
+        }
+
+    def verify_pending(self, limit: int = VERIFY_BATCH_SIZE):
+        """검증 대기 점수 검증 (없으면 None)"""
+        submissions = db_manager.get_pending_verifications(limit)
+        if not submissions:
+            return None
+        return self.verify(submissions)
+
+    def close(self):
+        """워커 풀 종료"""
+        self.executor.shutdown()
+
+
+def print_metrics(metrics: dict, workers: int):
+    """검증 결과와 처리량 출력"""
+    print(f"검증 {metrics['replays']}개: 통과 {metrics['verified']}, 거부 {metrics['rejected']} "
+          f"({workers}개 워커, {metrics['wall_s']:.2f}초)")
+    print(f"처리량 {metrics['replays_per_s']:.1f} 리플레이/초, "
+          f"라운드당 CPU {metrics['cpu_ms_per_round']:.2f}ms ({metrics['rounds']}라운드, {metrics['ticks']}틱)")
+
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(description="SpinBall 제출 점수 리플레이 검증")
+    parser.add_argument('--workers', type=int, default=None, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--watch', action='store_true', help="새 제출을 계속 검증")
+    parser.add_argument('--interval', type=float, default=VERIFY_POLL_INTERVAL, help="--watch 조회 간격 (초)")
+    args = parser.parse_args()
+
+    service = VerificationService(args.workers)
+    try:
+        while True:
+            metrics = service.verify_pending()
+            if metrics is not None:
+                print_metrics(metrics, service.workers)
+                continue
+            if not args.watch:
+                print("검증 대기 점수가 없습니다.")
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())